@@ -10,31 +10,206 @@ PROTOCOLE INNER-LIP : Landmarks 13-14 (centres des lèvres, pas les coins)
 import cv2
 import mediapipe as mp
 import numpy as np
-import whisper
-import json
+import ctranslate2
+from faster_whisper import WhisperModel
+import orjson
+import os
 import sys
+import shutil
+import threading
+import queue
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import math
 import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from mediapipe.tasks import python as mp_python
 from mediapipe.tasks.python import vision as mp_vision
 
+# Numba optionnel : compilation JIT du chemin chaud, sinon repli Python pur
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Cache de modèles inter-instances (même processus) : clé -> modèle chargé
+_MODEL_CACHE: Dict[Tuple, object] = {}
+
+
+@njit(cache=True)
+def _mouth_ratio(upper_y, lower_y, max_distance):
+    """
+    Ouverture verticale normalisée (PROTOCOLE INNER-LIP)
+    
+    Returns:
+        (ratio 0.0-1.0, nouveau maximum observé)
+    """
+    d = abs(upper_y - lower_y)
+    m = d if d > max_distance else max_distance
+    if m > 0:
+        return min(d / m, 1.0), m
+    return 0.0, m
+
+
+# Encodage protobuf d'un NormalizedLandmark FaceMesh (x, y, z renseignés) :
+# tag 0x0A + longueur 15, puis 3 x (tag 0x0D/0x15/0x1D + float32 little-endian)
+_LANDMARK_WIRE_DTYPE = np.dtype([
+    ("tag", "u1"), ("length", "u1"),
+    ("tag_x", "u1"), ("x", "<f4"),
+    ("tag_y", "u1"), ("y", "<f4"),
+    ("tag_z", "u1"), ("z", "<f4"),
+])
+
+
+def _landmarks_to_array(landmark_list) -> np.ndarray:
+    """
+    Copie en bloc d'une NormalizedLandmarkList vers un ndarray float32 (N, 3).
+    
+    Chemin rapide : sérialisation C++ (SerializeToString) puis lecture
+    structurée NumPy des octets, sans itération Python par landmark.
+    Repli sur np.fromiter si l'encodage ne correspond pas (champs
+    visibility/presence présents, etc.).
+    """
+    landmarks = landmark_list.landmark
+    n_landmarks = len(landmarks)
+    serialize = getattr(landmark_list, "SerializeToString", None)
+    if serialize is not None:
+        raw = serialize()
+        if len(raw) == n_landmarks * _LANDMARK_WIRE_DTYPE.itemsize:
+            rec = np.frombuffer(raw, dtype=_LANDMARK_WIRE_DTYPE)
+            if ((rec["tag"] == 0x0A) & (rec["length"] == 15) & (rec["tag_x"] == 0x0D)
+                    & (rec["tag_y"] == 0x15) & (rec["tag_z"] == 0x1D)).all():
+                out = np.empty((n_landmarks, 3), dtype=np.float32)
+                out[:, 0] = rec["x"]
+                out[:, 1] = rec["y"]
+                out[:, 2] = rec["z"]
+                return out
+    return np.fromiter(
+        (c for lm in landmarks for c in (lm.x, lm.y, lm.z)),
+        dtype=np.float32,
+        count=n_landmarks * 3
+    ).reshape(-1, 3)
+
+
+class _LandmarkTrack:
+    """
+    Spool disque SoA des landmarks d'un acteur : points float32 et numéros de
+    frame ajoutés en binaire brut au fil du scan (RAM constante), puis
+    recopiés par blocs dans le sidecar .npz (data[T, N_points, N_canaux] + frames[T]).
+    """
+    
+    COPY_CHUNK = 1 << 20
+    
+    def __init__(self, directory: Path, name: str):
+        self.data_path = directory / f"{name}.f32"
+        self.frames_path = directory / f"{name}_frames.i32"
+        self._data_fp = open(self.data_path, "wb")
+        self._frames_fp = open(self.frames_path, "wb")
+        self.point_shape: Optional[Tuple[int, ...]] = None
+        self.size = 0
+    
+    def append(self, frame_number: int, points: np.ndarray):
+        points = np.ascontiguousarray(points, dtype=np.float32)
+        if self.point_shape is None:
+            # Forme fixée par le premier échantillon (468 ou 478 points avec refine_landmarks)
+            self.point_shape = points.shape
+        elif points.shape != self.point_shape:
+            raise ValueError(f"Forme de landmarks incohérente : {points.shape} (attendu {self.point_shape})")
+        self._data_fp.write(points.tobytes())
+        self._frames_fp.write(np.int32(frame_number).tobytes())
+        self.size += 1
+    
+    def close(self):
+        self._data_fp.close()
+        self._frames_fp.close()
+    
+    def write_npz(self, archive: zipfile.ZipFile, key: str):
+        """Ajoute <key>.npy et <key>_frames.npy à l'archive sans charger le spool en RAM"""
+        self.close()
+        members = (
+            (key, self.data_path, np.float32, (self.size,) + (self.point_shape or ())),
+            (f"{key}_frames", self.frames_path, np.int32, (self.size,)),
+        )
+        for name, path, dtype, shape in members:
+            header = {"descr": np.lib.format.dtype_to_descr(np.dtype(dtype)), "fortran_order": False, "shape": shape}
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as out, open(path, "rb") as src:
+                np.lib.format.write_array_header_1_0(out, header)
+                shutil.copyfileobj(src, out, self.COPY_CHUNK)
+
+
+class _NDJSONSpool:
+    """
+    Spool disque des records par flux (un fichier NDJSON par flux) : les
+    frames sont écrites au fil du scan au lieu de s'accumuler en RAM, puis
+    recopiées ligne à ligne dans mission_RAW.json.
+    """
+    
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._files = {}
+        self.counts: Dict[str, int] = {}
+    
+    def write(self, stream: str, record: Dict):
+        fp = self._files.get(stream)
+        if fp is None:
+            fp = self._files[stream] = open(self.directory / f"{stream}.ndjson", "wb")
+            self.counts[stream] = 0
+        fp.write(orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
+        self.counts[stream] += 1
+    
+    def close(self):
+        for fp in self._files.values():
+            fp.close()
+        self._files.clear()
+    
+    def copy_array(self, stream: str, out):
+        """Écrit le flux dans out sous forme de tableau JSON (sans re-parsing)"""
+        out.write(b"[")
+        if self.counts.get(stream):
+            separator = b"\n"
+            with open(self.directory / f"{stream}.ndjson", "rb") as fp:
+                for line in fp:
+                    out.write(separator)
+                    out.write(line.rstrip(b"\n"))
+                    separator = b",\n"
+            out.write(b"\n")
+        out.write(b"]")
+    
+    def cleanup(self):
+        self.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
 
 class EXODNAScanner:
     """
     Scanner DNA universel pour extraction de données brutes (mission_RAW.json)
     Utilise MediaPipe Tasks PoseLandmarker (multi-pose), FaceMesh (Inner-Lip),
-    OpenCV Optical Flow, Whisper
+    OpenCV Optical Flow (Lucas-Kanade creux), Whisper
     """
     
     # Landmarks MediaPipe FaceMesh (PROTOCOLE INNER-LIP)
     UPPER_LIP_CENTER_ID = 13  # Centre lèvre supérieure (Inner Lip)
     LOWER_LIP_CENTER_ID = 14  # Centre lèvre inférieure (Inner Lip)
     
-    def __init__(self, drive_root: str, video_path: Optional[str] = None):
+    # Optical Flow creux (Lucas-Kanade sur image réduite)
+    FLOW_SCALE = 0.5              # Facteur de réduction avant suivi
+    FLOW_MAX_CORNERS = 400        # ~400 vecteurs par frame (comme l'ancien échantillonnage)
+    FLOW_MIN_POINTS = 50          # En dessous, re-détection immédiate
+    FLOW_REDETECT_INTERVAL = 30   # Re-détection périodique des points
+    
+    # Entrée MediaPipe réduite (coordonnées normalisées : indépendantes de l'échelle)
+    INFERENCE_MAX_SIDE = 640      # 640x360 pour du 16:9, borne sûre pour FaceMesh
+    
+    def __init__(self, drive_root: str, video_path: Optional[str] = None, flow_stride: int = 3,
+                 output_path: Optional[str] = None):
         """
         Initialise le scanner DNA
         
@@ -46,6 +221,10 @@ class EXODNAScanner:
         Args:
             drive_root: Racine du système de fichiers (ancre unique)
             video_path: Chemin vers la vidéo source (optionnel, si None scanne INPUT_DIR)
+            flow_stride: Optical Flow calculé 1 frame sur N (défaut 3 : ~10 FPS à 30 FPS)
+            output_path: JSON de sortie (défaut DATA_DIR/mission_RAW.json) ; le sidecar
+                         <nom>_landmarks.npz et le spool <nom>.spool en dérivent, ce qui
+                         permet plusieurs scanners simultanés (un fichier par vidéo)
         """
         # CONSTANTES DE CHEMINS (pathlib pour compatibilité Linux)
         self.drive_root = Path(drive_root)
@@ -70,7 +249,9 @@ class EXODNAScanner:
             print(f"[INFO] Vidéo détectée automatiquement : {self.video_path.name}")
         
         # Chemin de sortie standardisé (SCHEMA UNIVERSEL)
-        self.output_path = self.DATA_DIR / "mission_RAW.json"
+        self.output_path = Path(output_path) if output_path else self.DATA_DIR / "mission_RAW.json"
+        # Sidecar binaire SoA (landmarks bruts face/pose par acteur)
+        self.landmarks_path = self.output_path.with_name(f"{self.output_path.stem}_landmarks.npz")
         
         # Initialisation MediaPipe (FaceMesh classique + PoseLandmarker Tasks)
         self.mp_face_mesh = mp.solutions.face_mesh
@@ -90,24 +271,64 @@ class EXODNAScanner:
         self.pose_model_path = self._ensure_pose_model()
         self.pose_landmarker = self._create_pose_landmarker()
         
+        # Pool d'inférence : Pose et FaceMesh tournent en parallèle (GIL relâché en C++)
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        
         # Initialisation Whisper (LOCAL - ZÉRO COÛT)
-        print("[INFO] Chargement du modele Whisper (local, gratuit)...")
-        self.whisper_model = whisper.load_model("base")  # base, small, medium, large
-        print("[OK] Whisper charge")
+        # faster-whisper (CTranslate2) : INT8 + FP16 sur GPU (Colab T4), INT8 sur CPU
+        self.whisper_device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        compute_type = "int8_float16" if self.whisper_device == "cuda" else "int8"
+        whisper_key = ("whisper", "base", self.whisper_device, compute_type)
+        if whisper_key in _MODEL_CACHE:
+            print("[INFO] Modele Whisper deja charge (cache processus)")
+        else:
+            print(f"[INFO] Chargement du modele Whisper (local, gratuit) sur {self.whisper_device} ({compute_type})...")
+            _MODEL_CACHE[whisper_key] = WhisperModel(
+                "base",  # base, small, medium, large
+                device=self.whisper_device,
+                compute_type=compute_type
+            )
+            print("[OK] Whisper charge")
+        self.whisper_model = _MODEL_CACHE[whisper_key]
         
         # Variables de tracking
-        self.session_id = f"EXO_SESSION_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
+        # Horloge murale lue une seule fois par session (les frames utilisent le temps vidéo)
+        session_start = datetime.now(timezone.utc)
+        self.session_id = f"EXO_SESSION_{session_start.strftime('%Y%m%d_%H%M%S')}"
+        self.session_start_iso = session_start.isoformat()
         self.frame_number = 0
         # LEGION DYNAMIQUE : métriques simples (pas un tracking inter-frame complet)
         self.max_actors_detected = 0
         self.prev_gray = None
+        self.prev_points = None
+        self.frames_since_detect = 0
+        # Décimation temporelle de l'Optical Flow (résultat réutilisé entre deux calculs)
+        self.flow_stride = max(1, int(flow_stride))
+        self._last_flow: Optional[Dict] = None
+        # Tampons d'image réutilisés d'une frame à l'autre (cvtColor/resize dst=)
+        self._gray_buf: Optional[np.ndarray] = None
+        self._flow_bufs: List[np.ndarray] = []
+        self._flow_idx = 0
+        self._small_buf: Optional[np.ndarray] = None
+        # Double tampon RGB : la frame N reste lue par l'inférence pendant la conversion de N+1
+        self._rgb_bufs: List[Optional[np.ndarray]] = [None, None]
+        self._rgb_idx = 0
         self.max_mouth_distance = 0.0  # Pour normalisation mouth_open_ratio
         
-        # Données accumulées (SCANNER UNIVERSEL)
-        self.camera_motion: List[Dict] = []
-        self.actors_data: Dict[str, Dict[str, List[Dict]]] = {}
+        # Données (SCANNER UNIVERSEL) : records streamés dans un spool NDJSON
+        self.spool_dir = self.output_path.with_suffix(".spool")
+        self._spool: Optional[_NDJSONSpool] = None
+        self.actor_ids: List[str] = []  # ordre d'apparition des acteurs
         self.audio_transcription: Optional[Dict] = None
         self.video_metadata: Dict = {}
+        # Maillages faciaux bruts par acteur (SoA spoolés sur disque, regroupés
+        # dans le sidecar .npz) ; la pose ne vit que dans pose_frames du JSON
+        self._face_tracks: Dict[str, _LandmarkTrack] = {}
+
+    @classmethod
+    def clear_cache(cls):
+        """Libère les modèles partagés entre instances (cache processus)"""
+        _MODEL_CACHE.clear()
 
     # ------------------------------------------------------------------
     #  MOTEUR DE POSE : PoseLandmarker (Tasks API)
@@ -126,12 +347,17 @@ class EXODNAScanner:
             "pose_landmarker_heavy/float16/1/pose_landmarker_heavy.task"
         )
         print(f"[INFO] Modèle PoseLandmarker introuvable. Téléchargement depuis : {url}")
+        # Fichier temporaire propre au processus puis os.replace : un scanner
+        # lancé en parallèle ne voit jamais un modèle à moitié écrit
+        tmp_path = model_path.with_name(f"{model_path.name}.{os.getpid()}.tmp")
         try:
-            with urllib.request.urlopen(url) as response, open(model_path, "wb") as out_file:
+            with urllib.request.urlopen(url) as response, open(tmp_path, "wb") as out_file:
                 data = response.read()
                 out_file.write(data)
+            os.replace(tmp_path, model_path)
             print(f"[SUCCESS] Modèle téléchargé : {model_path}")
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             print(f"[ERROR] Échec du téléchargement du modèle PoseLandmarker : {e}")
             raise
 
@@ -155,6 +381,71 @@ class EXODNAScanner:
         print("[INFO] Initialisation PoseLandmarker (num_poses=5)...")
         return mp_vision.PoseLandmarker.create_from_options(options)
         
+    # ------------------------------------------------------------------
+    #  DÉCODAGE VIDÉO : NVDEC (cv2.cudacodec) si disponible
+    # ------------------------------------------------------------------
+    def _open_gpu_reader(self):
+        """
+        Ouvre un lecteur vidéo matériel (NVDEC via cv2.cudacodec) si OpenCV
+        a été compilé avec CUDA et qu'un GPU est présent, sinon None
+        (repli sur le décodage logiciel cv2.VideoCapture).
+        """
+        cudacodec = getattr(cv2, "cudacodec", None)
+        cuda = getattr(cv2, "cuda", None)
+        if cudacodec is None or cuda is None:
+            return None
+        try:
+            if cuda.getCudaEnabledDeviceCount() == 0:
+                return None
+            reader = cudacodec.createVideoReader(str(self.video_path))
+            try:
+                # OpenCV >= 4.7 : sortie BGR directe (sinon BGRA, converti à la lecture)
+                reader.set(cudacodec.ColorFormat_BGR)
+            except Exception:
+                pass
+            print("[INFO] Decodage video materiel (NVDEC / cv2.cudacodec)")
+            return reader
+        except Exception as e:
+            print(f"[WARNING] Decodage NVDEC indisponible, repli CPU : {e}")
+            return None
+    
+    def _decode_frames(self, cap, gpu_reader, fps: float, frame_queue: "queue.Queue"):
+        """
+        Producteur (thread dédié) : décode les frames et les pousse avec leur
+        timestamp (ms, temps vidéo) dans une file bornée ; None marque la fin.
+        """
+        index = 0
+        try:
+            while True:
+                if gpu_reader is not None:
+                    ret, frame = self._read_gpu_frame(gpu_reader)
+                else:
+                    ret, frame = cap.read()
+                if not ret:
+                    break
+                if gpu_reader is not None:
+                    # Le lecteur NVDEC n'expose pas POS_MSEC : temps dérivé du FPS
+                    timestamp_ms = int(round(index * 1000.0 / fps)) if fps > 0 else index
+                else:
+                    timestamp_ms = int(cap.get(cv2.CAP_PROP_POS_MSEC))
+                frame_queue.put((frame, timestamp_ms))
+                index += 1
+        except Exception as e:
+            print(f"[ERROR] Erreur de decodage video (frame {index}): {e}")
+        finally:
+            frame_queue.put(None)
+    
+    @staticmethod
+    def _read_gpu_frame(reader) -> Tuple[bool, Optional[np.ndarray]]:
+        """Lit une frame NVDEC et la rapatrie en mémoire hôte (BGR)"""
+        ret, gpu_frame = reader.nextFrame()
+        if not ret:
+            return False, None
+        frame = gpu_frame.download()
+        if frame.ndim == 3 and frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        return True, frame
+    
     def calculate_mouth_open_ratio(self, upper_lip: np.ndarray, lower_lip: np.ndarray) -> float:
         """
         Calcule l'ouverture de la bouche basée sur la distance VERTICALE
@@ -172,20 +463,13 @@ class EXODNAScanner:
         if upper_lip is None or lower_lip is None:
             return 0.0
         
-        # Distance VERTICALE uniquement (différence en Y)
-        vertical_distance = abs(upper_lip[1] - lower_lip[1])
-        
-        # Mise à jour du maximum pour normalisation
-        if vertical_distance > self.max_mouth_distance:
-            self.max_mouth_distance = vertical_distance
-        
-        # Normalisation : 0.0 = fermé, 1.0 = ouvert maximum observé
-        if self.max_mouth_distance > 0:
-            ratio = min(vertical_distance / self.max_mouth_distance, 1.0)
-        else:
-            ratio = 0.0
+        # Distance VERTICALE (différence en Y), normalisée par le maximum observé
+        # (0.0 = fermé, 1.0 = ouvert maximum) ; maximum mis à jour dans le même appel
+        ratio, self.max_mouth_distance = _mouth_ratio(
+            float(upper_lip[1]), float(lower_lip[1]), float(self.max_mouth_distance)
+        )
         
-        return float(ratio)
+        return ratio
     
     def extract_face_landmarks(self, face_landmarks) -> Dict:
         """
@@ -196,55 +480,38 @@ class EXODNAScanner:
             face_landmarks: Objet MediaPipe FaceMesh landmarks
             
         Returns:
-            Dictionnaire avec upper_lip_center, lower_lip_center, mouth_open_ratio, all_468_landmarks
+            Dictionnaire avec upper_lip_center, lower_lip_center, mouth_open_ratio,
+            all_468_landmarks (ndarray float32 de forme (468, 3) : x, y, z)
         """
         if not face_landmarks:
             return {
                 "upper_lip_center": None,
                 "lower_lip_center": None,
                 "mouth_open_ratio": 0.0,
-                "all_468_landmarks": []
+                "all_468_landmarks": np.empty((0, 3), dtype=np.float32)
             }
         
-        # Extraction de tous les landmarks (468 points)
-        all_landmarks = []
-        for idx, landmark in enumerate(face_landmarks.landmark):
-            all_landmarks.append({
-                "x": float(landmark.x),
-                "y": float(landmark.y),
-                "z": float(landmark.z),
-                "landmark_id": idx
-            })
+        # Extraction de tous les landmarks (468 points) : copie en bloc -> ndarray (N, 3)
+        all_landmarks = _landmarks_to_array(face_landmarks)
+        n_landmarks = len(all_landmarks)
         
         # Extraction des landmarks critiques (13-14) - PROTOCOLE INNER-LIP
-        upper_lip = None
-        lower_lip = None
-        
-        if len(face_landmarks.landmark) > self.UPPER_LIP_CENTER_ID:
-            upper_landmark = face_landmarks.landmark[self.UPPER_LIP_CENTER_ID]
-            upper_lip = np.array([upper_landmark.x, upper_landmark.y, upper_landmark.z])
-        
-        if len(face_landmarks.landmark) > self.LOWER_LIP_CENTER_ID:
-            lower_landmark = face_landmarks.landmark[self.LOWER_LIP_CENTER_ID]
-            lower_lip = np.array([lower_landmark.x, lower_landmark.y, lower_landmark.z])
+        upper_lip = all_landmarks[self.UPPER_LIP_CENTER_ID] if n_landmarks > self.UPPER_LIP_CENTER_ID else None
+        lower_lip = all_landmarks[self.LOWER_LIP_CENTER_ID] if n_landmarks > self.LOWER_LIP_CENTER_ID else None
         
         # Calcul mouth_open_ratio (distance verticale)
         mouth_open_ratio = self.calculate_mouth_open_ratio(upper_lip, lower_lip)
         
-        # Structure de sortie
+        # Structure de sortie (tolist : 3 float Python en un seul appel C)
         face_data = {
-            "upper_lip_center": {
-                "x": float(upper_lip[0]) if upper_lip is not None else None,
-                "y": float(upper_lip[1]) if upper_lip is not None else None,
-                "z": float(upper_lip[2]) if upper_lip is not None else None,
-                "landmark_id": self.UPPER_LIP_CENTER_ID
-            } if upper_lip is not None else None,
-            "lower_lip_center": {
-                "x": float(lower_lip[0]) if lower_lip is not None else None,
-                "y": float(lower_lip[1]) if lower_lip is not None else None,
-                "z": float(lower_lip[2]) if lower_lip is not None else None,
-                "landmark_id": self.LOWER_LIP_CENTER_ID
-            } if lower_lip is not None else None,
+            "upper_lip_center": dict(
+                zip(("x", "y", "z"), upper_lip.tolist()),
+                landmark_id=self.UPPER_LIP_CENTER_ID
+            ) if upper_lip is not None else None,
+            "lower_lip_center": dict(
+                zip(("x", "y", "z"), lower_lip.tolist()),
+                landmark_id=self.LOWER_LIP_CENTER_ID
+            ) if lower_lip is not None else None,
             "mouth_open_ratio": mouth_open_ratio,
             "all_468_landmarks": all_landmarks
         }
@@ -266,56 +533,105 @@ class EXODNAScanner:
         
         all_landmarks = []
         for idx, landmark in enumerate(pose_landmarks):
+            # Valeurs protobuf déjà en float Python : pas de re-boxing
             all_landmarks.append({
-                "x": float(landmark.x),
-                "y": float(landmark.y),
-                "z": float(landmark.z),
-                "visibility": float(landmark.visibility),
+                "x": landmark.x,
+                "y": landmark.y,
+                "z": landmark.z,
+                "visibility": landmark.visibility,
                 "landmark_id": idx
             })
         
         return {"all_33_landmarks": all_landmarks}
     
-    def calculate_optical_flow(self, frame: np.ndarray) -> Dict:
+    def calculate_optical_flow(self, frame: np.ndarray, frame_span: int = 1) -> Dict:
         """
         Calcule l'Optical Flow pour détecter les mouvements de caméra
         
+        Lucas-Kanade pyramidal CREUX sur une image réduite (FLOW_SCALE) :
+        ~FLOW_MAX_CORNERS points suivis d'une frame à l'autre, re-détectés
+        tous les FLOW_REDETECT_INTERVAL frames. Les vecteurs sont remis à
+        l'échelle de la résolution d'origine.
+        
         Args:
             frame: Frame actuelle (BGR)
+            frame_span: Nombre de frames écoulées depuis le dernier calcul ; le flux
+                est ramené à un déplacement moyen PAR FRAME
             
         Returns:
             Dictionnaire avec magnitude, angle, flow_vectors
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # Tampons réutilisés (pas d'allocation par frame) : gris pleine résolution
+        # + double tampon réduit (frame courante / frame précédente)
+        h, w = frame.shape[:2]
+        if self._gray_buf is None or self._gray_buf.shape != (h, w):
+            self._gray_buf = np.empty((h, w), dtype=np.uint8)
+            small_size = (max(1, round(w * self.FLOW_SCALE)), max(1, round(h * self.FLOW_SCALE)))
+            self._flow_bufs = [np.empty(small_size[::-1], dtype=np.uint8) for _ in range(2)]
+            self._flow_idx = 0
+            self.prev_gray = None
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        small = self._flow_bufs[self._flow_idx]
+        cv2.resize(gray, small.shape[::-1], dst=small, interpolation=cv2.INTER_AREA)
+        self._flow_idx ^= 1
         
         if self.prev_gray is None:
-            self.prev_gray = gray
+            self.prev_gray = small
+            self.prev_points = None
+            return {
+                "magnitude": 0.0,
+                "angle": 0.0,
+                "flow_vectors": []
+            }
+        
+        # (Re)détection des points à suivre : cache inter-frames
+        if (self.prev_points is None
+                or len(self.prev_points) < self.FLOW_MIN_POINTS
+                or self.frames_since_detect >= self.FLOW_REDETECT_INTERVAL):
+            self.prev_points = cv2.goodFeaturesToTrack(
+                self.prev_gray,
+                maxCorners=self.FLOW_MAX_CORNERS,
+                qualityLevel=0.01,
+                minDistance=7
+            )
+            self.frames_since_detect = 0
+        
+        if self.prev_points is None or len(self.prev_points) == 0:
+            # Image uniforme : aucun point exploitable
+            self.prev_gray = small
             return {
                 "magnitude": 0.0,
                 "angle": 0.0,
                 "flow_vectors": []
             }
         
-        # Calcul du flux optique (Lucas-Kanade)
-        flow = cv2.calcOpticalFlowFarneback(
-            self.prev_gray, gray, None, 0.5, 3, 15, 3, 5, 1.2, 0
+        # Calcul du flux optique (Lucas-Kanade pyramidal, creux)
+        next_points, status, _err = cv2.calcOpticalFlowPyrLK(
+            self.prev_gray, small, self.prev_points, None
         )
+        tracked = status.reshape(-1) == 1
+        p0 = self.prev_points.reshape(-1, 2)[tracked]
+        p1 = next_points.reshape(-1, 2)[tracked]
         
-        # Magnitude et angle
-        magnitude, angle = cv2.cartToPolar(flow[..., 0], flow[..., 1])
-        avg_magnitude = float(np.mean(magnitude))
-        avg_angle = float(np.mean(angle))
+        # Vecteurs remis à l'échelle de la frame d'origine, par frame
+        flow = (p1 - p0) / (self.FLOW_SCALE * frame_span)
         
-        # Échantillonnage des vecteurs de flux (pour réduire la taille)
-        h, w = flow.shape[:2]
-        step = max(1, min(h, w) // 20)  # ~400 points max
-        flow_vectors = []
-        for y in range(0, h, step):
-            for x in range(0, w, step):
-                fx, fy = flow[y, x]
-                flow_vectors.append([float(fx), float(fy)])
+        if len(flow):
+            magnitude, angle = cv2.cartToPolar(
+                np.ascontiguousarray(flow[:, 0]), np.ascontiguousarray(flow[:, 1])
+            )
+            avg_magnitude = float(np.mean(magnitude))
+            avg_angle = float(np.mean(angle))
+        else:
+            avg_magnitude = 0.0
+            avg_angle = 0.0
+        
+        # Conversion C unique (tolist produit déjà des float Python)
+        flow_vectors = flow.tolist()
         
-        self.prev_gray = gray
+        self.prev_gray = small
+        self.prev_points = p1.reshape(-1, 1, 2)
+        self.frames_since_detect += 1
         
         return {
             "magnitude": avg_magnitude,
@@ -336,22 +652,24 @@ class EXODNAScanner:
         print("[INFO] Transcription audio avec Whisper (local)...")
         
         try:
-            result = self.whisper_model.transcribe(
+            segments_gen, _info = self.whisper_model.transcribe(
                 str(video_path),
                 language="fr",  # ou "en" selon besoin
-                task="transcribe"
+                task="transcribe",
+                vad_filter=True
             )
+            # Générateur paresseux : la transcription s'exécute ici, en un seul passage
+            segments = list(segments_gen)
             
             # Calcul de la confiance moyenne
-            segments = result.get("segments", [])
             if segments:
-                avg_confidence = sum(s.get("no_speech_prob", 0.5) for s in segments) / len(segments)
+                avg_confidence = sum(s.no_speech_prob for s in segments) / len(segments)
                 confidence = 1.0 - avg_confidence  # Inversion : plus bas = plus confiant
             else:
                 confidence = 0.5
             
             transcription = {
-                "text": result.get("text", ""),
+                "text": "".join(s.text for s in segments),
                 "confidence": float(confidence),
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
@@ -367,6 +685,137 @@ class EXODNAScanner:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
     
+    def _ingest_frame(self, frame_count: int, timestamp_ms: int, frame: np.ndarray,
+                      pose_result, face_results):
+        """
+        Post-traitement d'une frame dont l'inférence MediaPipe est terminée :
+        poses, bouches (association par X), mouvement caméra.
+        
+        Args:
+            frame_count: Numéro de la frame
+            timestamp_ms: Position de la frame dans la vidéo (ms, CAP_PROP_POS_MSEC)
+            frame: Frame BGR d'origine (Optical Flow)
+            pose_result: Résultat PoseLandmarker.detect_for_video
+            face_results: Résultat FaceMesh.process
+        """
+        # ---------------------------
+        # 1) POSES (PoseLandmarker)
+        # ---------------------------
+        pose_landmarks_list = pose_result.pose_landmarks or []
+
+        # Calcul de la position X pour chaque pose (utilise le nez = landmark 0)
+        pose_candidates = []
+        for pose_lmk in pose_landmarks_list:
+            if not pose_lmk:
+                continue
+            nose = pose_lmk[0]
+            center_x = nose.x  # float Python (protobuf)
+            pose_candidates.append((center_x, pose_lmk))
+
+        # Trier de gauche à droite pour IDs stables
+        pose_candidates.sort(key=lambda item: item[0])
+
+        # Initialiser acteurs pour cette frame
+        frame_actor_pose: Dict[str, Dict] = {}
+
+        for idx, (center_x, pose_lmk) in enumerate(pose_candidates):
+            actor_id = str(idx)  # ID temporaire basé sur la position X
+            # Enregistrer l'acteur si nécessaire
+            if actor_id not in self.actor_ids:
+                self.actor_ids.append(actor_id)
+            # Extraire les 33 points XYZ (et visibility)
+            pose_data = self.extract_pose_landmarks(pose_lmk)
+            pose_frame = {
+                "frame_number": frame_count,
+                "timestamp_ms": timestamp_ms,
+                "landmarks": pose_data.get("all_33_landmarks", []),
+                "center_x": center_x,
+            }
+            self._spool.write(f"actor_{actor_id}_pose_frames", pose_frame)
+            frame_actor_pose[actor_id] = pose_frame
+        
+        # ---------------------------
+        # 2) FACEMESH (Inner-Lip 13-14)
+        # ---------------------------
+        faces = face_results.multi_face_landmarks or []
+
+        # Calcul X bouche et mouth_open_ratio pour chaque visage
+        face_infos = []
+        for face_landmarks in faces:
+            face_data = self.extract_face_landmarks(face_landmarks)
+            upper = face_data.get("upper_lip_center")
+            lower = face_data.get("lower_lip_center")
+            all_468 = face_data.get("all_468_landmarks")
+            if upper and lower:
+                center_x = (upper["x"] + lower["x"]) / 2.0
+            elif upper:
+                center_x = upper["x"]
+            else:
+                # fallback: prendre landmark 0 si dispo
+                if all_468 is not None and len(all_468):
+                    center_x = float(all_468[0, 0])
+                else:
+                    continue
+            face_infos.append(
+                {
+                    "center_x": center_x,
+                    "mouth_open_ratio": face_data.get("mouth_open_ratio", 0.0),
+                    "landmarks": all_468,
+                }
+            )
+
+        # Associer chaque bouche au corps le plus proche (en X) : argmin vectorisé
+        # sur la matrice |face_x - pose_x| (toutes les bouches en une passe)
+        if face_infos and frame_actor_pose:
+            pose_aids = list(frame_actor_pose.keys())
+            pose_xs = np.array([p["center_x"] for p in frame_actor_pose.values()], dtype=np.float64)
+            face_xs = np.array([f["center_x"] for f in face_infos], dtype=np.float64)
+            nearest = np.argmin(np.abs(face_xs[:, None] - pose_xs[None, :]), axis=1)
+            face_actor_ids = [pose_aids[i] for i in nearest]
+        else:
+            # Aucun corps détecté cette frame → on associe à actor "0"
+            face_actor_ids = ["0"] * len(face_infos)
+
+        for face_info, actor_id in zip(face_infos, face_actor_ids):
+            if actor_id not in self.actor_ids:
+                self.actor_ids.append(actor_id)
+
+            mouth_frame = {
+                "frame_number": frame_count,
+                "timestamp_ms": timestamp_ms,
+                "mouth_open_ratio": face_info["mouth_open_ratio"],
+            }
+            self._spool.write(f"actor_{actor_id}_mouth_frames", mouth_frame)
+            if face_info["landmarks"] is not None and len(face_info["landmarks"]):
+                track = self._face_tracks.get(actor_id)
+                if track is None:
+                    track = self._face_tracks[actor_id] = _LandmarkTrack(
+                        self._spool.directory, f"actor_{actor_id}_face"
+                    )
+                track.append(frame_count, face_info["landmarks"])
+        
+        # Mise à jour métriques
+        self.max_actors_detected = max(
+            self.max_actors_detected, len(frame_actor_pose)
+        )
+
+        # ---------------------------
+        # 3) CAMERA MOTION (Optical Flow)
+        # ---------------------------
+        # Décimation : calcul 1 frame sur flow_stride ; les frames intermédiaires
+        # reprennent le dernier flux (déjà normalisé par frame, cumul inchangé)
+        if frame_count % self.flow_stride == 0 or self._last_flow is None:
+            self._last_flow = self.calculate_optical_flow(frame, frame_span=self.flow_stride)
+        optical_flow_data = self._last_flow
+        self._spool.write(
+            "camera_motion",
+            {
+                "frame_number": frame_count,
+                "timestamp_ms": timestamp_ms,
+                "optical_flow": optical_flow_data,
+            }
+        )
+    
     def process_video(self):
         """
         Traite la vidéo complète : extraction frame par frame (SCANNER UNIVERSEL)
@@ -402,6 +851,13 @@ class EXODNAScanner:
         
         print(f"[INFO] Resolution: {width}x{height}, FPS: {fps}, Frames: {total_frames}")
         
+        # Taille d'inférence MediaPipe (ratio conservé, jamais d'agrandissement)
+        scale = min(1.0, self.INFERENCE_MAX_SIDE / max(width, height, 1))
+        inference_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        resize_for_inference = scale < 1.0
+        if resize_for_inference:
+            print(f"[INFO] Inference MediaPipe a {inference_size[0]}x{inference_size[1]}")
+        
         # MÉTADONNÉES GLOBALES
         self.video_metadata = {
             "session_id": self.session_id,
@@ -411,163 +867,113 @@ class EXODNAScanner:
             "total_frames": int(total_frames),
             "duration_seconds": duration_sec,
             "created_at": datetime.now(timezone.utc).isoformat(),
+            "session_started_at": self.session_start_iso,
             "pose_model": "pose_landmarker_heavy",
         }
         
         frame_count = 0
         
+        # Transcription audio en parallèle du scan vidéo (flux indépendants) ;
+        # exécuteur dédié pour ne pas occuper les workers Pose/FaceMesh
+        audio_pool = ThreadPoolExecutor(max_workers=1)
+        audio_future = audio_pool.submit(self.transcribe_audio, self.video_path)
+        
+        # Spool NDJSON : mémoire constante quelle que soit la durée de la vidéo
+        self._spool = _NDJSONSpool(self.spool_dir)
+        
+        # Décodage matériel si possible (cap reste ouvert pour les métadonnées / repli)
+        gpu_reader = self._open_gpu_reader()
+        
         # Barre de progression (tqdm)
         pbar = tqdm(total=total_frames if total_frames > 0 else None,
                     desc="SCANNER UNIVERSEL",
                     unit="frame")
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
+        # Décodage dans un thread producteur (file bornée) : I/O + décodage
+        # chevauchent l'inférence et le post-traitement du thread principal
+        frame_queue: "queue.Queue" = queue.Queue(maxsize=8)
+        decoder = threading.Thread(
+            target=self._decode_frames,
+            args=(cap, gpu_reader, fps, frame_queue),
+            daemon=True
+        )
+        decoder.start()
+        
+        # Pipeline à une frame en vol : la préparation de la frame N+1 (et le
+        # post-traitement de N) chevauchent l'inférence MediaPipe de N+1 / N.
+        # Mode VIDEO conservé (LIVE_STREAM peut abandonner des frames).
+        pending = None  # (frame_number, timestamp_ms, frame_bgr, fut_pose, fut_face)
+        
+        while True:
+            item = frame_queue.get()
+            ret = item is not None
             
-            # Timestamp de la frame (ms) pour PoseLandmarker
-            timestamp_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
-            timestamp_iso = datetime.now(timezone.utc).isoformat()
+            if ret:
+                # Timestamp de la frame (ms, temps vidéo) pour PoseLandmarker et la sortie
+                frame, timestamp_ms = item
+                
+                # Réduction (INTER_AREA) puis conversion BGR -> RGB pour MediaPipe ;
+                # l'image réduite est partagée par PoseLandmarker et FaceMesh
+                if resize_for_inference:
+                    if self._small_buf is None:
+                        self._small_buf = np.empty(
+                            (inference_size[1], inference_size[0], 3), dtype=np.uint8
+                        )
+                    small = cv2.resize(
+                        frame, inference_size, dst=self._small_buf,
+                        interpolation=cv2.INTER_AREA
+                    )
+                else:
+                    small = frame
+                rgb_frame = self._rgb_bufs[self._rgb_idx]
+                if rgb_frame is None or rgb_frame.shape != small.shape:
+                    rgb_frame = self._rgb_bufs[self._rgb_idx] = np.empty_like(small)
+                cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                self._rgb_idx ^= 1
+                mp_image = mp.Image(
+                    image_format=mp.ImageFormat.SRGB,
+                    data=rgb_frame
+                )
             
-            # Conversion BGR -> RGB pour MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Résultats de la frame précédente (une seule inférence par modèle en vol)
+            if pending is not None:
+                pose_result = pending[3].result()
+                face_results = pending[4].result()
             
-            # ---------------------------
-            # 1) POSES (PoseLandmarker)
-            # ---------------------------
-            mp_image = mp.Image(
-                image_format=mp.ImageFormat.SRGB,
-                data=rgb_frame
-            )
-            pose_result = self.pose_landmarker.detect_for_video(
-                mp_image, int(timestamp_ms)
-            )
-            pose_landmarks_list = pose_result.pose_landmarks or []
-
-            # Calcul de la position X pour chaque pose (utilise le nez = landmark 0)
-            pose_candidates = []
-            for pose_lmk in pose_landmarks_list:
-                if not pose_lmk:
-                    continue
-                nose = pose_lmk[0]
-                center_x = float(nose.x)
-                pose_candidates.append((center_x, pose_lmk))
-
-            # Trier de gauche à droite pour IDs stables
-            pose_candidates.sort(key=lambda item: item[0])
-
-            # Initialiser acteurs pour cette frame
-            frame_actor_pose: Dict[str, Dict] = {}
-
-            for idx, (center_x, pose_lmk) in enumerate(pose_candidates):
-                actor_id = str(idx)  # ID temporaire basé sur la position X
-                # Initialiser structure globale si nécessaire
-                if actor_id not in self.actors_data:
-                    self.actors_data[actor_id] = {
-                        "pose_frames": [],
-                        "mouth_frames": [],
-                    }
-                # Extraire les 33 points XYZ (et visibility)
-                pose_data = self.extract_pose_landmarks(pose_lmk)
-                pose_frame = {
-                    "frame_number": frame_count,
-                    "timestamp": timestamp_iso,
-                    "landmarks": pose_data.get("all_33_landmarks", []),
-                    "center_x": center_x,
-                }
-                self.actors_data[actor_id]["pose_frames"].append(pose_frame)
-                frame_actor_pose[actor_id] = pose_frame
+            submitted = None
+            if ret:
+                # Pose et FaceMesh sont indépendants : soumission simultanée au pool
+                fut_pose = self._pool.submit(
+                    self.pose_landmarker.detect_for_video, mp_image, timestamp_ms
+                )
+                fut_face = self._pool.submit(self.face_mesh.process, rgb_frame)
+                submitted = (frame_count, timestamp_ms, frame, fut_pose, fut_face)
             
-            # ---------------------------
-            # 2) FACEMESH (Inner-Lip 13-14)
-            # ---------------------------
-            face_results = self.face_mesh.process(rgb_frame)
-            faces = face_results.multi_face_landmarks or []
-
-            # Calcul X bouche et mouth_open_ratio pour chaque visage
-            face_infos = []
-            for face_landmarks in faces:
-                face_data = self.extract_face_landmarks(face_landmarks)
-                upper = face_data.get("upper_lip_center")
-                lower = face_data.get("lower_lip_center")
-                if upper and lower:
-                    center_x = float((upper["x"] + lower["x"]) / 2.0)
-                elif upper:
-                    center_x = float(upper["x"])
-                else:
-                    # fallback: prendre landmark 0 si dispo
-                    if face_data.get("all_468_landmarks"):
-                        center_x = float(face_data["all_468_landmarks"][0]["x"])
-                    else:
-                        continue
-                face_infos.append(
-                    {
-                        "center_x": center_x,
-                        "mouth_open_ratio": float(face_data.get("mouth_open_ratio", 0.0)),
-                    }
+            if pending is not None:
+                self._ingest_frame(
+                    pending[0], pending[1], pending[2], pose_result, face_results
                 )
-
-            # Associer chaque bouche au corps le plus proche (en X)
-            for face_info in face_infos:
-                if not frame_actor_pose:
-                    # Aucun corps détecté cette frame → on associe à actor "0"
-                    actor_id = "0"
-                else:
-                    fx = face_info["center_x"]
-                    # Trouver l'acteur avec center_x le plus proche
-                    best_actor = None
-                    best_dist = None
-                    for aid, pose_frame in frame_actor_pose.items():
-                        px = pose_frame.get("center_x", fx)
-                        d = abs(px - fx)
-                        if best_dist is None or d < best_dist:
-                            best_dist = d
-                            best_actor = aid
-                    actor_id = best_actor if best_actor is not None else "0"
-
-                if actor_id not in self.actors_data:
-                    self.actors_data[actor_id] = {
-                        "pose_frames": [],
-                        "mouth_frames": [],
-                    }
-
-                mouth_frame = {
-                    "frame_number": frame_count,
-                    "timestamp": timestamp_iso,
-                    "mouth_open_ratio": face_info["mouth_open_ratio"],
-                }
-                self.actors_data[actor_id]["mouth_frames"].append(mouth_frame)
+                pbar.update(1)
             
-            # Mise à jour métriques
-            self.max_actors_detected = max(
-                self.max_actors_detected, len(frame_actor_pose)
-            )
-
-            # ---------------------------
-            # 3) CAMERA MOTION (Optical Flow)
-            # ---------------------------
-            optical_flow_data = self.calculate_optical_flow(frame)
-            self.camera_motion.append(
-                {
-                    "frame_number": frame_count,
-                    "timestamp": timestamp_iso,
-                    "optical_flow": optical_flow_data,
-                }
-            )
-
+            if not ret:
+                break
+            
+            pending = submitted
             frame_count += 1
-            pbar.update(1)
         
+        decoder.join()
         cap.release()
         pbar.close()
+        self._pool.shutdown(wait=True)
+        self._spool.close()
         print(f"[OK] Traitement video termine: {frame_count} frames")
         
-        # Transcription audio (une seule fois pour toute la vidéo)
-        self.audio_transcription = self.transcribe_audio(self.video_path)
+        # Transcription audio (une seule fois pour toute la vidéo, lancée avant la boucle)
+        self.audio_transcription = audio_future.result()
+        audio_pool.shutdown(wait=True)
         
         # Note: La transcription audio est ajoutée dans output_data sous "audio_transcription_global"
-        # (architecture Multi-Acteurs : pas de frames_data, utilisation de actors_data)
+        # (architecture Multi-Acteurs : pas de frames_data, acteurs streamés dans le spool)
     
     def save_output(self):
         """
@@ -576,26 +982,58 @@ class EXODNAScanner:
         # Création du répertoire parent si nécessaire
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        output_data = {
-            "metadata": {
-                **self.video_metadata,
-                "max_actors_detected": int(self.max_actors_detected),
-                "generated_at": datetime.now(timezone.utc).isoformat(),
+        # Sidecar SoA : maillages faciaux bruts hors JSON (landmark_id = index de
+        # l'axe 1), recopiés par blocs depuis le spool (même format que savez_compressed)
+        try:
+            with zipfile.ZipFile(self.landmarks_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for aid, track in self._face_tracks.items():
+                    track.write_npz(archive, f"actor_{aid}_face")
+        except Exception as e:
+            print(f"[ERROR] Erreur lors de la sauvegarde du sidecar landmarks: {e}")
+            raise
+        
+        metadata = {
+            **self.video_metadata,
+            "max_actors_detected": int(self.max_actors_detected),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "landmarks_sidecar": {
+                "path": self.landmarks_path.name,
+                "format": "npz",
+                "face_layout": "actor_<id>_face[T, N, 3] (x, y, z) + actor_<id>_face_frames[T]",
             },
-            "camera_motion": self.camera_motion,
-            "actors": self.actors_data,
-            "audio_transcription_global": self.audio_transcription,
         }
         
+        # Assemblage en flux : en-têtes encodés par orjson, frames recopiées
+        # depuis le spool (structure universelle inchangée pour le Segment 02)
+        dump_opts = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
         try:
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            with open(self.output_path, 'wb') as out:
+                out.write(b'{\n"metadata": ')
+                out.write(orjson.dumps(metadata, option=dump_opts))
+                out.write(b',\n"camera_motion": ')
+                self._spool.copy_array("camera_motion", out)
+                out.write(b',\n"actors": {')
+                for idx, actor_id in enumerate(self.actor_ids):
+                    out.write(b"\n" if idx == 0 else b",\n")
+                    out.write(orjson.dumps(actor_id))
+                    out.write(b': {\n"pose_frames": ')
+                    self._spool.copy_array(f"actor_{actor_id}_pose_frames", out)
+                    out.write(b',\n"mouth_frames": ')
+                    self._spool.copy_array(f"actor_{actor_id}_mouth_frames", out)
+                    out.write(b"}")
+                out.write(b'},\n"audio_transcription_global": ')
+                out.write(orjson.dumps(self.audio_transcription, option=dump_opts))
+                out.write(b"\n}\n")
         except Exception as e:
             print(f"[ERROR] Erreur lors de la sauvegarde: {e}")
             raise
         
+        total_frames = self._spool.counts.get("camera_motion", 0)
+        self._spool.cleanup()
+        
         print(f"[OK] Donnees sauvegardees: {self.output_path}")
-        print(f"[INFO] Total frames: {len(self.camera_motion)}")
+        print(f"[OK] Sidecar landmarks: {self.landmarks_path}")
+        print(f"[INFO] Total frames: {total_frames}")
 
 
 def main():
@@ -622,6 +1060,18 @@ def main():
         default=None,
         help="Chemin vers une vidéo spécifique (optionnel, sinon scanne 00_INPUT/)"
     )
+    parser.add_argument(
+        "--flow-stride",
+        type=int,
+        default=3,
+        help="Optical Flow calculé 1 frame sur N (défaut: 3)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="JSON de sortie (défaut: 01_BUFFER/mission_RAW.json) ; sidecar et spool nommés d'après lui"
+    )
     
     args = parser.parse_args()
     
@@ -647,7 +1097,7 @@ def main():
         print("=" * 80)
         
         # Initialisation du scanner
-        scanner = EXODNAScanner(drive_root, args.video)
+        scanner = EXODNAScanner(drive_root, args.video, flow_stride=args.flow_stride, output_path=args.output)
         
         # Traitement
         scanner.process_video()
@@ -7,12 +7,279 @@ Système EXODUS - Épreuve de Feu pour validation des données
 Vérifie la conformité des fichiers et données générées par EXO_01_DNA_SCANNER.py
 """
 
+import hashlib
 import json
+import math
+import multiprocessing as mp
+import os
+import random
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
+# Validateur compilé (optionnel) : fastjsonschema génère une fonction Python
+# dédiée par schéma ; à défaut, une instance jsonschema construite une seule
+# fois ; sinon repli sur les vérifications manuelles
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+# Parseur rapide (optionnel) : orjson, repli json stdlib
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Lecture en flux (optionnelle) : ijson choisit le backend C yajl2_c si disponible
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ----------------------------------------------------------------------
+#  GÉNÉRATION DE CODE (repli sans fastjsonschema ni jsonschema)
+#  Traduit le sous-ensemble de JSON Schema utilisé ci-dessus en une
+#  fonction Python en ligne droite (tests d'appartenance et bornes
+#  inlinés), compilée une fois par exec.
+# ----------------------------------------------------------------------
+_CODEGEN_TYPES = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "null": "{v} is None",
+}
+_CODEGEN_KEYWORDS = frozenset((
+    "type", "required", "properties", "const", "minimum", "maximum",
+    "minItems", "maxItems", "items",
+))
+
+
+def _generate_schema_check(schema: Dict, name: str = "check"):
+    """
+    Génère et compile un vérificateur spécialisé pour un schéma
+    
+    Args:
+        schema: Schéma (sous-ensemble : voir _CODEGEN_KEYWORDS)
+        name: Nom de la fonction générée
+        
+    Returns:
+        Fonction(obj) retournant un message d'erreur ou None
+        
+    Raises:
+        ValueError: Mot-clé de schéma non pris en charge
+    """
+    lines = [f"def {name}(data):"]
+    counter = [0]
+    
+    def new_var() -> str:
+        counter[0] += 1
+        return f"v{counter[0]}"
+    
+    def emit(schema: Dict, var: str, path: str, depth: int):
+        unknown = set(schema) - _CODEGEN_KEYWORDS
+        if unknown:
+            raise ValueError(f"Mots-clés non pris en charge : {sorted(unknown)}")
+        pad = "    " * depth
+        
+        types = schema.get("type")
+        if types is not None:
+            types = [types] if isinstance(types, str) else list(types)
+            cond = " or ".join(_CODEGEN_TYPES[t].format(v=var) for t in types)
+            lines.append(f"{pad}if not ({cond}):")
+            lines.append(f"{pad}    return {path + ' must be ' + ' or '.join(types)!r}")
+        
+        if "const" in schema:
+            lines.append(f"{pad}if {var} != {schema['const']!r}:")
+            lines.append(f"{pad}    return {path + ' must be ' + repr(schema['const'])!r}")
+        
+        # Mots-clés typés : gardés par isinstance sauf si le type est déjà imposé
+        def guarded(kind: str) -> str:
+            if types == [kind]:
+                return pad
+            lines.append(f"{pad}if {_CODEGEN_TYPES[kind].format(v=var)}:")
+            return pad + "    "
+        
+        if "minimum" in schema or "maximum" in schema:
+            inner = guarded("number")
+            if "minimum" in schema:
+                lines.append(f"{inner}if {var} < {schema['minimum']!r}:")
+                lines.append(f"{inner}    return {path + ' must be >= ' + repr(schema['minimum'])!r}")
+            if "maximum" in schema:
+                lines.append(f"{inner}if {var} > {schema['maximum']!r}:")
+                lines.append(f"{inner}    return {path + ' must be <= ' + repr(schema['maximum'])!r}")
+        
+        if "required" in schema or "properties" in schema:
+            inner = guarded("object")
+            inner_depth = len(inner) // 4
+            for key in schema.get("required", ()):
+                lines.append(f"{inner}if {key!r} not in {var}:")
+                lines.append(f"{inner}    return {path + ' must contain ' + repr(key)!r}")
+            for key, sub in schema.get("properties", {}).items():
+                sub_var = new_var()
+                lines.append(f"{inner}if {key!r} in {var}:")
+                lines.append(f"{inner}    {sub_var} = {var}[{key!r}]")
+                emit(sub, sub_var, f"{path}.{key}", inner_depth + 1)
+        
+        if "minItems" in schema or "maxItems" in schema or "items" in schema:
+            inner = guarded("array")
+            inner_depth = len(inner) // 4
+            if "minItems" in schema:
+                lines.append(f"{inner}if len({var}) < {schema['minItems']}:")
+                lines.append(f"{inner}    return {path + ' must contain at least ' + str(schema['minItems']) + ' items'!r}")
+            if "maxItems" in schema:
+                lines.append(f"{inner}if len({var}) > {schema['maxItems']}:")
+                lines.append(f"{inner}    return {path + ' must contain at most ' + str(schema['maxItems']) + ' items'!r}")
+            if "items" in schema:
+                item_var = new_var()
+                lines.append(f"{inner}for {item_var} in {var}:")
+                emit(schema["items"], item_var, f"{path}[]", inner_depth + 1)
+        
+        # Bloc vide (schéma sans contrainte) : instruction neutre
+        if lines[-1].endswith(":"):
+            lines.append(f"{pad}    pass")
+    
+    emit(schema, "data", "data", 1)
+    lines.append("    return None")
+    
+    namespace: Dict = {}
+    exec(compile("\n".join(lines), f"<schema:{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+# Sidecar msgpack à accès aléatoire paresseux (optionnel) : seules les frames
+# lues sont décodées (mode --sample)
+try:
+    from msglc import LazyReader, dump as msglc_dump, to_obj as msglc_to_obj
+    from msglc.reader import LazyList
+except ImportError:
+    msglc_dump = None
+
+# Numba optionnel : noyau JIT parallèle des bornes numériques, sinon repli NumPy
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Bits de _range_flags_kernel (Pose)
+POSE_FLAG_NOT_FINITE = 1
+POSE_FLAG_VISIBILITY = 2
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True, fastmath=False)
+    def _range_flags_kernel(ratios, coords):
+        """
+        Bornes numériques en code natif, parallélisé sur les frames
+        (fastmath=False : les comparaisons doivent rester fiables sur NaN)
+        
+        Args:
+            ratios: (M,) mouth_open_ratio
+            coords: (N, 33, 4) [x, y, z, visibility]
+            
+        Returns:
+            (ratio_bad (M,) uint8, pose_flags (N,) uint8)
+        """
+        ratio_bad = np.zeros(ratios.shape[0], np.uint8)
+        for i in numba.prange(ratios.shape[0]):
+            r = ratios[i]
+            if not (0.0 <= r <= 1.0):
+                ratio_bad[i] = 1
+        
+        pose_flags = np.zeros(coords.shape[0], np.uint8)
+        for i in numba.prange(coords.shape[0]):
+            flags = 0
+            for j in range(coords.shape[1]):
+                if not (math.isfinite(coords[i, j, 0]) and math.isfinite(coords[i, j, 1])
+                        and math.isfinite(coords[i, j, 2])):
+                    flags |= 1
+                v = coords[i, j, 3]
+                if not (0.0 <= v <= 1.0):
+                    flags |= 2
+            pose_flags[i] = flags
+        return ratio_bad, pose_flags
+else:
+    _range_flags_kernel = None
+
+
+# Marqueurs de succès (un fichier par JSON validé, contenu = empreinte blake2b)
+VALIDATOR_CACHE_DIR = Path.home() / ".cache" / "exodus" / "validator"
+
+
+# ----------------------------------------------------------------------
+#  SCHÉMAS JSON (transcription de SEGMENT_01/SCHEMA_JSON_DNA.md)
+#  Seules les conditions d'ERREUR structurelles sont encodées ; les bornes
+#  numériques (mouth_open_ratio, coordonnées Pose) sont vérifiées en une
+#  passe NumPy sur toutes les frames, et les avertissements (sections
+#  absentes, fps <= 0, résolution incomplète) restent en Python.
+# ----------------------------------------------------------------------
+ROOT_SCHEMA = {
+    "type": "object",
+    "required": ["session_id", "timestamp"],
+}
+
+FACE_LANDMARKS_SCHEMA = {
+    "type": "object",
+    "required": ["upper_lip_center", "lower_lip_center", "mouth_open_ratio"],
+    "properties": {
+        "mouth_open_ratio": {"type": "number"},
+        # PROTOCOLE INNER-LIP : 13 = lèvre supérieure, 14 = lèvre inférieure
+        "upper_lip_center": {
+            "type": ["object", "null"],
+            "required": ["landmark_id"],
+            "properties": {"landmark_id": {"const": 13}},
+        },
+        "lower_lip_center": {
+            "type": ["object", "null"],
+            "required": ["landmark_id"],
+            "properties": {"landmark_id": {"const": 14}},
+        },
+    },
+}
+
+POSE_LANDMARKS_SCHEMA = {
+    "type": "object",
+    "required": ["all_33_landmarks"],
+    "properties": {
+        "all_33_landmarks": {
+            "type": "array",
+            "minItems": 33,
+            "maxItems": 33,
+            "items": {
+                "type": "object",
+                "required": ["x", "y", "z", "visibility", "landmark_id"],
+            },
+        },
+    },
+}
+
+CAMERA_METADATA_SCHEMA = {
+    "type": "object",
+    "required": ["fps"],
+    "properties": {
+        "fps": {"type": "number"},
+    },
+}
+
+# Clés obligatoires (repli manuel) : ensembles construits une fois depuis les
+# schémas, différence d'ensembles en C sur dict.keys()
+ROOT_REQUIRED_KEYS = frozenset(ROOT_SCHEMA["required"])
+FACE_REQUIRED_KEYS = frozenset(FACE_LANDMARKS_SCHEMA["required"])
+POSE_LANDMARK_REQUIRED_KEYS = frozenset(
+    POSE_LANDMARKS_SCHEMA["properties"]["all_33_landmarks"]["items"]["required"]
+)
+CAMERA_REQUIRED_KEYS = frozenset(CAMERA_METADATA_SCHEMA["required"])
+
 
 class EXOValidator:
     """
@@ -20,53 +287,203 @@ class EXOValidator:
     Vérifie la conformité des fichiers et données selon le schéma EXO_DATA_RAW.json
     """
     
-    def __init__(self, project_root: Optional[str] = None):
+    # Attributs fixes : pas de __dict__ par instance (validateurs parallèles par fragment)
+    __slots__ = (
+        "project_root",
+        "errors",
+        "warnings",
+        "success_count",
+        "frames_validated",
+        "verbose_stream",
+        "_out_buf",
+        "_schema_checks",
+        "fail_fast",
+        "jobs",
+        "use_cache",
+        "sample",
+    )
+    
+    # Emplacements du JSON de données brutes, relatifs à project_root (par ordre de priorité)
+    JSON_CANDIDATES = (
+        "Extraction_Data/mission_RAW.json",
+        "01_EYE_INQUISITION/EXO_DATA_RAW.json",
+        "EXO_DATA_RAW.json",
+        "SEGMENT_01/EXO_DATA_RAW.json",
+    )
+    
+    def __init__(self, project_root: Optional[str] = None, verbose_stream: Optional[bool] = None,
+                 fail_fast: bool = False, jobs: int = 1, use_cache: bool = True,
+                 sample: Optional[int] = None):
         """
         Initialise le validateur
         
         Args:
             project_root: Racine du projet (défaut: répertoire actuel)
+            verbose_stream: True = affichage ligne à ligne, False = sortie tamponnée
+                            écrite en une fois (défaut: ligne à ligne si terminal)
+            fail_fast: Arrêt à la première frame en erreur (CI : "est-ce cassé ?")
+            jobs: Nombre de processus pour la validation des frames (1 = séquentiel)
+            use_cache: Réutilise le verdict d'un fichier inchangé (VALIDATOR_CACHE_DIR)
+            sample: Ne valide que K frames tirées au hasard (contrôle rapide), None = toutes
         """
         if project_root:
             self.project_root = Path(project_root)
         else:
-            # Cherche la racine EXODUS_SYSTEM
-            current = Path(__file__).resolve().parent
-            while current.name != "EXODUS_SYSTEM" and current.parent != current:
-                current = current.parent
-            self.project_root = current if current.name == "EXODUS_SYSTEM" else Path.cwd()
+            # Cherche la racine EXODUS_SYSTEM (répertoire du script puis ses parents)
+            start = Path(__file__).resolve().parent
+            self.project_root = next(
+                (p for p in (start, *start.parents) if p.name == "EXODUS_SYSTEM"),
+                Path.cwd(),
+            )
         
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.success_count = 0
+        self.frames_validated = 0
+        
+        # Sortie : terminal interactif en direct, CI / redirection tamponnée
+        self.verbose_stream = sys.stdout.isatty() if verbose_stream is None else verbose_stream
+        self._out_buf: List[str] = []
+        self.fail_fast = fail_fast
+        self.jobs = max(1, jobs)
+        self.use_cache = use_cache
+        self.sample = sample
+        
+        # Validateurs compilés une seule fois (None = vérifications manuelles)
+        self._schema_checks = self._compile_schema_checks()
         
+    @staticmethod
+    def _compile_schema_checks() -> Optional[Dict]:
+        """
+        Compile les schémas avec fastjsonschema, ou à défaut jsonschema
+        (validateur instancié une fois, réutilisé pour toutes les frames),
+        ou à défaut par génération de code (_generate_schema_check)
+        
+        Returns:
+            Dictionnaire section -> fonction(obj) retournant un message d'erreur ou None
+        """
+        if fastjsonschema is not None:
+            def wrap(schema: Dict):
+                validate = fastjsonschema.compile(schema)
+                
+                def check(obj) -> Optional[str]:
+                    try:
+                        validate(obj)
+                    except fastjsonschema.JsonSchemaException as e:
+                        return e.message
+                    return None
+                return check
+        elif jsonschema is not None:
+            def wrap(schema: Dict):
+                cls = jsonschema.validators.validator_for(schema)
+                cls.check_schema(schema)
+                validator = cls(schema)
+                
+                def check(obj) -> Optional[str]:
+                    err = next(validator.iter_errors(obj), None)
+                    if err is None:
+                        return None
+                    # Message compact : err.message recopie l'instance entière (33 landmarks...)
+                    return f"{err.validator}={err.validator_value!r} at {list(err.absolute_path)}"
+                return check
+        else:
+            # Vérificateurs générés depuis les schémas ; sinon vérifications manuelles
+            try:
+                return {
+                    section: _generate_schema_check(schema, f"check_{section}")
+                    for section, schema in (
+                        ("root", ROOT_SCHEMA),
+                        ("face", FACE_LANDMARKS_SCHEMA),
+                        ("pose", POSE_LANDMARKS_SCHEMA),
+                        ("camera", CAMERA_METADATA_SCHEMA),
+                    )
+                }
+            except ValueError:
+                return None
+        
+        return {
+            "root": wrap(ROOT_SCHEMA),
+            "face": wrap(FACE_LANDMARKS_SCHEMA),
+            "pose": wrap(POSE_LANDMARKS_SCHEMA),
+            "camera": wrap(CAMERA_METADATA_SCHEMA),
+        }
+        
+    def emit(self, line: str = ""):
+        """Affiche une ligne (ou la met en tampon si verbose_stream est désactivé)"""
+        if self.verbose_stream:
+            print(line)
+        else:
+            self._out_buf.append(line)
+    
+    def flush_output(self):
+        """Écrit la sortie tamponnée en un seul appel"""
+        if self._out_buf:
+            sys.stdout.write("\n".join(self._out_buf))
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            self._out_buf.clear()
+    
     def log_error(self, message: str):
         """Enregistre une erreur"""
         self.errors.append(message)
-        print(f"[ERROR] : {message}")
+        self.emit(f"[ERROR] : {message}")
     
     def log_warning(self, message: str):
         """Enregistre un avertissement"""
         self.warnings.append(message)
-        print(f"[WARNING] : {message}")
+        self.emit(f"[WARNING] : {message}")
+    
+    def _ok(self):
+        """Succès de boucle chaude : compteur seul, sans affichage (résumé en fin de validation)"""
+        self.success_count += 1
+        self.frames_validated += 1
     
     def log_success(self, message: str):
         """Enregistre un succès"""
         self.success_count += 1
-        print(f"[SUCCESS] : {message}")
+        self.emit(f"[SUCCESS] : {message}")
     
-    def check_file_exists(self, file_path: Path, description: str) -> bool:
+    @staticmethod
+    def existing_paths(paths: Iterable[Path]) -> Set[Path]:
+        """
+        Sonde l'existence de plusieurs chemins avec un seul os.scandir par
+        répertoire parent (au lieu d'un stat() par chemin)
+        
+        Args:
+            paths: Chemins candidats
+            
+        Returns:
+            Sous-ensemble des chemins existants
+        """
+        by_parent: Dict[Path, Set[str]] = defaultdict(set)
+        for path in paths:
+            by_parent[path.parent].add(path.name)
+        
+        present: Set[Path] = set()
+        for parent, names in by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    found = {entry.name for entry in entries} & names
+            except OSError:
+                continue  # Répertoire absent ou illisible
+            present.update(parent / name for name in found)
+        return present
+    
+    def check_file_exists(self, file_path: Path, description: str, exists: Optional[bool] = None) -> bool:
         """
         Vérifie l'existence d'un fichier
         
         Args:
             file_path: Chemin du fichier
             description: Description du fichier pour les messages
+            exists: Résultat déjà sondé (existing_paths), None = stat() du fichier
             
         Returns:
             True si le fichier existe, False sinon
         """
-        if not file_path.exists():
+        if exists is None:
+            exists = file_path.exists()
+        if not exists:
             self.log_error(f"Fichier manquant : {description} ({file_path})")
             return False
         self.log_success(f"Fichier présent : {description}")
@@ -79,9 +496,9 @@ class EXOValidator:
         Returns:
             True si tous les fichiers sont présents
         """
-        print("\n" + "="*60)
-        print("ÉTAPE 1 : VÉRIFICATION DES FICHIERS REQUIS")
-        print("="*60)
+        self.emit("\n" + "="*60)
+        self.emit("ÉTAPE 1 : VÉRIFICATION DES FICHIERS REQUIS")
+        self.emit("="*60)
         
         all_present = True
         
@@ -91,18 +508,20 @@ class EXOValidator:
              "EXO_01_DNA_SCANNER.py (Scanner DNA)"),
         ]
         
-        for file_path, description in required_py_files:
-            if not self.check_file_exists(file_path, description):
-                all_present = False
-        
         # Fichiers JSON requis (schéma)
         required_schema = [
             (self.project_root / "SEGMENT_01" / "SCHEMA_JSON_DNA.md",
              "SCHEMA_JSON_DNA.md (Schéma de données)"),
         ]
         
+        present = self.existing_paths(path for path, _ in required_py_files + required_schema)
+        
+        for file_path, description in required_py_files:
+            if not self.check_file_exists(file_path, description, file_path in present):
+                all_present = False
+        
         for file_path, description in required_schema:
-            if not self.check_file_exists(file_path, description):
+            if not self.check_file_exists(file_path, description, file_path in present):
                 all_present = False
         
         return all_present
@@ -114,44 +533,52 @@ class EXOValidator:
         Returns:
             Chemin du fichier JSON trouvé, None sinon
         """
-        # Chemins possibles (par ordre de priorité)
-        possible_paths = [
-            self.project_root / "Extraction_Data" / "mission_RAW.json",
-            self.project_root / "01_EYE_INQUISITION" / "EXO_DATA_RAW.json",
-            self.project_root / "EXO_DATA_RAW.json",
-            self.project_root / "SEGMENT_01" / "EXO_DATA_RAW.json",
-        ]
+        candidates = [self.project_root / rel for rel in self.JSON_CANDIDATES]
+        present = self.existing_paths(candidates)
         
-        for path in possible_paths:
-            if path.exists():
-                return path
-        
-        return None
+        # Premier candidat présent, dans l'ordre de priorité
+        return next((path for path in candidates if path in present), None)
     
-    def validate_mouth_open_ratio(self, ratio: float, frame_num: int) -> bool:
+    def validate_numeric_ranges(self, ratio_frames: List[int], ratios: List[float],
+                                pose_frames: List[int], pose_coords: List[np.ndarray]) -> Set[int]:
         """
-        Vérifie que mouth_open_ratio est entre 0.0 et 1.0
+        Vérifie les bornes numériques de toutes les frames en une passe vectorisée :
+        mouth_open_ratio dans [0.0, 1.0], coordonnées Pose finies, visibility dans [0.0, 1.0]
         
         Args:
-            ratio: Valeur du ratio
-            frame_num: Numéro de frame pour les messages
+            ratio_frames: Numéros des frames dont le ratio a été collecté
+            ratios: Valeurs de mouth_open_ratio
+            pose_frames: Numéros des frames dont la Pose a été collectée
+            pose_coords: Tableaux (33, 4) [x, y, z, visibility] par frame
             
         Returns:
-            True si valide
+            Numéros des frames hors limites (vide si valide)
         """
-        if ratio is None:
-            self.log_error(f"Frame {frame_num} : mouth_open_ratio est None")
-            return False
+        values = np.fromiter(ratios, dtype=np.float64, count=len(ratios))
+        coords = np.stack(pose_coords) if pose_coords else np.empty((0, 33, 4))  # (N, 33, 4)
         
-        if not isinstance(ratio, (int, float)):
-            self.log_error(f"Frame {frame_num} : mouth_open_ratio n'est pas un nombre ({type(ratio)})")
-            return False
+        if _range_flags_kernel is not None:
+            ratio_bad, pose_flags = _range_flags_kernel(values, coords)
+            ratio_bad = ratio_bad.astype(bool)
+        else:
+            # NaN échoue aux deux comparaisons : on nie l'intervalle valide
+            ratio_bad = ~((values >= 0.0) & (values <= 1.0))
+            visibility = coords[..., 3]
+            pose_flags = (
+                np.where(np.isfinite(coords[..., :3]).all(axis=(1, 2)), 0, POSE_FLAG_NOT_FINITE)
+                | np.where(((visibility >= 0.0) & (visibility <= 1.0)).all(axis=1), 0, POSE_FLAG_VISIBILITY)
+            )
         
-        if ratio < 0.0 or ratio > 1.0:
-            self.log_error(f"Frame {frame_num} : mouth_open_ratio hors limites ({ratio:.4f} - doit être entre 0.0 et 1.0)")
-            return False
+        for i in np.flatnonzero(ratio_bad):
+            self.log_error(f"Frame {ratio_frames[i]} : mouth_open_ratio hors limites ({values[i]:.4f} - doit être entre 0.0 et 1.0)")
+        for i in np.flatnonzero(pose_flags & POSE_FLAG_NOT_FINITE):
+            self.log_error(f"Frame {pose_frames[i]} : coordonnées Pose non finies (NaN/Inf)")
+        for i in np.flatnonzero(pose_flags & POSE_FLAG_VISIBILITY):
+            self.log_error(f"Frame {pose_frames[i]} : visibility Pose hors limites (doit être entre 0.0 et 1.0)")
         
-        return True
+        bad_frames = {ratio_frames[i] for i in np.flatnonzero(ratio_bad)}
+        bad_frames.update(pose_frames[i] for i in np.flatnonzero(pose_flags))
+        return bad_frames
     
     def validate_pose_landmarks(self, pose_landmarks: Dict, frame_num: int) -> bool:
         """
@@ -168,6 +595,13 @@ class EXOValidator:
             self.log_warning(f"Frame {frame_num} : pose_landmarks est vide ou None")
             return False
         
+        if self._schema_checks is not None:
+            error = self._schema_checks["pose"](pose_landmarks)
+            if error:
+                self.log_error(f"Frame {frame_num} : pose_landmarks invalide ({error})")
+                return False
+            return True
+        
         all_landmarks = pose_landmarks.get("all_33_landmarks", [])
         
         if not isinstance(all_landmarks, list):
@@ -181,11 +615,10 @@ class EXOValidator:
         
         # Vérification de la structure de chaque landmark
         for idx, landmark in enumerate(all_landmarks):
-            required_keys = ["x", "y", "z", "visibility", "landmark_id"]
-            for key in required_keys:
-                if key not in landmark:
-                    self.log_error(f"Frame {frame_num}, Landmark {idx} : Clé manquante '{key}'")
-                    return False
+            missing = POSE_LANDMARK_REQUIRED_KEYS.difference(landmark)
+            if missing:
+                self.log_error(f"Frame {frame_num}, Landmark {idx} : Clés manquantes {sorted(missing)}")
+                return False
         
         return True
     
@@ -204,15 +637,20 @@ class EXOValidator:
             self.log_error(f"Frame {frame_num} : camera_metadata est vide ou None")
             return False
         
-        if "fps" not in camera_metadata:
-            self.log_error(f"Frame {frame_num} : Métadonnée 'fps' manquante dans camera_metadata")
+        if self._schema_checks is not None:
+            error = self._schema_checks["camera"](camera_metadata)
+            if error:
+                self.log_error(f"Frame {frame_num} : camera_metadata invalide ({error})")
+                return False
+        elif not CAMERA_REQUIRED_KEYS.issubset(camera_metadata):
+            for key in sorted(CAMERA_REQUIRED_KEYS.difference(camera_metadata)):
+                self.log_error(f"Frame {frame_num} : Métadonnée '{key}' manquante dans camera_metadata")
             return False
-        
-        fps = camera_metadata["fps"]
-        if not isinstance(fps, (int, float)):
-            self.log_error(f"Frame {frame_num} : fps n'est pas un nombre ({type(fps)})")
+        elif not isinstance(camera_metadata["fps"], (int, float)):
+            self.log_error(f"Frame {frame_num} : fps n'est pas un nombre ({type(camera_metadata['fps'])})")
             return False
         
+        fps = camera_metadata["fps"]
         if fps <= 0:
             self.log_warning(f"Frame {frame_num} : fps invalide ({fps})")
         
@@ -239,26 +677,40 @@ class EXOValidator:
             self.log_warning(f"Frame {frame_num} : face_landmarks est vide ou None")
             return False
         
-        # Vérification des landmarks critiques (13-14)
-        required_keys = ["upper_lip_center", "lower_lip_center", "mouth_open_ratio"]
-        for key in required_keys:
-            if key not in face_landmarks:
-                self.log_error(f"Frame {frame_num} : Clé manquante '{key}' dans face_landmarks")
+        if self._schema_checks is not None:
+            error = self._schema_checks["face"](face_landmarks)
+            if error:
+                self.log_error(f"Frame {frame_num} : face_landmarks invalide ({error})")
                 return False
+            return True
+        
+        # Vérification des landmarks critiques (13-14) : accès direct sur le chemin
+        # nominal, différence d'ensembles seulement pour le message d'erreur
+        try:
+            upper_lip = face_landmarks["upper_lip_center"]
+            lower_lip = face_landmarks["lower_lip_center"]
+            ratio = face_landmarks["mouth_open_ratio"]
+        except KeyError:
+            missing = FACE_REQUIRED_KEYS.difference(face_landmarks)
+            self.log_error(f"Frame {frame_num} : Clés manquantes {sorted(missing)} dans face_landmarks")
+            return False
+        
+        # Vérification mouth_open_ratio (type ; bornes : validate_numeric_ranges)
+        if ratio is None:
+            self.log_error(f"Frame {frame_num} : mouth_open_ratio est None")
+            return False
         
-        # Vérification mouth_open_ratio
-        if not self.validate_mouth_open_ratio(face_landmarks["mouth_open_ratio"], frame_num):
+        if not isinstance(ratio, (int, float)) or isinstance(ratio, bool):
+            self.log_error(f"Frame {frame_num} : mouth_open_ratio n'est pas un nombre ({type(ratio)})")
             return False
         
         # Vérification upper_lip_center (landmark 13)
-        upper_lip = face_landmarks.get("upper_lip_center")
         if upper_lip:
             if upper_lip.get("landmark_id") != 13:
                 self.log_error(f"Frame {frame_num} : upper_lip_center doit avoir landmark_id=13 (trouvé: {upper_lip.get('landmark_id')})")
                 return False
         
         # Vérification lower_lip_center (landmark 14)
-        lower_lip = face_landmarks.get("lower_lip_center")
         if lower_lip:
             if lower_lip.get("landmark_id") != 14:
                 self.log_error(f"Frame {frame_num} : lower_lip_center doit avoir landmark_id=14 (trouvé: {lower_lip.get('landmark_id')})")
@@ -266,6 +718,179 @@ class EXOValidator:
         
         return True
     
+    def validate_root_keys(self, data: Dict) -> bool:
+        """
+        Vérifie les clés principales (session_id, timestamp)
+        
+        Args:
+            data: Données JSON (ou en-têtes de premier niveau en mode flux)
+            
+        Returns:
+            True si valide
+        """
+        valid = True
+        if self._schema_checks is not None:
+            error = self._schema_checks["root"](data)
+            if error:
+                self.log_error(f"Structure principale invalide : {error}")
+                valid = False
+        else:
+            for key in sorted(ROOT_REQUIRED_KEYS.difference(data)):
+                self.log_error(f"Clé principale manquante : '{key}'")
+                valid = False
+        return valid
+    
+    def check_frame(self, idx: int, frame: Dict) -> Tuple[int, bool, Optional[float], Optional[np.ndarray]]:
+        """
+        Valide la structure d'une frame et extrait ses valeurs numériques
+        
+        Args:
+            idx: Position de la frame dans la liste
+            frame: Données de la frame
+            
+        Returns:
+            (numéro de frame, True si valide, mouth_open_ratio ou None, tableau Pose (33, 4) ou None)
+        """
+        valid = True
+        ratio = None
+        pose = None
+        frame_num = frame.get("frame_number", idx)
+        
+        # Validation face_landmarks
+        if "face_landmarks" in frame:
+            if self.validate_face_landmarks(frame["face_landmarks"], frame_num):
+                ratio = frame["face_landmarks"]["mouth_open_ratio"]
+            else:
+                valid = False
+        else:
+            self.log_warning(f"Frame {frame_num} : face_landmarks manquant")
+        
+        # Validation pose_landmarks
+        if "pose_landmarks" in frame:
+            if self.validate_pose_landmarks(frame["pose_landmarks"], frame_num):
+                try:
+                    pose = np.array(
+                        [(lm["x"], lm["y"], lm["z"], lm["visibility"])
+                         for lm in frame["pose_landmarks"]["all_33_landmarks"]],
+                        dtype=np.float64,
+                    )
+                except (TypeError, ValueError):
+                    self.log_error(f"Frame {frame_num} : coordonnées Pose non numériques")
+                    valid = False
+            else:
+                valid = False
+        else:
+            self.log_warning(f"Frame {frame_num} : pose_landmarks manquant")
+        
+        # Validation camera_metadata
+        if "camera_metadata" in frame:
+            if not self.validate_camera_metadata(frame["camera_metadata"], frame_num):
+                valid = False
+        else:
+            self.log_error(f"Frame {frame_num} : camera_metadata manquant")
+            valid = False
+        
+        return frame_num, valid, ratio, pose
+    
+    def validate_frames(self, frames: Iterable[Dict], indices: Optional[Iterable[int]] = None) -> Tuple[bool, int]:
+        """
+        Valide les frames une à une (liste en mémoire, flux ijson ou sidecar msgpack)
+        
+        Args:
+            frames: Itérable de frames
+            indices: Positions d'origine des frames (échantillon), défaut 0..N-1
+            
+        Returns:
+            (True si toutes les frames sont valides, nombre de frames)
+        """
+        self.emit("\n" + "-"*60)
+        self.emit("VALIDATION FRAME PAR FRAME")
+        self.emit("-"*60)
+        
+        valid = True
+        count = 0
+        # Valeurs numériques collectées pour la passe vectorisée (structure déjà validée)
+        ratio_frames: List[int] = []
+        ratios: List[float] = []
+        pose_frames: List[int] = []
+        pose_coords: List[np.ndarray] = []
+        # Frames déjà en échec structurel (non comptées comme validées)
+        failed_frames: Set[int] = set()
+        
+        def check_ranges() -> bool:
+            """Passe vectorisée des bornes sur les frames lues ; False si une borne est violée"""
+            bad_frames = self.validate_numeric_ranges(ratio_frames, ratios, pose_frames, pose_coords)
+            # Structure correcte mais bornes violées : ces frames ne sont pas validées
+            demoted = len(bad_frames - failed_frames)
+            self.success_count -= demoted
+            self.frames_validated -= demoted
+            return not bad_frames
+        
+        items = enumerate(frames) if indices is None else zip(indices, frames)
+        if self.jobs > 1:
+            # Frames réparties sur N processus ; journal rejoué ici dans l'ordre des frames
+            pool = mp.Pool(self.jobs, initializer=_init_frame_worker)
+            results = pool.imap(_validate_one_frame, items, chunksize=FRAME_CHUNKSIZE)
+        else:
+            pool = None
+            results = (self.check_frame(idx, frame) for idx, frame in items)
+        
+        try:
+            for result in results:
+                if pool is not None:
+                    frame_num, frame_ok, ratio, pose, events = result
+                    for level, message in events:
+                        if level == "error":
+                            self.log_error(message)
+                        else:
+                            self.log_warning(message)
+                else:
+                    frame_num, frame_ok, ratio, pose = result
+                count += 1
+                
+                if ratio is not None:
+                    ratio_frames.append(frame_num)
+                    ratios.append(ratio)
+                if pose is not None:
+                    pose_frames.append(frame_num)
+                    pose_coords.append(pose)
+                
+                if frame_ok:
+                    self._ok()
+                else:
+                    valid = False
+                    failed_frames.add(frame_num)
+                    # Mode fail-fast : inutile de parcourir le reste de la mission,
+                    # mais les frames déjà lues passent quand même le contrôle des bornes
+                    if self.fail_fast:
+                        self.log_warning(f"Mode fail-fast : arrêt à la frame {frame_num}")
+                        check_ranges()
+                        return False, count
+        finally:
+            if pool is not None:
+                pool.terminate()
+        
+        if not check_ranges():
+            valid = False
+        
+        return valid, count
+    
+    def sample_indices(self, total: int) -> Optional[List[int]]:
+        """
+        Tire l'échantillon de frames du mode --sample
+        
+        Args:
+            total: Nombre total de frames
+            
+        Returns:
+            Positions triées des frames à valider, None = toutes
+        """
+        if self.sample is None or self.sample >= total:
+            return None
+        indices = sorted(random.sample(range(total), self.sample))
+        self.log_warning(f"Mode échantillon : {len(indices)} frames sur {total}")
+        return indices
+    
     def validate_json_structure(self, data: Dict) -> bool:
         """
         Valide la structure complète du JSON
@@ -276,18 +901,14 @@ class EXOValidator:
         Returns:
             True si la structure est valide
         """
-        print("\n" + "="*60)
-        print("ÉTAPE 2 : VALIDATION DE LA STRUCTURE JSON")
-        print("="*60)
-        
-        valid = True
+        self.emit("\n" + "="*60)
+        self.emit("ÉTAPE 2 : VALIDATION DE LA STRUCTURE JSON")
+        self.emit("="*60)
         
         # Vérification des clés principales
-        required_top_keys = ["session_id", "timestamp"]
-        for key in required_top_keys:
-            if key not in data:
-                self.log_error(f"Clé principale manquante : '{key}'")
-                valid = False
+        valid = self.validate_root_keys(data)
+        if self.fail_fast and not valid:
+            return False
         
         # Vérification des frames
         if "frames" in data:
@@ -298,40 +919,91 @@ class EXOValidator:
             else:
                 self.log_success(f"Nombre de frames détectées : {len(frames)}")
                 
-                # Validation de chaque frame
-                print("\n" + "-"*60)
-                print("VALIDATION FRAME PAR FRAME")
-                print("-"*60)
-                
-                for idx, frame in enumerate(frames):
-                    frame_num = frame.get("frame_number", idx)
-                    
-                    # Validation face_landmarks
-                    if "face_landmarks" in frame:
-                        if not self.validate_face_landmarks(frame["face_landmarks"], frame_num):
-                            valid = False
-                    else:
-                        self.log_warning(f"Frame {frame_num} : face_landmarks manquant")
-                    
-                    # Validation pose_landmarks
-                    if "pose_landmarks" in frame:
-                        if not self.validate_pose_landmarks(frame["pose_landmarks"], frame_num):
-                            valid = False
-                    else:
-                        self.log_warning(f"Frame {frame_num} : pose_landmarks manquant")
-                    
-                    # Validation camera_metadata
-                    if "camera_metadata" in frame:
-                        if not self.validate_camera_metadata(frame["camera_metadata"], frame_num):
-                            valid = False
-                    else:
-                        self.log_error(f"Frame {frame_num} : camera_metadata manquant")
-                        valid = False
+                # Validation de chaque frame (ou d'un échantillon)
+                indices = self.sample_indices(len(frames))
+                if indices is None:
+                    frames_ok, _ = self.validate_frames(frames)
+                else:
+                    frames_ok, _ = self.validate_frames((frames[i] for i in indices), indices)
+                valid = valid and frames_ok
         else:
             self.log_warning("Aucune frame trouvée dans le JSON (fichier vide ou structure différente)")
         
         return valid
     
+    @staticmethod
+    def scan_top_level(f) -> Tuple[Dict, Optional[str], int]:
+        """
+        Premier passage ijson (tokenisation complète, sans construire d'objets) :
+        relève les valeurs scalaires de premier niveau, le type de 'frames' et
+        le nombre de frames. Lève ijson.JSONError si la syntaxe est invalide.
+        
+        Returns:
+            (en-têtes de premier niveau, événement ouvrant 'frames' ou None, nombre de frames)
+        """
+        top_level: Dict = {}
+        frames_event = None
+        frame_count = 0
+        current_key = None
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "frames.item":
+                # Ouverture de chaque élément ('map_key' et 'end_*' partagent ce préfixe)
+                if event in ("start_map", "start_array", "string", "number", "boolean", "null"):
+                    frame_count += 1
+            elif prefix == "" and event == "map_key":
+                current_key = value
+                top_level[current_key] = None
+            elif prefix == current_key and current_key is not None:
+                if current_key == "frames" and frames_event is None:
+                    frames_event = event
+                elif event in ("string", "number", "boolean", "null"):
+                    top_level[current_key] = value
+        return top_level, frames_event, frame_count
+    
+    def validate_json_stream(self, json_path: Path, top_level: Dict, frames_event: Optional[str],
+                             frame_count: int) -> bool:
+        """
+        Valide la structure en flux (ijson) : une seule frame en mémoire à la fois
+        
+        Args:
+            json_path: Chemin du JSON
+            top_level: En-têtes de premier niveau (voir scan_top_level)
+            frames_event: Événement ouvrant 'frames' ('start_array' si liste)
+            frame_count: Nombre de frames relevé au premier passage
+            
+        Returns:
+            True si la structure est valide
+        """
+        self.emit("\n" + "="*60)
+        self.emit("ÉTAPE 2 : VALIDATION DE LA STRUCTURE JSON (flux)")
+        self.emit("="*60)
+        
+        valid = self.validate_root_keys(top_level)
+        if self.fail_fast and not valid:
+            return False
+        
+        if frames_event is None:
+            self.log_warning("Aucune frame trouvée dans le JSON (fichier vide ou structure différente)")
+        elif frames_event != "start_array":
+            self.log_error("'frames' n'est pas une liste")
+            valid = False
+        else:
+            indices = self.sample_indices(frame_count)
+            with open(json_path, 'rb') as f:
+                frames = ijson.items(f, "frames.item", use_float=True)
+                if indices is None:
+                    frames_ok, count = self.validate_frames(frames)
+                else:
+                    # Accès séquentiel : les frames hors échantillon sont lues mais non validées
+                    wanted = set(indices)
+                    frames_ok, count = self.validate_frames(
+                        (frame for idx, frame in enumerate(frames) if idx in wanted), indices
+                    )
+            self.log_success(f"Nombre de frames détectées : {frame_count if indices else count}")
+            valid = valid and frames_ok
+        
+        return valid
+    
     def validate_data_json(self) -> bool:
         """
         Valide le fichier JSON de données brutes
@@ -339,42 +1011,166 @@ class EXOValidator:
         Returns:
             True si le fichier est valide
         """
-        print("\n" + "="*60)
-        print("ÉTAPE 2 : VALIDATION DU FICHIER JSON DE DONNÉES")
-        print("="*60)
+        self.emit("\n" + "="*60)
+        self.emit("ÉTAPE 2 : VALIDATION DU FICHIER JSON DE DONNÉES")
+        self.emit("="*60)
         
         json_path = self.find_data_json()
         
         if not json_path:
             self.log_error("Fichier JSON de données brutes introuvable")
             self.log_warning("Chemins recherchés :")
-            possible_paths = [
-                "Extraction_Data/mission_RAW.json",
-                "01_EYE_INQUISITION/EXO_DATA_RAW.json",
-                "EXO_DATA_RAW.json",
-                "SEGMENT_01/EXO_DATA_RAW.json",
-            ]
-            for path in possible_paths:
-                self.log_warning(f"  - {path}")
+            for rel in self.JSON_CANDIDATES:
+                self.log_warning(f"  - {rel}")
             return False
         
         self.log_success(f"Fichier JSON trouvé : {json_path}")
         
+        # Verdict en cache : fichier inchangé depuis la dernière validation réussie
+        marker = self.verdict_marker(json_path) if self.use_cache else None
+        digest = None
+        if marker is not None and marker.exists():
+            digest = self.file_digest(json_path)
+            if marker.read_text(encoding="utf-8").strip() == digest:
+                self.log_success("Validation en cache : fichier inchangé depuis le dernier succès")
+                return True
+        
+        valid = self.validate_json_file(json_path)
+        
+        # Un échantillon réussi ne vaut pas validation complète : pas de marqueur
+        if valid and marker is not None and self.sample is None:
+            try:
+                marker.parent.mkdir(parents=True, exist_ok=True)
+                marker.write_text(digest or self.file_digest(json_path), encoding="utf-8")
+            except OSError as e:
+                self.log_warning(f"Cache de validation non écrit : {e}")
+        
+        return valid
+    
+    def verdict_marker(self, json_path: Path) -> Optional[Path]:
+        """
+        Chemin du marqueur de succès pour ce fichier, clé = (chemin, mtime_ns, taille)
+        + signature du validateur (toute modification de ce script invalide le cache)
+        
+        Returns:
+            Chemin du marqueur, None si le fichier est inaccessible
+        """
+        try:
+            st = json_path.stat()
+            own = Path(__file__).stat()
+        except OSError:
+            return None
+        key = f"{json_path.resolve()}|{st.st_mtime_ns}|{st.st_size}|{own.st_mtime_ns}|{own.st_size}"
+        name = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return VALIDATOR_CACHE_DIR / f"{name}.ok"
+    
+    @staticmethod
+    def file_digest(path: Path) -> str:
+        """Empreinte blake2b du contenu (lecture par blocs de 1 Mo)"""
+        h = hashlib.blake2b(digest_size=32)
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        return h.hexdigest()
+    
+    def validate_json_file(self, json_path: Path) -> bool:
+        """
+        Analyse et valide un fichier JSON de données (flux ijson ou chargement complet)
+        
+        Args:
+            json_path: Chemin du JSON
+            
+        Returns:
+            True si le fichier est valide
+        """
+        # Sidecar msgpack plus récent que le JSON : accès aléatoire sans reparser
+        msg_path = json_path.with_suffix(".msg")
+        if (msglc_dump is not None and msg_path.exists()
+                and msg_path.stat().st_mtime_ns >= json_path.stat().st_mtime_ns):
+            return self.validate_msg_sidecar(msg_path)
+        
+        # Mode flux (ijson) : pic mémoire O(une frame) au lieu de O(fichier)
+        if ijson is not None:
+            try:
+                with open(json_path, 'rb') as f:
+                    top_level, frames_event, frame_count = self.scan_top_level(f)
+                self.log_success("Fichier JSON valide (syntaxe correcte)")
+            except ijson.JSONError as e:
+                self.log_error(f"Erreur de syntaxe JSON : {e}")
+                return False
+            except Exception as e:
+                self.log_error(f"Erreur lors de la lecture du fichier : {e}")
+                return False
+            
+            return self.validate_json_stream(json_path, top_level, frames_event, frame_count)
+        
         # Chargement du JSON
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson n'a pas de load() : lecture binaire puis loads()
+            with open(json_path, 'rb') as f:
+                data = _json.loads(f.read())
             self.log_success("Fichier JSON valide (syntaxe correcte)")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, _json.JSONDecodeError) as e:
             self.log_error(f"Erreur de syntaxe JSON : {e}")
             return False
         except Exception as e:
             self.log_error(f"Erreur lors de la lecture du fichier : {e}")
             return False
         
+        # Premier parse réussi : sidecar msgpack pour les exécutions suivantes
+        if msglc_dump is not None:
+            try:
+                msglc_dump(str(msg_path), data)
+                self.log_success(f"Sidecar msgpack écrit : {msg_path.name}")
+            except Exception as e:
+                self.log_warning(f"Sidecar msgpack non écrit : {e}")
+        
         # Validation de la structure
         return self.validate_json_structure(data)
     
+    def validate_msg_sidecar(self, msg_path: Path) -> bool:
+        """
+        Valide la structure depuis le sidecar msgpack paresseux (msglc) :
+        seules les frames parcourues (ou échantillonnées) sont décodées
+        
+        Args:
+            msg_path: Chemin du sidecar .msg
+            
+        Returns:
+            True si la structure est valide
+        """
+        self.emit("\n" + "="*60)
+        self.emit("ÉTAPE 2 : VALIDATION DE LA STRUCTURE JSON (sidecar msgpack)")
+        self.emit("="*60)
+        self.log_success(f"Sidecar msgpack à jour : {msg_path.name}")
+        
+        try:
+            with LazyReader(str(msg_path)) as reader:
+                top_level = {key: msglc_to_obj(reader[key]) for key in ROOT_REQUIRED_KEYS if key in reader}
+                valid = self.validate_root_keys(top_level)
+                if self.fail_fast and not valid:
+                    return False
+                
+                if "frames" not in reader:
+                    self.log_warning("Aucune frame trouvée dans le JSON (fichier vide ou structure différente)")
+                    return valid
+                
+                frames = reader["frames"]
+                if not isinstance(frames, (list, LazyList)):
+                    self.log_error("'frames' n'est pas une liste")
+                    return False
+                
+                total = len(frames)
+                self.log_success(f"Nombre de frames détectées : {total}")
+                indices = self.sample_indices(total)
+                if indices is None:
+                    indices = range(total)
+                frames_ok, _ = self.validate_frames((msglc_to_obj(frames[i]) for i in indices), indices)
+                return valid and frames_ok
+        except Exception as e:
+            self.log_error(f"Erreur lors de la lecture du sidecar msgpack : {e}")
+            return False
+    
     def run_validation(self) -> bool:
         """
         Exécute toutes les validations
@@ -382,56 +1178,108 @@ class EXOValidator:
         Returns:
             True si toutes les validations passent
         """
-        print("\n" + "="*60)
-        print("EXO_01_VALIDATOR - EPREUVE DE FEU")
-        print("Systeme EXODUS - Segment 01 : INQUISITION")
-        print("="*60)
+        self.emit("\n" + "="*60)
+        self.emit("EXO_01_VALIDATOR - EPREUVE DE FEU")
+        self.emit("Systeme EXODUS - Segment 01 : INQUISITION")
+        self.emit("="*60)
         
         # Étape 1 : Vérification des fichiers
         files_ok = self.check_required_files()
         
         # Étape 2 : Validation du JSON (si présent)
-        json_ok = self.validate_data_json()
+        if self.fail_fast and not files_ok:
+            json_ok = False
+        else:
+            json_ok = self.validate_data_json()
         
         # Résumé
-        print("\n" + "="*60)
-        print("RÉSUMÉ DE LA VALIDATION")
-        print("="*60)
+        self.emit("\n" + "="*60)
+        self.emit("RÉSUMÉ DE LA VALIDATION")
+        self.emit("="*60)
         
         total_checks = self.success_count + len(self.errors) + len(self.warnings)
-        print(f"Total de vérifications : {total_checks}")
-        print(f"Succès : {self.success_count}")
-        print(f"Erreurs : {len(self.errors)}")
-        print(f"Avertissements : {len(self.warnings)}")
+        self.emit(f"Total de vérifications : {total_checks}")
+        self.emit(f"Succès : {self.success_count}")
+        self.emit(f"Frames validées : {self.frames_validated}")
+        self.emit(f"Erreurs : {len(self.errors)}")
+        self.emit(f"Avertissements : {len(self.warnings)}")
         
         if self.errors:
-            print("\n" + "-"*60)
-            print("ERREURS DETECTEES :")
-            print("-"*60)
+            self.emit("\n" + "-"*60)
+            self.emit("ERREURS DETECTEES :")
+            self.emit("-"*60)
             for error in self.errors:
-                print(f"  - {error}")
+                self.emit(f"  - {error}")
         
         if self.warnings:
-            print("\n" + "-"*60)
-            print("AVERTISSEMENTS :")
-            print("-"*60)
+            self.emit("\n" + "-"*60)
+            self.emit("AVERTISSEMENTS :")
+            self.emit("-"*60)
             for warning in self.warnings:
-                print(f"  - {warning}")
+                self.emit(f"  - {warning}")
         
         # Résultat final
         all_valid = files_ok and json_ok and len(self.errors) == 0
         
-        print("\n" + "="*60)
+        self.emit("\n" + "="*60)
         if all_valid:
-            print("[SUCCESS] : ADN VALIDÉ - PRÊT POUR LA FORGE")
-            print("="*60)
+            self.emit("[SUCCESS] : ADN VALIDÉ - PRÊT POUR LA FORGE")
+            self.emit("="*60)
         else:
-            print("[FAILURE] : ADN INVALIDE - CORRECTIONS REQUISES")
-            print("="*60)
+            self.emit("[FAILURE] : ADN INVALIDE - CORRECTIONS REQUISES")
+            self.emit("="*60)
         
+        self.flush_output()
         return all_valid
 
 
+# ----------------------------------------------------------------------
+#  VALIDATION PARALLÈLE (--jobs N) : fonctions de module (picklables)
+# ----------------------------------------------------------------------
+FRAME_CHUNKSIZE = 1024
+
+_WORKER_VALIDATOR = None
+
+
+class _FrameWorkerValidator(EXOValidator):
+    """
+    Validateur de processus worker : les messages sont collectés (dans l'ordre)
+    et renvoyés au processus principal au lieu d'être affichés
+    """
+    
+    __slots__ = ("events",)
+    
+    def __init__(self):
+        super().__init__(project_root=".", verbose_stream=False, use_cache=False)
+        self.events: List[Tuple[str, str]] = []
+    
+    def log_error(self, message: str):
+        self.events.append(("error", message))
+    
+    def log_warning(self, message: str):
+        self.events.append(("warning", message))
+
+
+def _init_frame_worker():
+    """Initialiseur de Pool : schémas compilés une fois par processus"""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = _FrameWorkerValidator()
+
+
+def _validate_one_frame(item: Tuple[int, Dict]):
+    """
+    Valide une frame dans un worker
+    
+    Returns:
+        (numéro de frame, True si valide, ratio, tableau Pose, messages [(niveau, texte)])
+    """
+    idx, frame = item
+    validator = _WORKER_VALIDATOR
+    validator.events = []
+    frame_num, valid, ratio, pose = validator.check_frame(idx, frame)
+    return frame_num, valid, ratio, pose, validator.events
+
+
 def main():
     """Point d'entrée principal"""
     import argparse
@@ -439,10 +1287,24 @@ def main():
     parser = argparse.ArgumentParser(description="EXO Validator - Segment 01")
     parser.add_argument("-r", "--root", help="Racine du projet EXODUS_SYSTEM")
     parser.add_argument("-j", "--json", help="Chemin spécifique vers le JSON de données")
+    parser.add_argument("--stream", dest="verbose_stream", action="store_true", default=None,
+                        help="Affichage ligne à ligne (défaut si terminal)")
+    parser.add_argument("--buffered", dest="verbose_stream", action="store_false",
+                        help="Sortie tamponnée écrite en une fois (défaut hors terminal, ex. CI)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="Arrêt à la première erreur (CI)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore le cache des verdicts et revalide tout")
+    parser.add_argument("--sample", type=int, metavar="K",
+                        help="Ne valide que K frames tirées au hasard (contrôle rapide)")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Processus pour la validation des frames (défaut: 1, 0 = tous les cœurs)")
     
     args = parser.parse_args()
     
-    validator = EXOValidator(args.root)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    validator = EXOValidator(args.root, verbose_stream=args.verbose_stream,
+                             fail_fast=args.fail_fast, jobs=jobs, use_cache=not args.no_cache, sample=args.sample)
     
     # Si un chemin JSON spécifique est fourni, on l'ajoute aux chemins de recherche
     if args.json:
@@ -451,6 +1313,7 @@ def main():
             # On force la validation de ce fichier
             validator.project_root = json_path.parent
             validator.validate_data_json()
+            validator.flush_output()
         else:
             print(f"[ERROR] : Fichier JSON introuvable : {args.json}")
             sys.exit(1)
@@ -12,18 +12,36 @@ MODULES :
 - COMPILATION : Fusion des données Seg 01 + Seg 02
 """
 
+import io
 import json
 import os
 import sys
 import platform
+import re
+import shlex
+import shutil
 import subprocess
 import zipfile
 import urllib.request
-import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 from datetime import datetime, timezone
 
+# Parseur rapide (optionnel) : orjson, repli json stdlib
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# OS hôte, résolu une seule fois à l'import (uname)
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_LINUX = _SYSTEM == "Linux"
+
+
+def _silent(*args, **kwargs) -> None:
+    """Journal muet (--quiet)"""
+
 
 class EXOCortexAdapter:
     """
@@ -36,28 +54,36 @@ class EXOCortexAdapter:
     RHUBARB_LINUX_URL = f"https://github.com/DanielSWolf/rhubarb-lip-sync/releases/download/v{RHUBARB_VERSION}/rhubarb-lip-sync-{RHUBARB_VERSION}-linux.zip"
     
     # Dictionnaire Brain Rot US 2026 (remplacement agressif 100%)
+    # Clés en minuscules ; la casse du mot d'origine (GOOD / Good / good) est
+    # reportée sur le remplacement par _brain_rot_case
     BRAIN_ROT_DICT = {
-        'Good': 'Sigma',
         'good': 'sigma',
-        'GOOD': 'SIGMA',
-        'Amazing': 'Rizzler',
         'amazing': 'rizzler',
-        'AMAZING': 'RIZZLER',
-        'Scary': 'Cooked',
         'scary': 'cooked',
-        'SCARY': 'COOKED',
-        'Fail': 'L',
         'fail': 'L',
-        'FAIL': 'L',
-        'Win': 'W',
         'win': 'W',
-        'WIN': 'W',
-        'Crazy': 'Ohio',
         'crazy': 'ohio',
-        'CRAZY': 'OHIO',
     }
     
-    def __init__(self, drive_root: Optional[str] = None):
+    # Une seule alternation compilée, insensible à la casse (plus longs motifs
+    # d'abord) : le texte est parcouru une fois en C
+    _BRAIN_ROT_RE = re.compile(
+        "|".join(map(re.escape, sorted(BRAIN_ROT_DICT, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
+    
+    @classmethod
+    def _brain_rot_case(cls, match: "re.Match") -> str:
+        """Remplacement avec la casse du mot trouvé (MAJUSCULES, Capitale, minuscules)"""
+        word = match.group(0)
+        slang = cls.BRAIN_ROT_DICT[word.lower()]
+        if word.isupper():
+            return slang.upper()
+        if word[0].isupper():
+            return slang.capitalize()
+        return slang
+    
+    def __init__(self, drive_root: Optional[str] = None, quiet: bool = False):
         """
         Initialise l'adaptateur Cortex
         
@@ -69,32 +95,33 @@ class EXOCortexAdapter:
         
         Args:
             drive_root: Racine du système de fichiers (ancre unique)
+            quiet: Supprime bannières et messages [INFO]/[OK] (les [ERROR] restent)
         """
+        # Journal : print, ou muet en mode --quiet (traitement par lots)
+        self._log = _silent if quiet else print
+        
         # DÉTERMINATION DE LA RACINE (L'ANCRE)
         if drive_root is None:
             # DÉFAUT COLAB : /content/drive/MyDrive/EXODUS_SYSTEM
             default_colab_root = Path("/content/drive/MyDrive/EXODUS_SYSTEM")
             if default_colab_root.exists():
                 drive_root = str(default_colab_root)
-                print(f"[INFO] Drive Root détecté automatiquement (Colab) : {drive_root}")
+                self._log(f"[INFO] Drive Root détecté automatiquement (Colab) : {drive_root}")
             else:
                 # Fallback : détection depuis le script (environnement local)
                 drive_root = str(Path(__file__).parent.parent.resolve())
-                print(f"[WARNING] Colab non détecté, utilisation du chemin local : {drive_root}")
+                self._log(f"[WARNING] Colab non détecté, utilisation du chemin local : {drive_root}")
         else:
-            print(f"[INFO] Drive Root fourni via argument : {drive_root}")
+            self._log(f"[INFO] Drive Root fourni via argument : {drive_root}")
         
         # CONSTANTES DE CHEMINS (pathlib pour compatibilité Linux)
-        self.drive_root = Path(drive_root)
+        # Résolu une seule fois : tous les chemins dérivés sont absolus, inutile de
+        # refaire resolve() (un stat par composant sur Drive) à chaque appel Rhubarb
+        self.drive_root = Path(drive_root).resolve()
         self.INPUT_DIR = self.drive_root / "00_INPUT"
         self.DATA_DIR = self.drive_root / "01_BUFFER"
         self.ASSETS_DIR = self.drive_root / "02_ASSETS"
         
-        # Création des dossiers si nécessaire
-        self.INPUT_DIR.mkdir(parents=True, exist_ok=True)
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        self.ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-        
         # Chemins spécifiques (compatibilité avec le reste du code)
         # Voice_Samples peut être dans DATA_DIR ou ASSETS_DIR selon préférence
         # On garde DATA_DIR pour cohérence avec la structure
@@ -102,16 +129,22 @@ class EXOCortexAdapter:
         self.final_audio_dir = self.DATA_DIR / "Final_Audio"
         self.tools_dir = self.drive_root / "04_TOOLS"
         
-        # Création des sous-dossiers si nécessaire
-        self.tools_dir.mkdir(parents=True, exist_ok=True)
-        self.voice_samples_dir.mkdir(parents=True, exist_ok=True)
-        self.final_audio_dir.mkdir(parents=True, exist_ok=True)
+        # Création des dossiers si nécessaire. Démarrage à chaud : la sentinelle
+        # évite six mkdir (EEXIST) coûteux sur Drive monté.
+        layout_sentinel = self.drive_root / ".exo_layout_ok"
+        if not layout_sentinel.exists():
+            for directory in (
+                self.INPUT_DIR, self.DATA_DIR, self.ASSETS_DIR,
+                self.tools_dir, self.voice_samples_dir, self.final_audio_dir,
+            ):
+                directory.mkdir(parents=True, exist_ok=True)
+            layout_sentinel.touch()
         
         # Détection OS
-        self.is_windows = platform.system() == "Windows"
-        self.is_linux = platform.system() == "Linux"
+        self.is_windows = _IS_WINDOWS
+        self.is_linux = _IS_LINUX
         
-        # Chemin Rhubarb
+        # Chemin Rhubarb (installation historique : binaire copié sous tools/)
         if self.is_windows:
             self.rhubarb_exe = self.tools_dir / "rhubarb-lip-sync.exe"
         else:
@@ -120,17 +153,28 @@ class EXOCortexAdapter:
         # Racine Rhubarb (pour res/ et autres assets)
         self.rhubarb_root_dir = self.tools_dir
         
+        # Release utilisée sur place (setup_rhubarb) : disposition mémorisée
+        self.tools_layout_path = self.tools_dir / "_layout.json"
+        if self.tools_layout_path.exists():
+            try:
+                with open(self.tools_layout_path, 'r', encoding='utf-8') as f:
+                    layout = json.load(f)
+                self.rhubarb_exe = self.tools_dir / layout["rhubarb_exe"]
+                self.rhubarb_root_dir = self.tools_dir / layout["rhubarb_root_dir"]
+            except Exception as e:
+                self._log(f"[WARNING] _layout.json illisible, chemins par défaut : {e}")
+        
         # AFFICHAGE DES CHEMINS DÉTECTÉS (pour débuggage)
-        print("=" * 80)
-        print("[DOCTRINE DE L'ANCRE UNIQUE] - Segment 02 - Chemins détectés :")
-        print("=" * 80)
-        print(f"  RACINE (ANCRE)     : {self.drive_root}")
-        print(f"  INPUT_DIR          : {self.INPUT_DIR}")
-        print(f"  DATA_DIR            : {self.DATA_DIR}")
-        print(f"  ASSETS_DIR          : {self.ASSETS_DIR}")
-        print(f"  Voice Samples       : {self.voice_samples_dir}")
-        print(f"  Final Audio         : {self.final_audio_dir}")
-        print("=" * 80)
+        self._log("=" * 80)
+        self._log("[DOCTRINE DE L'ANCRE UNIQUE] - Segment 02 - Chemins détectés :")
+        self._log("=" * 80)
+        self._log(f"  RACINE (ANCRE)     : {self.drive_root}")
+        self._log(f"  INPUT_DIR          : {self.INPUT_DIR}")
+        self._log(f"  DATA_DIR            : {self.DATA_DIR}")
+        self._log(f"  ASSETS_DIR          : {self.ASSETS_DIR}")
+        self._log(f"  Voice Samples       : {self.voice_samples_dir}")
+        self._log(f"  Final Audio         : {self.final_audio_dir}")
+        self._log("=" * 80)
 
     def detect_mode(self, force_no_audio: bool = False) -> Tuple[str, Optional[Path]]:
         """
@@ -145,14 +189,20 @@ class EXOCortexAdapter:
         if force_no_audio:
             return ("SILENT", None)
 
-        # DRAMA munitions : mp3 ou wav
-        audio_files: List[Path] = []
-        audio_files.extend(self.voice_samples_dir.glob("*.mp3"))
-        audio_files.extend(self.voice_samples_dir.glob("*.wav"))
-        audio_files = sorted(audio_files, key=lambda p: p.name.lower())
+        # DRAMA munitions : mp3 ou wav — un seul scandir, on garde le plus petit nom
+        best: Optional[Tuple[str, str]] = None
+        try:
+            with os.scandir(self.voice_samples_dir) as it:
+                for entry in it:
+                    key = entry.name.lower()
+                    if key.endswith((".mp3", ".wav")) and entry.is_file():
+                        if best is None or key < best[0]:
+                            best = (key, entry.path)
+        except FileNotFoundError:
+            pass
 
-        if audio_files:
-            return ("DRAMA", audio_files[0])
+        if best:
+            return ("DRAMA", Path(best[1]))
 
         return ("SILENT", None)
 
@@ -166,6 +216,65 @@ class EXOCortexAdapter:
             "mode": "SILENT",
         }
     
+    def _find_rhubarb_binary(self) -> Optional[Path]:
+        """
+        Localise le binaire d'une release Rhubarb extraite sous tools/
+        (typiquement : tools/Rhubarb-Lip-Sync-<ver>-<OS>/rhubarb[.exe])
+        
+        Parcours limité à deux niveaux via os.scandir (type d'entrée fourni par
+        readdir, pas de stat récursif de tout l'arbre comme glob("**/...")).
+        
+        Returns:
+            Chemin du binaire ou None
+        """
+        binary_name = "rhubarb.exe" if self.is_windows else "rhubarb"
+        try:
+            with os.scandir(self.tools_dir) as entries:
+                top_level = list(entries)
+        except OSError:
+            return None
+        
+        # Binaire posé directement sous tools/
+        for entry in top_level:
+            if entry.name == binary_name and entry.is_file():
+                return Path(entry.path)
+        
+        # Dossier de release (nom contenant "rhubarb")
+        for entry in top_level:
+            if entry.is_dir(follow_symlinks=False) and "rhubarb" in entry.name.lower():
+                try:
+                    with os.scandir(entry.path) as sub_entries:
+                        for sub in sub_entries:
+                            if sub.name == binary_name and sub.is_file():
+                                return Path(sub.path)
+                except OSError:
+                    continue
+        return None
+    
+    def _install_rhubarb_from(self, binary: Path) -> None:
+        """
+        Adopte une release Rhubarb extraite sur place : le binaire et son res/
+        (PocketSphinx) restent dans le dossier de release, aucune copie.
+        La disposition est mémorisée dans tools/_layout.json pour les exécutions suivantes.
+        
+        Args:
+            binary: Binaire rhubarb[.exe] de la release
+        """
+        self.rhubarb_exe = binary
+        # Le dossier de release sert de racine (res/ à côté du binaire)
+        self.rhubarb_root_dir = binary.parent
+        
+        if self.is_linux:
+            os.chmod(self.rhubarb_exe, 0o755)
+            self._log(f"[OK] Permissions d'exécution appliquées")
+        
+        # Chemins relatifs à tools/ : le point de montage Drive peut changer
+        with open(self.tools_layout_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "rhubarb_exe": binary.relative_to(self.tools_dir).as_posix(),
+                "rhubarb_root_dir": self.rhubarb_root_dir.relative_to(self.tools_dir).as_posix(),
+            }, f, indent=2)
+    
     def setup_rhubarb(self) -> bool:
         """
         MODULE AUTO-DEPLOY
@@ -174,98 +283,58 @@ class EXOCortexAdapter:
         Returns:
             True si succès, False sinon
         """
-        print("[INFO] Vérification de Rhubarb Lip-Sync...")
+        self._log("[INFO] Vérification de Rhubarb Lip-Sync...")
         
         # Vérifier si déjà présent (chemin attendu)
         if self.rhubarb_exe.exists():
-            print(f"[OK] Rhubarb trouvé : {self.rhubarb_exe}")
+            self._log(f"[OK] Rhubarb trouvé : {self.rhubarb_exe}")
             return True
         
         # Vérifier si Rhubarb a déjà été extrait dans un sous-dossier (structure release GitHub)
-        existing = None
-        if self.is_windows:
-            # typiquement: tools/Rhubarb-Lip-Sync-<ver>-Windows/rhubarb.exe
-            candidates = list(self.tools_dir.glob("**/rhubarb.exe"))
-        else:
-            candidates = list(self.tools_dir.glob("**/rhubarb"))
+        existing = self._find_rhubarb_binary()
         
-        # Éviter les binaires annexes potentiels ; prendre le premier candidat plausible
-        if candidates:
-            existing = candidates[0]
-        
-        if existing and existing.exists():
+        if existing:
             try:
-                # Si le binaire vit dans un dossier de release, on utilise ce dossier comme racine (res/ à côté)
-                self.rhubarb_root_dir = existing.parent
-                shutil.copy2(existing, self.rhubarb_exe)
-                # S'assurer que le dossier res/ est disponible sous tools/ pour PocketSphinx
-                release_res = self.rhubarb_root_dir / "res"
-                target_res = self.tools_dir / "res"
-                if release_res.exists() and not target_res.exists():
-                    shutil.copytree(release_res, target_res)
-                if self.is_linux:
-                    os.chmod(self.rhubarb_exe, 0o755)
-                print(f"[OK] Rhubarb trouvé dans sous-dossier et copié : {self.rhubarb_exe}")
+                self._install_rhubarb_from(existing)
+                self._log(f"[OK] Rhubarb trouvé dans sous-dossier : {self.rhubarb_exe}")
                 return True
             except Exception as e:
-                print(f"[WARNING] Rhubarb trouvé mais impossible à copier: {e}")
+                self._log(f"[WARNING] Rhubarb trouvé mais inutilisable : {e}")
         
-        print("[INFO] Rhubarb introuvable. Téléchargement automatique...")
+        self._log("[INFO] Rhubarb introuvable. Téléchargement automatique...")
         
         try:
             # Sélectionner l'URL selon l'OS
             if self.is_windows:
                 url = self.RHUBARB_WINDOWS_URL
-                zip_name = f"rhubarb-windows-{self.RHUBARB_VERSION}.zip"
             elif self.is_linux:
                 url = self.RHUBARB_LINUX_URL
-                zip_name = f"rhubarb-linux-{self.RHUBARB_VERSION}.zip"
             else:
-                print(f"[ERROR] OS non supporté : {platform.system()}")
+                print(f"[ERROR] OS non supporté : {_SYSTEM}")
                 return False
             
-            zip_path = self.tools_dir / zip_name
-            
-            # Téléchargement
-            print(f"[INFO] Téléchargement depuis GitHub...")
-            urllib.request.urlretrieve(url, zip_path)
-            print(f"[OK] Téléchargé : {zip_path}")
+            # Téléchargement en mémoire (~30 Mo) : pas d'archive intermédiaire écrite
+            # sur Drive ; la release extraite sert elle-même de cache persistant
+            self._log(f"[INFO] Téléchargement depuis GitHub...")
+            with urllib.request.urlopen(url, timeout=120) as response:
+                archive = io.BytesIO(response.read())
+            self._log(f"[OK] Téléchargé : {archive.getbuffer().nbytes / 1e6:.1f} Mo")
             
             # Extraction
-            print(f"[INFO] Extraction...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            self._log(f"[INFO] Extraction...")
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
                 zip_ref.extractall(self.tools_dir)
             
-            # Nettoyage
-            zip_path.unlink()
-            
             # Après extraction, la release contient souvent un sous-dossier.
-            # On localise le binaire et on le copie vers le chemin attendu (tools/rhubarb-lip-sync[.exe]).
-            extracted_bin = None
-            if self.is_windows:
-                extracted_candidates = list(self.tools_dir.glob("**/rhubarb.exe"))
-            else:
-                extracted_candidates = list(self.tools_dir.glob("**/rhubarb"))
-            
-            if extracted_candidates:
-                extracted_bin = extracted_candidates[0]
+            # On localise le binaire et on l'utilise sur place (pas de copie).
+            extracted_bin = self._find_rhubarb_binary()
             
-            if extracted_bin and extracted_bin.exists():
-                self.rhubarb_root_dir = extracted_bin.parent
-                shutil.copy2(extracted_bin, self.rhubarb_exe)
-                # Copier également res/ à côté de tools/ si nécessaire
-                release_res = self.rhubarb_root_dir / "res"
-                target_res = self.tools_dir / "res"
-                if release_res.exists() and not target_res.exists():
-                    shutil.copytree(release_res, target_res)
-                if self.is_linux:
-                    os.chmod(self.rhubarb_exe, 0o755)
-                    print(f"[OK] Permissions d'exécution appliquées")
-                print(f"[OK] Rhubarb binaire copié : {self.rhubarb_exe}")
+            if extracted_bin:
+                self._install_rhubarb_from(extracted_bin)
             
             # Vérification finale
             if self.rhubarb_exe.exists():
-                print(f"[SUCCESS] Rhubarb installé : {self.rhubarb_exe}")
+                self._log(f"[SUCCESS] Rhubarb installé : {self.rhubarb_exe}")
                 return True
             else:
                 print(f"[ERROR] Rhubarb non trouvé après installation")
@@ -277,43 +346,51 @@ class EXOCortexAdapter:
             traceback.print_exc()
             return False
     
-    def transfigure_script(self, raw_data_path: Path) -> Dict:
+    @staticmethod
+    def load_segment01(raw_data_path: Path) -> Dict:
+        """
+        Charge mission_RAW.json une seule fois (orjson si disponible)
+        
+        Args:
+            raw_data_path: Chemin vers mission_RAW.json
+            
+        Returns:
+            Dict du Segment 01, partagé par transfigure_script et compile_mission
+        """
+        return _json.loads(raw_data_path.read_bytes())
+    
+    def transfigure_script(self, seg01_data: Dict) -> Dict:
         """
         MODULE BRAIN ROT
         Transforme la transcription en Slang US 2026 viral
         
         Args:
-            raw_data_path: Chemin vers mission_RAW.json
+            seg01_data: Données mission_RAW.json déjà chargées
             
         Returns:
             Dict contenant le script transformé
         """
-        print("[INFO] Module Brain Rot : Transformation du script...")
+        self._log("[INFO] Module Brain Rot : Transformation du script...")
         
         try:
-            with open(raw_data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Extraire la transcription (première frame avec audio)
-            original_text = ""
-            for frame in data.get('frames', []):
-                audio = frame.get('audio_transcription')
-                if audio and audio.get('text'):
-                    original_text = audio.get('text', '')
-                    break
+            # Extraire la transcription (première frame avec audio), sinon le bloc
+            # global écrit par le scanner S01 (audio_transcription_global)
+            original_text = next(
+                (text for frame in seg01_data.get('frames', ())
+                 if (text := (frame.get('audio_transcription') or {}).get('text'))),
+                ""
+            ) or (seg01_data.get('audio_transcription_global') or {}).get('text', "")
             
             if not original_text:
-                print("[WARNING] Aucune transcription trouvée dans les données")
+                self._log("[WARNING] Aucune transcription trouvée dans les données")
                 original_text = ""
             
             # Transformation Brain Rot (remplacement agressif 100%)
-            viral_text = original_text
-            for old_word, new_word in self.BRAIN_ROT_DICT.items():
-                viral_text = viral_text.replace(old_word, new_word)
+            viral_text = self._BRAIN_ROT_RE.sub(self._brain_rot_case, original_text)
             
-            print(f"[OK] Script transformé : {len(viral_text)} caractères")
-            print(f"[INFO] Original : {original_text[:100]}...")
-            print(f"[INFO] Viral : {viral_text[:100]}...")
+            self._log(f"[OK] Script transformé : {len(viral_text)} caractères")
+            self._log(f"[INFO] Original : {original_text[:100]}...")
+            self._log(f"[INFO] Viral : {viral_text[:100]}...")
             
             return {
                 "original_text": original_text,
@@ -333,45 +410,104 @@ class EXOCortexAdapter:
                 "error": str(e)
             }
     
+    # Graphe de filtres ffmpeg : normalisation loudness + compression dynamique
+    FFMPEG_VOICE_FILTER = (
+        "loudnorm=I=-16:TP=-1.5:LRA=11,"
+        "acompressor=threshold=-20dB:ratio=4:attack=5:release=50"
+    )
+    
     def normalize_audio(self, input_file: Optional[Path] = None) -> Optional[Path]:
         """
         MODULE AUDIO GHOST
-        Normalise l'audio depuis Voice_Samples/
+        Normalise l'audio depuis Voice_Samples/ (ffmpeg en un passage, pydub en repli)
         
         Returns:
             Chemin vers EXO_VOICE_FINAL.mp3 ou None
         """
-        print("[INFO] Module Audio Ghost : Normalisation audio...")
+        self._log("[INFO] Module Audio Ghost : Normalisation audio...")
+        
+        if input_file is None:
+            # fallback legacy : premier mp3
+            mp3_files = list(self.voice_samples_dir.glob("*.mp3"))
+            if not mp3_files:
+                self._log("[WARNING] Aucun fichier .mp3 trouvé dans Voice_Samples/")
+                return None
+            input_file = mp3_files[0]
+        self._log(f"[INFO] Fichier trouvé : {input_file.name}")
+        
+        output_path = self.final_audio_dir / "EXO_VOICE_FINAL.mp3"
+        
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg:
+            cmd = [
+                ffmpeg, "-y", "-loglevel", "error", "-i", str(input_file),
+                "-af", self.FFMPEG_VOICE_FILTER, "-b:a", "192k", str(output_path),
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                self._log("[OK] Volume normalisé et compression appliquée (ffmpeg)")
+                self._log(f"[SUCCESS] Audio normalisé sauvegardé : {output_path}")
+                return output_path
+            self._log(f"[WARNING] ffmpeg a échoué (code {result.returncode}), repli pydub : {result.stderr.strip()}")
+        
+        return self._normalize_audio_pydub(input_file, output_path)
+    
+    def decode_for_rhubarb(self, input_file: Optional[Path]) -> Optional[Path]:
+        """
+        Chemin rapide sans normalisation : Rhubarb ne lit que WAV/Ogg, on décode
+        donc le mp3 une seule fois en WAV PCM, niveaux d'origine conservés.
+        Sans ffmpeg, repli sur normalize_audio.
         
+        Returns:
+            Chemin vers EXO_VOICE_FINAL.wav ou None
+        """
+        if input_file is None:
+            return self.normalize_audio(input_file)
+        if input_file.suffix.lower() == ".ogg":
+            self._log("[INFO] Audio Ogg détecté : envoi direct à Rhubarb")
+            return input_file
+        
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            self._log("[WARNING] ffmpeg introuvable, passage par la normalisation pydub")
+            return self.normalize_audio(input_file)
+        
+        output_path = self.final_audio_dir / "EXO_VOICE_FINAL.wav"
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error", "-i", str(input_file),
+            "-vn", "-acodec", "pcm_s16le", str(output_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            self._log(f"[WARNING] Décodage ffmpeg échoué (code {result.returncode}), normalisation : {result.stderr.strip()}")
+            return self.normalize_audio(input_file)
+        
+        self._log(f"[OK] Audio décodé sans normalisation : {output_path.name}")
+        return output_path
+    
+    def _normalize_audio_pydub(self, input_file: Path, output_path: Path) -> Optional[Path]:
+        """
+        Repli Audio Ghost via pydub (ffmpeg absent du PATH ou en échec)
+        """
         try:
             from pydub import AudioSegment
             from pydub.effects import normalize
             
-            if input_file is None:
-                # fallback legacy : premier mp3
-                mp3_files = list(self.voice_samples_dir.glob("*.mp3"))
-                if not mp3_files:
-                    print("[WARNING] Aucun fichier .mp3 trouvé dans Voice_Samples/")
-                    return None
-                input_file = mp3_files[0]
-            print(f"[INFO] Fichier trouvé : {input_file.name}")
-            
             # Charger l'audio
             audio = AudioSegment.from_mp3(str(input_file))
-            print(f"[INFO] Audio chargé : {len(audio)}ms, {audio.frame_rate}Hz")
+            self._log(f"[INFO] Audio chargé : {len(audio)}ms, {audio.frame_rate}Hz")
             
             # Normalisation du volume
             audio = normalize(audio)
-            print("[OK] Volume normalisé")
+            self._log("[OK] Volume normalisé")
             
             # Réduction de bruit basique (compression dynamique)
             audio = audio.compress_dynamic_range(threshold=-20.0, ratio=4.0, attack=5.0, release=50.0)
-            print("[OK] Compression appliquée")
+            self._log("[OK] Compression appliquée")
             
             # Sauvegarde
-            output_path = self.final_audio_dir / "EXO_VOICE_FINAL.mp3"
             audio.export(str(output_path), format="mp3", bitrate="192k")
-            print(f"[SUCCESS] Audio normalisé sauvegardé : {output_path}")
+            self._log(f"[SUCCESS] Audio normalisé sauvegardé : {output_path}")
             
             return output_path
             
@@ -395,12 +531,15 @@ class EXOCortexAdapter:
         Returns:
             Dict contenant les données de lip-sync ou None
         """
-        print("[INFO] Pont Rhubarb : Génération lip-sync...")
+        self._log("[INFO] Pont Rhubarb : Génération lip-sync...")
         
         if not self.rhubarb_exe.exists():
             print("[ERROR] Rhubarb non trouvé. Exécutez setup_rhubarb() d'abord.")
             return None
         
+        if not audio_path.is_absolute():
+            audio_path = (self.voice_samples_dir / audio_path).resolve()
+        
         if not audio_path.exists():
             print(f"[ERROR] Fichier audio introuvable : {audio_path}")
             return None
@@ -412,30 +551,33 @@ class EXOCortexAdapter:
             cmd = [
                 str(self.rhubarb_exe),
                 "-f", "json",
-                str(audio_path.resolve()),
-                "-o", str(output_json.resolve())
+                str(audio_path),
+                "-o", str(output_json)
             ]
             
-            print(f"[INFO] Exécution : {' '.join(cmd)}")
+            if getattr(self, "_verbose", False):
+                self._log(f"[INFO] Exécution : {shlex.join(cmd)}")
             # IMPORTANT: Rhubarb dépend de res/ (PocketSphinx). On force le cwd sur la racine Rhubarb
             # pour éviter les erreurs du type tools\\res\\... introuvable.
+            # stdout ignoré ; stderr brut (bytes), décodé seulement en cas d'échec
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 cwd=str(self.rhubarb_root_dir),
                 timeout=300  # 5 minutes max
             )
             
             if result.returncode != 0:
-                print(f"[ERROR] Rhubarb a échoué : {result.stderr}")
+                stderr_tail = result.stderr[-4096:].decode('utf-8', 'replace')
+                print(f"[ERROR] Rhubarb a échoué : {stderr_tail}")
                 return None
             
             # Lire le résultat
             if output_json.exists():
                 with open(output_json, 'r', encoding='utf-8') as f:
                     lip_sync_data = json.load(f)
-                print(f"[SUCCESS] Lip-sync généré : {len(lip_sync_data.get('mouthCues', []))} formes")
+                self._log(f"[SUCCESS] Lip-sync généré : {len(lip_sync_data.get('mouthCues', []))} formes")
                 return lip_sync_data
             else:
                 print("[ERROR] Fichier de sortie non généré")
@@ -452,6 +594,7 @@ class EXOCortexAdapter:
     
     def compile_mission(
         self,
+        seg01_data: Dict,
         raw_data_path: Path,
         speech_data: Dict,
         lip_sync_data: Optional[Dict],
@@ -462,20 +605,21 @@ class EXOCortexAdapter:
         Fusionne toutes les données en EXO_MISSION_READY.json
         
         Args:
-            raw_data_path: Chemin vers mission_RAW.json (Segment 01)
+            seg01_data: Données mission_RAW.json déjà chargées (Segment 01)
+            raw_data_path: Chemin source, consigné dans les métadonnées
             speech_data: Données du script transformé
             lip_sync_data: Données de lip-sync (optionnel)
             
         Returns:
             Chemin vers EXO_MISSION_READY.json
         """
-        print("[INFO] Compilation : Fusion des données...")
+        self._log("[INFO] Compilation : Fusion des données...")
+        
+        # Horodatage unique : mission_id, metadata et speech partagent le même instant
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
         
         try:
-            # Charger les données du Segment 01 (SCANNER UNIVERSEL)
-            with open(raw_data_path, 'r', encoding='utf-8') as f:
-                seg01_data = json.load(f)
-            
             # PASS-THROUGH : on récupère directement les blocs universels
             metadata_raw = seg01_data.get("metadata", {})
             camera_motion = seg01_data.get("camera_motion", [])
@@ -486,7 +630,7 @@ class EXOCortexAdapter:
                 "original_text": speech_data.get('original_text', ''),
                 "viral_text": speech_data.get('viral_text', ''),
                 "transformation_applied": speech_data.get('transformation_applied', False),
-                "timestamp": speech_data.get('timestamp', datetime.now(timezone.utc).isoformat())
+                "timestamp": speech_data.get('timestamp', now_iso)
             }
             
             # Préparer mouth (Lip-sync)
@@ -500,26 +644,23 @@ class EXOCortexAdapter:
                     }
                 }
             else:
-                # MODE DRAMA : priorité au fichier EXO_LIP_SYNC.json sur disque
-                lip_sync_path = self.final_audio_dir / "EXO_LIP_SYNC.json"
-                lip_sync_payload = None
-                if lip_sync_path.exists():
-                    try:
-                        with open(lip_sync_path, 'r', encoding='utf-8') as f:
-                            lip_sync_payload = json.load(f)
-                    except Exception:
-                        lip_sync_payload = None
+                # MODE DRAMA : priorité aux données déjà en mémoire (generate_lip_sync
+                # vient de lire EXO_LIP_SYNC.json) ; relecture disque seulement à défaut
+                lip_sync_payload = lip_sync_data
+                if not lip_sync_payload:
+                    lip_sync_path = self.final_audio_dir / "EXO_LIP_SYNC.json"
+                    if lip_sync_path.exists():
+                        try:
+                            with open(lip_sync_path, 'r', encoding='utf-8') as f:
+                                lip_sync_payload = json.load(f)
+                        except Exception:
+                            lip_sync_payload = None
 
                 if lip_sync_payload:
                     mouth_output = {
                         "mouthCues": lip_sync_payload.get("mouthCues", []),
                         "metadata": lip_sync_payload.get("metadata", {})
                     }
-                elif lip_sync_data:
-                    mouth_output = {
-                        "mouthCues": lip_sync_data.get('mouthCues', []),
-                        "metadata": lip_sync_data.get('metadata', {})
-                    }
                 else:
                     mouth_output = {
                         "mouthCues": [],
@@ -529,10 +670,10 @@ class EXOCortexAdapter:
             # Compiler le fichier final (PROTOCOLE BABEL)
             mission_data = {
                 "metadata": {
-                    "mission_id": f"EXO_MISSION_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
+                    "mission_id": f"EXO_MISSION_{now.strftime('%Y%m%d_%H%M%S')}",
                     "language": "en-US",
-                    "os_detected": platform.system(),
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "os_detected": _SYSTEM,
+                    "timestamp": now_iso,
                     "source_segment01": str(raw_data_path),
                     "mode": mode,
                     "source_metadata": metadata_raw,
@@ -552,13 +693,19 @@ class EXOCortexAdapter:
             
             # Sauvegarde dans DATA_DIR (01_BUFFER)
             output_path = self.DATA_DIR / "EXO_MISSION_READY.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(mission_data, f, indent=2, ensure_ascii=False)
+            if _json is not json:
+                # orjson : encodage C direct en bytes UTF-8 (équivalent ensure_ascii=False)
+                output_path.write_bytes(_json.dumps(
+                    mission_data, option=_json.OPT_INDENT_2 | _json.OPT_NON_STR_KEYS
+                ))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(mission_data, f, indent=2, ensure_ascii=False)
             
-            print(f"[SUCCESS] Mission compilée : {output_path}")
-            print(f"[INFO] Acteurs : {len(actors_block.keys())}")
-            print(f"[INFO] Frames camera_motion : {len(camera_motion)}")
-            print(f"[INFO] Formes de bouches : {len(mouth_output.get('mouthCues', []))}")
+            self._log(f"[SUCCESS] Mission compilée : {output_path}")
+            self._log(f"[INFO] Acteurs : {len(actors_block.keys())}")
+            self._log(f"[INFO] Frames camera_motion : {len(camera_motion)}")
+            self._log(f"[INFO] Formes de bouches : {len(mouth_output.get('mouthCues', []))}")
             
             return output_path
             
@@ -572,58 +719,73 @@ class EXOCortexAdapter:
         """
         Exécute le pipeline complet
         """
-        print("=" * 60)
-        print("EXO_02_CORTEX_ADAPTER - Segment 02 : ALPHARIUS CORTEX")
-        print("=" * 60)
+        self._log("=" * 60)
+        self._log("EXO_02_CORTEX_ADAPTER - Segment 02 : ALPHARIUS CORTEX")
+        self._log("=" * 60)
         
         # 1. Charger les données Segment 01 (SCANNER UNIVERSEL - mission_RAW.json)
         raw_data_path = self.DATA_DIR / "mission_RAW.json"
         if not raw_data_path.exists():
             print(f"[ERROR] Fichier Segment 01 introuvable : {raw_data_path}")
-            print(f"[INFO] Assurez-vous que le Segment 01 a été exécuté et a généré mission_RAW.json dans {self.DATA_DIR}")
+            self._log(f"[INFO] Assurez-vous que le Segment 01 a été exécuté et a généré mission_RAW.json dans {self.DATA_DIR}")
+            return False
+
+        try:
+            seg01_data = self.load_segment01(raw_data_path)
+        except Exception as e:
+            print(f"[ERROR] Lecture de {raw_data_path} impossible : {e}")
             return False
 
         # 2. SÉLECTEUR DE FLUX (Silent / Drama)
         mode, audio_input = self.detect_mode(getattr(self, "_force_no_audio", False))
         if mode == "SILENT":
-            print("[INFO] : MODE SILENT DÉTECTÉ - SAUT DU LIP-SYNC.")
+            self._log("[INFO] : MODE SILENT DÉTECTÉ - SAUT DU LIP-SYNC.")
         else:
-            print(f"[INFO] : MODE DRAMA DÉTECTÉ - Audio: {audio_input.name if audio_input else 'N/A'}")
+            self._log(f"[INFO] : MODE DRAMA DÉTECTÉ - Audio: {audio_input.name if audio_input else 'N/A'}")
 
         # 3. Pipeline conditionnel
         speech_data = self.empty_speech_payload()
         lip_sync_data = None
 
         if mode == "DRAMA":
-            # AUTO-DEPLOY uniquement si DRAMA (gain de temps en SILENT)
-            if not self.setup_rhubarb():
-                print("[ERROR] Échec du setup Rhubarb. Abandon.")
-                return False
+            # AUTO-DEPLOY uniquement si DRAMA (gain de temps en SILENT), en tâche de
+            # fond : le téléchargement réseau se recouvre avec Brain Rot + Audio Ghost
+            from concurrent.futures import ThreadPoolExecutor
+            setup_pool = ThreadPoolExecutor(max_workers=1)
+            rhubarb_future = setup_pool.submit(self.setup_rhubarb)
+            setup_pool.shutdown(wait=False)
 
             # Brain Rot en DRAMA
-            speech_data = self.transfigure_script(raw_data_path)
+            speech_data = self.transfigure_script(seg01_data)
 
             # Audio Ghost + Rhubarb
             audio_path: Optional[Path] = None
-            if audio_input and audio_input.suffix.lower() == ".wav":
+            if getattr(self, "_normalize_audio", False):
+                # Normalisation explicitement demandée (--normalize-audio)
+                audio_path = self.normalize_audio(audio_input)
+            elif audio_input and audio_input.suffix.lower() == ".wav":
                 # WAV: Rhubarb peut consommer directement, pas besoin de pydub.
                 audio_path = audio_input
-                print("[INFO] Audio WAV détecté : saut de la normalisation, envoi direct à Rhubarb")
+                self._log("[INFO] Audio WAV détecté : saut de la normalisation, envoi direct à Rhubarb")
             else:
-                audio_path = self.normalize_audio(audio_input)
+                audio_path = self.decode_for_rhubarb(audio_input)
+
+            if not rhubarb_future.result():
+                print("[ERROR] Échec du setup Rhubarb. Abandon.")
+                return False
 
             if audio_path:
                 lip_sync_data = self.generate_lip_sync(audio_path)
             else:
-                print("[WARNING] Pas d'audio, lip-sync ignoré")
+                self._log("[WARNING] Pas d'audio, lip-sync ignoré")
 
         # 4. COMPILATION UNIVERSELLE
-        mission_path = self.compile_mission(raw_data_path, speech_data, lip_sync_data, mode)
+        mission_path = self.compile_mission(seg01_data, raw_data_path, speech_data, lip_sync_data, mode)
         
-        print("=" * 60)
-        print("[SUCCESS] Pipeline Cortex terminé avec succès !")
-        print(f"[OK] Fichier final : {mission_path}")
-        print("=" * 60)
+        self._log("=" * 60)
+        self._log("[SUCCESS] Pipeline Cortex terminé avec succès !")
+        self._log(f"[OK] Fichier final : {mission_path}")
+        self._log("=" * 60)
         
         return True
 
@@ -646,11 +808,20 @@ def main():
         help="Racine du système de fichiers (ancre unique). Défaut Colab: /content/drive/MyDrive/EXODUS_SYSTEM"
     )
     parser.add_argument("--no-audio", action="store_true", help="Force le MODE SILENT (ignore Voice_Samples/)")
+    parser.add_argument(
+        "--normalize-audio",
+        action="store_true",
+        help="Active l'Audio Ghost (loudnorm + compression) avant Rhubarb. Défaut : audio brut"
+    )
+    parser.add_argument("--quiet", action="store_true", help="Supprime bannières et messages d'information (erreurs conservées)")
+    parser.add_argument("--verbose", action="store_true", help="Affiche les commandes externes exécutées (Rhubarb)")
     
     args = parser.parse_args()
     
-    adapter = EXOCortexAdapter(args.drive_root)
+    adapter = EXOCortexAdapter(args.drive_root, quiet=args.quiet)
     adapter._force_no_audio = bool(args.no_audio)
+    adapter._normalize_audio = bool(args.normalize_audio)
+    adapter._verbose = bool(args.verbose)
     success = adapter.run()
     
     sys.exit(0 if success else 1)
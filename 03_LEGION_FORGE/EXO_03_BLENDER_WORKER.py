@@ -12,16 +12,44 @@ DOCTRINE :
 """
 
 import bpy
+import os
 import sys
 import argparse
 import subprocess
 import hashlib
+import pickle
 import random
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
+import numpy as np
 import mathutils
-from mathutils import Vector, Quaternion
+from mathutils import Vector
+
+# Lissage Savitzky-Golay (optionnel, scipy rarement présent dans Blender) :
+# repli NumPy dans _savgol_smooth
+try:
+    from scipy.signal import savgol_filter
+except ImportError:
+    savgol_filter = None
+
+# Parseur rapide (optionnel, absent du Python embarqué de Blender par défaut) :
+# orjson, repli json stdlib
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# MediaPipe Pose : 33 landmarks par frame
+N_POSE_LANDMARKS = 33
+# Direction de repli (os de longueur nulle, landmarks invalides)
+_DEFAULT_BONE_DIR = (0.0, 1.0, 0.0)
+# Mode --serve : préfixe des lignes de réponse (distinctes des logs sur stdout)
+SERVE_REPLY_PREFIX = "EXO_SERVE_REPLY "
 
 
 class EXOForge:
@@ -44,6 +72,8 @@ class EXOForge:
         - 03_OUTPUT : Exports vidéo finaux
         """
         # GESTION DES ARGUMENTS : Parser sys.argv après le séparateur --
+        # Processus Blender de rendu en parallèle (plages de frames), 1 = rendu direct
+        self.render_workers = 1
         if drive_root is None:
             # Blender ajoute ses propres arguments, on ne lit que ce qui suit --
             if '--' in sys.argv:
@@ -55,8 +85,16 @@ class EXOForge:
                     default=None,
                     help="Racine du système de fichiers (ancre unique). Défaut: /content/drive/MyDrive/EXODUS_SYSTEM"
                 )
-                args = parser.parse_args(args_after_separator)
+                parser.add_argument(
+                    "--render-workers",
+                    type=int,
+                    default=1,
+                    help="Nombre de processus Blender rendant chacun une plage de frames (défaut: 1)"
+                )
+                # parse_known_args : --num-variantes / --variants sont lus par main()
+                args, _ = parser.parse_known_args(args_after_separator)
                 drive_root = args.drive_root
+                self.render_workers = max(1, args.render_workers)
         
         # DÉTERMINATION DE LA RACINE (L'ANCRE)
         if drive_root is None:
@@ -89,6 +127,8 @@ class EXOForge:
         # LEGION DYNAMIQUE : répertoires dédiés aux avatars multi-acteurs
         self.avatars_dir = self.ASSETS_DIR / "Avatars"
         self.armatures_by_actor: Dict[str, "bpy.types.Object"] = {}
+        # Landmarks de pose par acteur (load_mission_data) : (frame_numbers, tenseur SoA)
+        self.landmarks_by_actor: Dict[str, Tuple] = {}
         
         # Création des dossiers si nécessaire
         self.INPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -114,6 +154,18 @@ class EXOForge:
         # Référence caméra (sera créée dans setup_camera)
         self.camera = None
         
+        # Backend GPU Cycles (détecté une fois par setup_gpu_devices)
+        self._gpu_backend: Optional[str] = None
+        self._gpu_devices: List = []
+        # Dossier des rendus intermédiaires (choisi une fois par _render_staging_dir)
+        self._staging_dir: Optional[Path] = None
+        # Fichier audio de la mission (résolu une fois par _resolve_audio ; False = aucun)
+        self._audio_path = None
+        # Encodeur H.264 matériel de la post-prod (détecté une fois par _hw_encoder ; "" = aucun)
+        self._hwenc: Optional[str] = None
+        # Détection et repli de l'encodeur partagés par les threads de post-prod
+        self._hwenc_lock = threading.Lock()
+        
         # AFFICHAGE DES CHEMINS DÉTECTÉS (pour débuggage)
         print("=" * 80)
         print("[DOCTRINE DE L'ANCRE UNIQUE] - Chemins détectés :")
@@ -142,8 +194,10 @@ class EXOForge:
         
         # NETTOYAGE : Supprimer tous les objets par défaut
         print("[INFO] Nettoyage de la scène...")
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
+        # API data directe (pas d'opérateur : ni poll, ni undo push, ni contexte)
+        bpy.data.batch_remove(list(bpy.data.objects))
+        # Données orphelines (meshes / caméras / lampes de la scène par défaut)
+        bpy.data.orphans_purge(do_recursive=True)
         
         # Récupérer la scène active
         scene = bpy.context.scene
@@ -160,21 +214,23 @@ class EXOForge:
         print("[INFO] Activation du moteur Cycles...")
         scene.render.engine = 'CYCLES'
         
-        # PROTOCOLE ORACLE 60 : RÉVEIL BRUTAL DU GPU (FORCE CUDA)
-        print("[INFO] RÉVEIL BRUTAL DU GPU - Force CUDA (Tesla T4)...")
-        prefs = bpy.context.preferences.addons['cycles'].preferences
-        prefs.compute_device_type = 'CUDA'
-        prefs.refresh_devices()
-        for d in prefs.devices:
-            d.use = (d.type == 'CUDA')
-        scene.cycles.device = 'GPU'
-        print("[SUCCESS] GPU CUDA forcé - Tesla T4 activée")
+        # PROTOCOLE ORACLE 60 : RÉVEIL BRUTAL DU GPU (OPTIX prioritaire, puis CUDA/HIP/ONEAPI)
+        self.setup_gpu_devices(scene)
         
         # Configuration qualité Cycles (High / Perceptually Lossless)
-        scene.cycles.samples = 128  # Échantillonnage pour qualité élevée
+        # Échantillonnage adaptatif : les pixels convergés s'arrêtent tôt, le
+        # denoiser couvre le budget de base réduit
+        scene.cycles.samples = 64
+        scene.cycles.use_adaptive_sampling = True
+        scene.cycles.adaptive_threshold = 0.01
+        scene.cycles.adaptive_min_samples = 16
         scene.cycles.use_denoising = True  # Dénuage pour qualité optimale
         scene.cycles.denoiser = 'OPENIMAGEDENOISE'
         
+        # Données persistantes : géométrie / BVH / shaders conservés entre les rendus
+        # des variantes (seule la caméra change)
+        scene.render.use_persistent_data = True
+        
         # MOTION BLUR (Qualité chef-d'œuvre)
         scene.render.use_motion_blur = True
         scene.render.motion_blur_shutter = 0.5  # Shutter speed (0.5 = motion blur modéré)
@@ -210,6 +266,74 @@ class EXOForge:
         print(f"[INFO] Périphérique : {scene.cycles.device}")
         print(f"[INFO] Format sortie : {scene.render.ffmpeg.format} ({scene.render.ffmpeg.codec})")
 
+    # Backends Cycles par ordre de préférence (OPTIX : mise à jour BVH au lieu de reconstruction)
+    GPU_BACKENDS = ('OPTIX', 'CUDA', 'HIP', 'ONEAPI')
+
+    def detect_gpu_devices(self) -> str:
+        """
+        Détecte le backend GPU Cycles et ses périphériques
+        
+        Un seul refresh_devices (il peuple les listes de tous les types), regroupement
+        par type en une passe, puis premier backend non vide par priorité.
+        compute_device_type est fixé sur ce backend (sinon les devices OPTIX ne sont
+        pas utilisés). L'énumération (init driver coûteuse) n'est faite qu'une fois :
+        les appels suivants réutilisent self._gpu_devices.
+        
+        Returns:
+            Backend retenu ('OPTIX', 'CUDA', 'HIP', 'ONEAPI') ou 'NONE'
+        """
+        prefs = bpy.context.preferences.addons['cycles'].preferences
+        
+        if self._gpu_backend is None:
+            print("[INFO] RÉVEIL BRUTAL DU GPU - Détection du backend (OPTIX > CUDA > HIP > ONEAPI)...")
+            self._gpu_backend = 'NONE'
+            self._gpu_devices = []
+            prefs.refresh_devices()
+            devices_by_type = defaultdict(list)
+            for d in prefs.devices:
+                devices_by_type[d.type].append(d)
+            for backend in self.GPU_BACKENDS:
+                if not devices_by_type.get(backend):
+                    continue
+                try:
+                    prefs.compute_device_type = backend
+                except TypeError:
+                    # Backend non compilé dans ce build Blender
+                    continue
+                self._gpu_backend = backend
+                self._gpu_devices = devices_by_type[backend]
+                break
+        elif self._gpu_backend != 'NONE':
+            prefs.compute_device_type = self._gpu_backend
+        
+        return self._gpu_backend
+
+    def setup_gpu_devices(self, scene):
+        """
+        Active les périphériques du backend détecté (detect_gpu_devices) sur la scène
+        """
+        prefs = bpy.context.preferences.addons['cycles'].preferences
+        self.detect_gpu_devices()
+        
+        # Tuiles Cycles (rendu adaptatif 3.x+) : grandes tuiles en GPU, petites en CPU
+        scene.cycles.use_auto_tile = True
+        
+        if self._gpu_backend == 'NONE':
+            scene.cycles.device = 'CPU'
+            scene.cycles.tile_size = 64
+            print("[WARNING] Aucun GPU Cycles détecté - rendu CPU")
+            return
+        
+        # Uniquement le backend retenu (pas de mélange OPTIX+CUDA ni CPU+GPU) ;
+        # écriture RNA seulement si le flag change
+        for d in prefs.devices:
+            use = d.type == self._gpu_backend
+            if d.use != use:
+                d.use = use
+        scene.cycles.device = 'GPU'
+        scene.cycles.tile_size = 2048
+        print(f"[SUCCESS] GPU {self._gpu_backend} activé ({', '.join(d.name for d in self._gpu_devices)})")
+
     def import_assets(self):
         """
         Importe les assets 3D depuis Assets_Bank
@@ -250,7 +374,8 @@ class EXOForge:
         # ------------------------------
         # IMPORT DES AVATARS (LEGION DYNAMIQUE)
         # ------------------------------
-        # Déterminer la liste des IDs d'acteurs depuis la mission, sinon fallback single actor "0"
+        # Déterminer la liste des IDs d'acteurs depuis la mission (load_mission_data()
+        # appelé avant), sinon fallback single actor "0"
         actor_ids: List[str] = []
         if self.mission_data and isinstance(self.mission_data.get("actors"), dict):
             actor_ids = list(self.mission_data["actors"].keys())
@@ -276,7 +401,32 @@ class EXOForge:
                     break
             return arm, imported
 
+        # Helper : instancier un avatar déjà importé (même .glb) sans re-parser le fichier.
+        # Les objets sont dupliqués mais partagent leurs data-blocks (mesh, armature) ;
+        # les meshes à ShapeKeys reçoivent leur propre copie (lip-sync indépendant).
+        def _instance_gltf(template_arm, template_objects):
+            copies = {}
+            for o in template_objects:
+                c = o.copy()
+                if o.type == "MESH" and o.data.shape_keys:
+                    c.data = o.data.copy()
+                if c.animation_data and c.animation_data.action:
+                    c.animation_data.action = c.animation_data.action.copy()
+                copies[o] = c
+            for o, c in copies.items():
+                # Re-câbler parent et modificateurs Armature vers les copies
+                if o.parent in copies:
+                    c.parent = copies[o.parent]
+                for m in c.modifiers:
+                    if m.type == "ARMATURE" and m.object in copies:
+                        m.object = copies[m.object]
+                for coll in o.users_collection:
+                    coll.objects.link(c)
+            return copies.get(template_arm), list(copies.values())
+
         self.armatures_by_actor = {}
+        # Avatars déjà importés : chemin .glb → (armature, objets, noms d'origine)
+        imported_templates: Dict[Path, Tuple] = {}
 
         # LEGACY PATH : si Avatars/default.glb n'existe pas et qu'on est en single actor,
         # on tente l'ancien ASSETS_DIR/avatar.glb
@@ -302,8 +452,19 @@ class EXOForge:
                     f"(Fallback legacy single actor: {legacy_avatar_path})"
                 )
 
-            print(f"[INFO] Import avatar (actor {actor_id}) : {chosen_path}...")
-            armature, imported_objects = _import_gltf(chosen_path)
+            template = imported_templates.get(chosen_path)
+            if template is not None:
+                print(f"[INFO] Instanciation avatar (actor {actor_id}) depuis {chosen_path.name} (données partagées)")
+                armature, imported_objects = _instance_gltf(template[0], template[1])
+                source_names = [template[2][o] for o in template[1]]
+            else:
+                print(f"[INFO] Import avatar (actor {actor_id}) : {chosen_path}...")
+                armature, imported_objects = _import_gltf(chosen_path)
+                source_names = [o.name for o in imported_objects]
+                if armature is not None:
+                    imported_templates[chosen_path] = (
+                        armature, imported_objects, dict(zip(imported_objects, source_names))
+                    )
 
             if armature is None:
                 raise RuntimeError(
@@ -316,11 +477,11 @@ class EXOForge:
             self.armatures_by_actor[str(actor_id)] = armature
             print(f"[SUCCESS] Armature actor {actor_id} : {armature.name}")
 
-            for obj in imported_objects:
+            for obj, source_name in zip(imported_objects, source_names):
                 if obj == armature:
                     continue
                 if obj.type == "MESH":
-                    obj.name = f"EXO_Avatar_{actor_id}_{obj.name}"
+                    obj.name = f"EXO_Avatar_{actor_id}_{source_name}"
         
         # Compat legacy : self.armature pointe sur actor "0"
         self.armature = self.armatures_by_actor.get("0")
@@ -337,10 +498,9 @@ class EXOForge:
         """
         print("[INFO] Configuration de la caméra...")
         
-        # Créer une nouvelle caméra
-        bpy.ops.object.camera_add()
-        camera = bpy.context.active_object
-        camera.name = 'EXO_Camera'
+        # Créer une nouvelle caméra (API data : pas d'opérateur)
+        camera = bpy.data.objects.new('EXO_Camera', bpy.data.cameras.new('EXO_Camera'))
+        bpy.context.scene.collection.objects.link(camera)
         
         # Position : Hauteur d'yeux Roblox (Z=1.5m, Y=-3m, X=0m)
         camera.location = (0.0, -3.0, 1.5)
@@ -400,84 +560,199 @@ class EXOForge:
             print("[WARNING] Aucune donnée camera trouvée. Caméra statique.")
             return
         
-        scene = bpy.context.scene
-        fps = scene.render.fps
-        
         # Position initiale de la caméra (base)
         base_location = Vector(self.camera.location)
         base_rotation = Vector(self.camera.rotation_euler)
         
-        # Accumulateurs pour mouvement fluide (pas d'aléatoire, basé sur Optical Flow)
-        cumulative_x = 0.0
-        cumulative_y = 0.0
-        cumulative_z = 0.0
-        cumulative_rot_x = 0.0
-        cumulative_rot_y = 0.0
+        # Seules les frames avec données optical_flow sont animées
+        flow_frames = [fd for fd in camera_data if fd.get('optical_flow')]
+        n_frames = len(flow_frames)
         
         print(f"[INFO] Application de l'animation caméra sur {len(camera_data)} frames...")
         
-        # BOUCLE TEMPORELLE : Pour chaque frame avec données optical_flow
-        for frame_data in camera_data:
-            frame_number = frame_data.get('frame_number', 0)
-            optical_flow = frame_data.get('optical_flow', {})
-            
-            if not optical_flow:
-                continue
-            
-            # Récupérer magnitude, angle et flow_vectors
-            magnitude = optical_flow.get('magnitude', 0.0)
-            angle = optical_flow.get('angle', 0.0)
-            flow_vectors = optical_flow.get('flow_vectors', [])
-            
-            # Calculer la moyenne des vecteurs de flux (pour réduire le bruit)
+        # PRÉ-CALCUL VECTORISÉ (NumPy) : moyennes de flux, puis accumulateurs par cumsum
+        frame_numbers = [fd.get('frame_number', 0) for fd in flow_frames]
+        magnitude = np.fromiter(
+            (fd['optical_flow'].get('magnitude', 0.0) for fd in flow_frames), dtype=np.float64, count=n_frames
+        )
+        angle = np.fromiter(
+            (fd['optical_flow'].get('angle', 0.0) for fd in flow_frames), dtype=np.float64, count=n_frames
+        )
+        # Moyenne des vecteurs de flux (pour réduire le bruit), (0, 0) si aucun vecteur
+        flow_means = np.zeros((n_frames, 2), dtype=np.float64)
+        for i, fd in enumerate(flow_frames):
+            flow_vectors = fd['optical_flow'].get('flow_vectors')
             if flow_vectors:
-                avg_x = sum(v[0] for v in flow_vectors) / len(flow_vectors)
-                avg_y = sum(v[1] for v in flow_vectors) / len(flow_vectors)
-            else:
-                avg_x = 0.0
-                avg_y = 0.0
-            
-            # Appliquer le multiplicateur d'intensité (variation par variante)
-            scaled_x = avg_x * self.camera_intensity * 0.1  # Facteur d'échelle (0.1 pour éviter mouvements trop brusques)
-            scaled_y = avg_y * self.camera_intensity * 0.1
-            
-            # Accumuler le mouvement (mouvement fluide, pas de sauts)
-            cumulative_x += scaled_x
-            cumulative_y += scaled_y
-            cumulative_z += magnitude * self.camera_intensity * 0.01  # Légère variation Z basée sur magnitude
-            
-            # Rotation basée sur l'angle (mouvement de caméra pan/tilt)
-            rot_x = (angle - 3.14159) * 0.05 * self.camera_intensity  # Normalisation angle (0 à 2π)
-            rot_y = magnitude * 0.02 * self.camera_intensity
-            
-            cumulative_rot_x += rot_x * 0.1  # Lissage rotation
-            cumulative_rot_y += rot_y * 0.1
-            
-            # Définir la frame
-            scene.frame_set(frame_number)
-            
-            # Appliquer la position (base + mouvement accumulé)
-            new_location = Vector((
-                base_location.x + cumulative_x,
-                base_location.y + cumulative_y,
-                base_location.z + cumulative_z
-            ))
-            self.camera.location = new_location
-            
-            # Appliquer la rotation (base + rotation accumulée)
-            new_rotation = Vector((
-                base_rotation.x + cumulative_rot_x,
-                base_rotation.y + cumulative_rot_y,
-                base_rotation.z
-            ))
-            self.camera.rotation_euler = new_rotation
-            
-            # Insérer les keyframes
-            self.camera.keyframe_insert(data_path="location", frame=frame_number)
-            self.camera.keyframe_insert(data_path="rotation_euler", frame=frame_number)
+                flow_means[i] = np.asarray(flow_vectors, dtype=np.float64)[:, :2].mean(axis=0)
+        
+        intensity = self.camera_intensity
+        # Accumuler le mouvement (mouvement fluide, pas de sauts) ; facteur 0.1 pour
+        # éviter les mouvements trop brusques, légère variation Z basée sur magnitude
+        cumulative_x = np.cumsum(flow_means[:, 0] * intensity * 0.1)
+        cumulative_y = np.cumsum(flow_means[:, 1] * intensity * 0.1)
+        cumulative_z = np.cumsum(magnitude * intensity * 0.01)
+        # Rotation basée sur l'angle (pan/tilt), normalisation angle (0 à 2π), lissage 0.1
+        cumulative_rot_x = np.cumsum((angle - 3.14159) * 0.05 * intensity * 0.1)
+        cumulative_rot_y = np.cumsum(magnitude * 0.02 * intensity * 0.1)
+        # Lissage Savitzky-Golay des rotations (pan/tilt sans à-coups)
+        cumulative_rot_x = self._savgol_smooth(cumulative_rot_x)
+        cumulative_rot_y = self._savgol_smooth(cumulative_rot_y)
+        
+        # Positions / rotations absolues (base + mouvement accumulé)
+        locations = np.column_stack((
+            base_location.x + cumulative_x,
+            base_location.y + cumulative_y,
+            base_location.z + cumulative_z,
+        ))
+        rotations = np.column_stack((
+            base_rotation.x + cumulative_rot_x,
+            base_rotation.y + cumulative_rot_y,
+            np.full(n_frames, base_rotation.z),
+        ))
+        
+        # Keyframes en bloc (fcurves) : aucun aller-retour RNA par frame
+        self._bake_fcurves(self.camera, "location", frame_numbers, locations)
+        self._bake_fcurves(self.camera, "rotation_euler", frame_numbers, rotations)
         
         print(f"[SUCCESS] Animation caméra appliquée (intensité: {self.camera_intensity}x)")
 
+    @staticmethod
+    def _savgol_smooth(values: "np.ndarray", window_length: int = 15, polyorder: int = 3) -> "np.ndarray":
+        """
+        Filtre Savitzky-Golay (scipy si disponible, sinon convolution NumPy).
+        Bords en miroir sans répétition de l'échantillon de bord dans les deux
+        cas (scipy mode='mirror' = np.pad mode='reflect') : résultats identiques.
+        Séries plus courtes que la fenêtre : inchangées.
+        """
+        if len(values) < window_length:
+            return values
+        if savgol_filter is not None:
+            return savgol_filter(values, window_length=window_length, polyorder=polyorder, mode='mirror')
+        half = window_length // 2
+        offsets = np.arange(-half, half + 1, dtype=np.float64)
+        coeffs = np.linalg.pinv(np.vander(offsets, polyorder + 1, increasing=True))[0]
+        padded = np.pad(values, half, mode='reflect')
+        return np.convolve(padded, coeffs[::-1], mode='valid')
+
+    @staticmethod
+    def _bake_fcurves(id_owner, data_path: str, frames, values: "np.ndarray", group: Optional[str] = None,
+                      interpolation: Optional[str] = None):
+        """
+        Écrit les keyframes d'une propriété vectorielle en bloc
+        (keyframe_points.add + foreach_set) au lieu d'un keyframe_insert par frame.
+        
+        Les fcurves existantes pour data_path sont remplacées (ré-application
+        par variante).
+        
+        Args:
+            id_owner: Objet / data-block animé (porteur de l'action)
+            data_path: Chemin RNA de la propriété (ex: "location")
+            frames: Numéros de frames (N) ; une clé par frame, la dernière l'emporte
+                    (comme keyframe_insert)
+            values: Valeurs (N, C), une colonne par composante
+            group: Groupe d'action optionnel (ex: nom d'os)
+            interpolation: Interpolation forcée des clés (ex: 'CONSTANT'), sinon défaut Blender
+        """
+        frames = np.asarray(frames)
+        if len(frames) == 0:
+            return
+        values = np.asarray(values, dtype=np.float32).reshape(len(frames), -1)
+        # Dédoublonnage (dernière occurrence) + tri croissant des frames
+        frames_unique, last_from_end = np.unique(frames[::-1], return_index=True)
+        values = values[len(frames) - 1 - last_from_end]
+        frames = frames_unique
+        n_keys = len(frames)
+        
+        anim_data = id_owner.animation_data or id_owner.animation_data_create()
+        if anim_data.action is None:
+            anim_data.action = bpy.data.actions.new(name=f"{id_owner.name}_Action")
+        fcurves = anim_data.action.fcurves
+        
+        co = np.empty((n_keys, 2), dtype=np.float32)
+        co[:, 0] = frames
+        if interpolation is not None:
+            # foreach_set sur un enum attend sa valeur entière RNA
+            ipo_value = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items[interpolation].value
+            ipo = np.full(n_keys, ipo_value, dtype=np.int32)
+        
+        for index in range(values.shape[1]):
+            fcurve = fcurves.find(data_path, index=index)
+            if fcurve is not None:
+                fcurves.remove(fcurve)
+            if group:
+                fcurve = fcurves.new(data_path, index=index, action_group=group)
+            else:
+                fcurve = fcurves.new(data_path, index=index)
+            co[:, 1] = values[:, index]
+            fcurve.keyframe_points.add(n_keys)
+            fcurve.keyframe_points.foreach_set("co", co.ravel())
+            if interpolation is not None:
+                fcurve.keyframe_points.foreach_set("interpolation", ipo)
+            fcurve.update()
+
+    @staticmethod
+    def _rotation_difference_batch(bone_dirs: "np.ndarray", targets: "np.ndarray") -> "np.ndarray":
+        """
+        Équivalent vectorisé de Vector.rotation_difference (arc le plus court)
+        
+        Args:
+            bone_dirs: Directions par défaut des bones, unitaires (B, 3)
+            targets: Directions cibles unitaires (N, B, 3)
+        
+        Returns:
+            Quaternions (w, x, y, z) de forme (N, B, 4)
+        """
+        d = np.broadcast_to(bone_dirs, targets.shape)
+        # q = (1 + d·v, d×v) normalisé : demi-angle sans arccos
+        w = 1.0 + np.einsum('...i,...i->...', d, targets)
+        quats = np.concatenate((w[..., None], np.cross(d, targets)), axis=-1)
+        # Vecteurs opposés : rotation de π autour d'un axe orthogonal à d
+        opposite = w < 1e-6
+        if opposite.any():
+            d_opp = d[opposite]
+            axis = np.cross(d_opp, (1.0, 0.0, 0.0))
+            weak = np.linalg.norm(axis, axis=-1) < 1e-6
+            axis[weak] = np.cross(d_opp[weak], (0.0, 1.0, 0.0))
+            quats[opposite] = np.concatenate((np.zeros((len(axis), 1)), axis), axis=-1)
+        quats /= np.linalg.norm(quats, axis=-1, keepdims=True)
+        return quats
+
+    @staticmethod
+    def _smooth_quaternions(quats: "np.ndarray", factor: float = 0.7, tol: float = 1e-9) -> "np.ndarray":
+        """
+        Lissage récurrent q_k = nlerp(q_{k-1}, x_k, factor) sans boucle Python :
+        signes alignés sur un même hémisphère, moyenne exponentielle tronquée
+        (poids < tol négligés) puis normalisation. Écart < 0.1° avec la chaîne
+        de slerp pour des rotations voisines d'une frame à l'autre.
+        
+        Args:
+            quats: Quaternions (N, 4) [w, x, y, z] dans l'ordre des frames
+            factor: Poids de la nouvelle rotation
+        
+        Returns:
+            Quaternions lissés (N, 4), normalisés
+        """
+        q = np.array(quats, dtype=np.float64)
+        if len(q) < 2:
+            return q
+        # q et -q : même rotation ; on évite de moyenner à travers l'hémisphère opposé
+        flips = np.einsum('fi,fi->f', q[:-1], q[1:]) < 0
+        q[1:] *= np.where(np.cumsum(flips) % 2, -1.0, 1.0)[:, None]
+        # y_k = sum_j factor * (1 - factor)^j * x_{k-j}, la 1re frame répétée en amont
+        taps = int(np.ceil(np.log(tol) / np.log(1.0 - factor)))
+        weights = factor * (1.0 - factor) ** np.arange(taps)
+        padded = np.concatenate([np.repeat(q[:1], taps - 1, axis=0), q])
+        smoothed = np.lib.stride_tricks.sliding_window_view(padded, taps, axis=0) @ weights[::-1]
+        return smoothed / np.linalg.norm(smoothed, axis=-1, keepdims=True)
+
+    @staticmethod
+    def _new_light(name: str, light_type: str, location: Tuple[float, float, float]):
+        """Crée une lampe via bpy.data (sans opérateur light_add) et la lie à la scène"""
+        light = bpy.data.objects.new(name, bpy.data.lights.new(name, type=light_type))
+        light.location = location
+        bpy.context.scene.collection.objects.link(light)
+        return light
+
     def setup_lighting(self):
         """
         Configure l'éclairage procédural "Studio"
@@ -491,9 +766,7 @@ class EXOForge:
         
         # KEY LIGHT : Lumière principale (Area Light)
         print("[INFO] Création de la Key Light...")
-        bpy.ops.object.light_add(type='AREA', location=(3.0, -2.0, 2.5))
-        key_light = bpy.context.active_object
-        key_light.name = 'EXO_KeyLight'
+        key_light = self._new_light('EXO_KeyLight', 'AREA', (3.0, -2.0, 2.5))
         key_light.data.energy = 50.0  # Puissante
         key_light.data.size = 2.0  # Grande surface pour lumière douce
         key_light.data.color = (1.0, 0.95, 0.9)  # Légèrement chaud
@@ -502,9 +775,7 @@ class EXOForge:
         
         # FILL LIGHT : Lumière de débouchage (Area Light)
         print("[INFO] Création de la Fill Light...")
-        bpy.ops.object.light_add(type='AREA', location=(-3.0, -2.0, 1.5))
-        fill_light = bpy.context.active_object
-        fill_light.name = 'EXO_FillLight'
+        fill_light = self._new_light('EXO_FillLight', 'AREA', (-3.0, -2.0, 1.5))
         fill_light.data.energy = 20.0  # Plus douce que la Key
         fill_light.data.size = 1.5
         fill_light.data.color = (0.85, 0.9, 1.0)  # Teinte bleutée
@@ -513,9 +784,7 @@ class EXOForge:
         
         # RIM LIGHT : Lumière arrière (Point Light)
         print("[INFO] Création de la Rim Light...")
-        bpy.ops.object.light_add(type='POINT', location=(0.0, 2.0, 2.0))
-        rim_light = bpy.context.active_object
-        rim_light.name = 'EXO_RimLight'
+        rim_light = self._new_light('EXO_RimLight', 'POINT', (0.0, 2.0, 2.0))
         rim_light.data.energy = 30.0
         rim_light.data.color = (1.0, 0.7, 0.9)  # Teinte rose/violette (style Brookhaven)
         rim_light.data.shadow_soft_size = 0.5
@@ -538,8 +807,37 @@ class EXOForge:
                 f"[ERROR] Fichier mission introuvable : {self.mission_ready_path}"
             )
         
-        with open(self.mission_ready_path, 'r', encoding='utf-8') as f:
-            self.mission_data = json.load(f)
+        # CACHE ADRESSÉ PAR CONTENU : sha256 des octets → pickle déjà parsé
+        # (workers Blender successifs sur la même mission)
+        raw = self.mission_ready_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cache_dir = self.DATA_DIR / ".cache"
+        cache_path = cache_dir / f"mission_{digest}.pkl"
+        
+        self.mission_data = None
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    self.mission_data = pickle.load(f)
+                print(f"[INFO] Mission chargée depuis le cache ({cache_path.name})")
+            except Exception as e:
+                print(f"[WARNING] Cache mission illisible, re-parse JSON : {e}")
+        
+        if self.mission_data is None:
+            self.mission_data = _json.loads(raw)
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # Une seule entrée : les pickles d'anciennes missions sont purgés
+                for stale in cache_dir.glob("mission_*.pkl"):
+                    if stale != cache_path:
+                        stale.unlink(missing_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(self.mission_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp_path.replace(cache_path)
+            except OSError as e:
+                print(f"[WARNING] Écriture du cache mission impossible : {e}")
+        del raw
         
         # Vérification des blocs requis (PROTOCOLE BABEL)
         if 'actors' not in self.mission_data:
@@ -553,11 +851,45 @@ class EXOForge:
         actors = self.mission_data.get("actors", {})
         camera_motion = self.mission_data.get("camera_motion", [])
         
+        # Tenseurs SoA des landmarks de pose, une fois par acteur (source unique :
+        # pose_frames du JSON ; le sidecar du Segment 01 ne porte que les visages)
+        self.landmarks_by_actor = {
+            str(actor_id): self._pose_landmark_tensor(actor_data.get("pose_frames", []))
+            for actor_id, actor_data in actors.items()
+        }
+        
         print(f"[SUCCESS] Données de mission chargées (PROTOCOLE BABEL)")
         print(f"[INFO] Acteurs : {len(actors.keys())}")
         print(f"[INFO] Frames camera_motion : {len(camera_motion)}")
         print(f"[EXO] PROTOCOLE ORACLE 60 : SOURCE: {self.fps_source} FPS -> TARGET: {self.fps_target} FPS (RATIO: {self.ratio_fps:.3f})")
 
+    @staticmethod
+    def _pose_landmark_tensor(pose_frames: List[Dict]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Convertit les pose_frames (liste de dicts {landmark_id, x, y, z, visibility})
+        en tenseur contigu float32 (frames, 33, 4) : x, y, z, visibility.
+        Landmark absent : x/y/z = NaN, visibility = 0.
+        
+        Returns:
+            (frame_numbers source (N,), tenseur (N, 33, 4))
+        """
+        n_frames = len(pose_frames)
+        frame_numbers = np.fromiter(
+            (pf.get("frame_number", 0) for pf in pose_frames), dtype=np.int64, count=n_frames
+        )
+        tensor = np.full((n_frames, N_POSE_LANDMARKS, 4), np.nan, dtype=np.float32)
+        tensor[..., 3] = 0.0
+        for frame_idx, pose_frame in enumerate(pose_frames):
+            # reversed : le premier doublon d'un ID gagne
+            for landmark in reversed(pose_frame.get("landmarks", [])):
+                landmark_id = landmark.get("landmark_id")
+                if isinstance(landmark_id, int) and 0 <= landmark_id < N_POSE_LANDMARKS:
+                    tensor[frame_idx, landmark_id] = (
+                        landmark.get("x", np.nan), landmark.get("y", np.nan),
+                        landmark.get("z", np.nan), landmark.get("visibility", 0),
+                    )
+        return frame_numbers, tensor
+
     def apply_animation(self):
         """
         Applique les animations depuis EXO_MISSION_READY.json
@@ -600,8 +932,9 @@ class EXOForge:
         }
         
         # Helper : appliquer une animation à UNE armature à partir d'une liste motion_data
-        def _apply_animation_to_armature(target_armature, motion_data):
+        def _apply_animation_to_armature(target_armature, frame_numbers_source, landmarks):
             """
+            landmarks : tenseur SoA (frames, 33, [x, y, z, visibility]) de load_mission_data
             Applique l'animation à une armature et retourne TOUJOURS un entier (nombre de frames animées).
             Retourne 0 si aucune animation n'est appliquée ou en cas d'erreur.
             """
@@ -613,106 +946,63 @@ class EXOForge:
                 # Récupérer les bones
                 pose_bones = target_armature.pose.bones
                 
-                # Fonction helper pour trouver un landmark par ID
-                def find_landmark(landmarks, landmark_id):
-                    """Trouve un landmark par son ID"""
-                    for landmark in landmarks:
-                        if landmark.get('landmark_id') == landmark_id:
-                            return landmark
-                    return None
-                
-                # Fonction helper pour calculer la rotation quaternion
-                def calculate_bone_rotation(start_landmark, end_landmark, bone_default_dir):
-                    """
-                    Calcule la rotation quaternion pour aligner un bone sur un vecteur
-                    
-                    Args:
-                        start_landmark: Landmark de départ (dict avec x, y, z)
-                        end_landmark: Landmark d'arrivée (dict avec x, y, z)
-                        bone_default_dir: Direction par défaut du bone (Vector)
-                    
-                    Returns:
-                        Quaternion de rotation
-                    """
-                    if start_landmark is None or end_landmark is None:
-                        return None
-                    
-                    # Vecteur directeur MediaPipe (Point_B - Point_A)
-                    mp_vector = Vector((
-                        end_landmark['x'] - start_landmark['x'],
-                        end_landmark['y'] - start_landmark['y'],
-                        end_landmark['z'] - start_landmark['z']
-                    ))
-                    
-                    # Normaliser
-                    if mp_vector.length == 0:
-                        return None
-                    
-                    mp_vector.normalize()
-                    
-                    # Direction par défaut du bone (normalisée)
-                    bone_dir = bone_default_dir.normalized()
-                    
-                    # Calculer la rotation pour aligner bone_dir sur mp_vector
-                    # Utiliser rotation_difference pour obtenir le quaternion
-                    try:
-                        rotation = bone_dir.rotation_difference(mp_vector)
-                        return rotation
-                    except:
-                        # Fallback : rotation identité si échec
-                        return Quaternion((1, 0, 0, 0))
-                
-                # Lissage simple (moyenne mobile sur 3 frames)
-                previous_rotations = {}
+                # Résolution des bones une seule fois (variantes de nommage)
+                bones = []
+                for bone_name, (start_id, end_id) in bone_mapping.items():
+                    if bone_name not in pose_bones:
+                        bone_found = None
+                        for variant in [bone_name, bone_name.lower(), bone_name.upper(),
+                                       f"Left{bone_name}", f"Right{bone_name}"]:
+                            if variant in pose_bones:
+                                bone_found = variant
+                                break
+                        if bone_found is None:
+                            continue
+                        bone_name = bone_found
 
-                total_frames = len(motion_data)
+                    bone = pose_bones[bone_name]
+                    bone_vector = bone.tail - bone.head
+                    bone_default_dir = (
+                        tuple(bone_vector.normalized()) if bone_vector.length > 0 else _DEFAULT_BONE_DIR
+                    )
+                    bones.append((bone_name, start_id, end_id, bone_default_dir))
+
+                total_frames = len(frame_numbers_source)
                 print(f"[INFO] Application de l'animation sur {total_frames} frames → {target_armature.name}")
 
-                for frame_idx, frame_data in enumerate(motion_data):
-                    frame_number_source = frame_data.get('frame_number', frame_idx)
+                if bones and total_frames:
                     # PROTOCOLE ORACLE 60 : REMAPPING TEMPOREL
-                    frame_number = int(frame_number_source * self.ratio_fps)
-                    pose_landmarks = frame_data.get('pose_landmarks', [])
-
-                    bpy.context.scene.frame_set(frame_number)
-
-                    for bone_name, (start_id, end_id) in bone_mapping.items():
-                        if bone_name not in pose_bones:
-                            bone_found = None
-                            for variant in [bone_name, bone_name.lower(), bone_name.upper(),
-                                           f"Left{bone_name}", f"Right{bone_name}"]:
-                                if variant in pose_bones:
-                                    bone_found = variant
-                                    break
-                            if bone_found is None:
-                                continue
-                            bone_name = bone_found
-
-                        bone = pose_bones[bone_name]
-
-                        start_landmark = find_landmark(pose_landmarks, start_id)
-                        end_landmark = find_landmark(pose_landmarks, end_id)
+                    frame_numbers = (frame_numbers_source * self.ratio_fps).astype(np.int64)
+                    positions = landmarks[..., :3]
+                    visibility = landmarks[..., 3]
 
-                        if start_landmark and start_landmark.get('visibility', 0) < 0.5:
-                            continue
-                        if end_landmark and end_landmark.get('visibility', 0) < 0.5:
-                            continue
+                    # Vecteurs directeurs MediaPipe (Point_B - Point_A), tous bones / frames
+                    start_ids = [start_id for _, start_id, _, _ in bones]
+                    end_ids = [end_id for _, _, end_id, _ in bones]
+                    mp_vectors = (positions[:, end_ids] - positions[:, start_ids]).astype(np.float64)
+                    lengths = np.linalg.norm(mp_vectors, axis=-1)
+                    with np.errstate(invalid='ignore'):
+                        valid = (
+                            (visibility[:, start_ids] >= 0.5)
+                            & (visibility[:, end_ids] >= 0.5)
+                            & (lengths > 0)
+                        )
+                    mp_vectors[~valid] = _DEFAULT_BONE_DIR
+                    lengths[~valid] = 1.0
+                    mp_vectors /= lengths[..., None]
 
-                        bone_default_dir = (bone.tail - bone.head).normalized()
-                        if bone_default_dir.length == 0:
-                            bone_default_dir = Vector((0, 1, 0))
+                    bone_dirs = np.array([bone_dir for _, _, _, bone_dir in bones])
+                    rotations = self._rotation_difference_batch(bone_dirs, mp_vectors)
 
-                        rotation = calculate_bone_rotation(start_landmark, end_landmark, bone_default_dir)
-                        if rotation is None:
+                    for bone_idx, (bone_name, _, _, _) in enumerate(bones):
+                        rows = np.flatnonzero(valid[:, bone_idx])
+                        if len(rows) == 0:
                             continue
+                        # Lissage (0.7 vers la nouvelle rotation), vectorisé
+                        smoothed = self._smooth_quaternions(rotations[rows, bone_idx], 0.7)
 
-                        if bone_name in previous_rotations:
-                            prev_rot = previous_rotations[bone_name]
-                            rotation = prev_rot.slerp(rotation, 0.7)
-
-                        bone.rotation_quaternion = rotation
-                        bone.keyframe_insert(data_path="rotation_quaternion", frame=frame_number)
-                        previous_rotations[bone_name] = rotation
+                        data_path = f'pose.bones["{bpy.utils.escape_identifier(bone_name)}"].rotation_quaternion'
+                        self._bake_fcurves(target_armature, data_path, frame_numbers[rows], smoothed, group=bone_name)
 
                 bpy.ops.object.mode_set(mode='OBJECT')
                 return total_frames
@@ -727,20 +1017,11 @@ class EXOForge:
 
         total_applied = 0
         for actor_id, arm in self.armatures_by_actor.items():
-            # BABEL : lecture directe de mission_data["actors"][id]["pose_frames"]
-            motion_for_actor = []
-            actors_block = self.mission_data.get("actors", {})
-            actor_data = actors_block.get(str(actor_id), {})
-            for pose_frame in actor_data.get("pose_frames", []):
-                # Adapter au format attendu par _apply_animation_to_armature
-                motion_for_actor.append(
-                    {
-                        "frame_number": pose_frame.get("frame_number", 0),
-                        "pose_landmarks": pose_frame.get("landmarks", []),
-                    }
-                )
-
-            frames_anim = _apply_animation_to_armature(arm, motion_for_actor) or 0
+            # BABEL : tenseur pré-calculé depuis mission_data["actors"][id]["pose_frames"]
+            frame_numbers_source, landmarks = self.landmarks_by_actor.get(
+                str(actor_id), self._pose_landmark_tensor([])
+            )
+            frames_anim = _apply_animation_to_armature(arm, frame_numbers_source, landmarks) or 0
             total_applied = max(total_applied, frames_anim)
 
         print(f"[SUCCESS] Animation appliquée (LEGION DYNAMIQUE) sur {len(self.armatures_by_actor)} acteur(s)")
@@ -821,8 +1102,11 @@ class EXOForge:
             'X': 0.0,  # Fermé
         }
         
-        scene = bpy.context.scene
-        fps = scene.render.fps
+        # Keyframes collectés puis écrits en bloc (_bake_fcurves) : ni frame_set
+        # (évaluation depsgraph complète) ni keyframe_insert par frame
+        key_frames: List[int] = []
+        key_values: List[float] = []
+        key_interpolation = None
         
         applied_anything = False
 
@@ -847,12 +1131,12 @@ class EXOForge:
                 # Ratio d'ouverture
                 ratio = rhubarb_to_ratio.get(value, 0.0)
                 
-                # Appliquer sur la plage de frames
-                for frame in range(start_frame, end_frame + 1):
-                    scene.frame_set(frame)
-                    mouth_shape_key.value = ratio
-                    mouth_shape_key.keyframe_insert(data_path="value", frame=frame)
+                # Cue constant par morceaux : une clé au début et à la fin suffit
+                # (interpolation CONSTANT) ; le début du cue suivant l'emporte
+                key_frames.extend((start_frame, end_frame))
+                key_values.extend((ratio, ratio))
             
+            key_interpolation = 'CONSTANT'
             applied_anything = True
         
         # 2) Sinon, fallback sur mouth_open_ratio de l'acteur 0 (SCANNER UNIVERSEL)
@@ -868,16 +1152,78 @@ class EXOForge:
                     # PROTOCOLE ORACLE 60 : Remapping vers frame cible
                     frame_number = int(frame_number_source * self.ratio_fps)
                     ratio = float(mf.get("mouth_open_ratio", 0.0))
-                    scene.frame_set(frame_number)
-                    mouth_shape_key.value = ratio
-                    mouth_shape_key.keyframe_insert(data_path="value", frame=frame_number)
+                    key_frames.append(frame_number)
+                    key_values.append(ratio)
                 applied_anything = True
         
+        if key_frames:
+            data_path = f'key_blocks["{bpy.utils.escape_identifier(mouth_shape_key.name)}"].value'
+            self._bake_fcurves(shape_keys, data_path, key_frames, key_values, interpolation=key_interpolation)
+        
         if not applied_anything:
             print("[WARNING] Aucune donnée de lip-sync appliquée (Rhubarb ni mouth_open_ratio)")
         else:
             print("[SUCCESS] Lip-sync appliqué avec succès")
 
+    def _resolve_audio(self) -> Optional[Path]:
+        """
+        Fichier audio de la mission, recherché une seule fois (rendu et post-prod
+        de toutes les variantes) :
+        mouth.metadata.soundFile → Final_Audio/EXO_VOICE_FINAL.mp3 → Voice_Samples/*.mp3|*.wav
+        
+        Returns:
+            Chemin de l'audio, ou None si aucun fichier trouvé
+        """
+        if self._audio_path is None:
+            audio_path = None
+            
+            # Essayer depuis mouth.metadata.soundFile
+            mouth_metadata = self.mission_data.get('mouth', {}).get('metadata', {})
+            if 'soundFile' in mouth_metadata:
+                audio_path = Path(mouth_metadata['soundFile'])
+                if not audio_path.exists():
+                    # Convertir chemin Windows en chemin relatif si nécessaire
+                    audio_path = None
+            
+            # Essayer depuis Final_Audio/EXO_VOICE_FINAL.mp3 (chemin par défaut)
+            if audio_path is None:
+                default_audio = self.segment02_dir / "Final_Audio" / "EXO_VOICE_FINAL.mp3"
+                if default_audio.exists():
+                    audio_path = default_audio
+                    print(f"[INFO] Audio trouvé (chemin par défaut) : {audio_path}")
+                else:
+                    # Essayer Voice_Samples/
+                    voice_samples = list((self.segment02_dir / "Voice_Samples").glob("*.mp3"))
+                    voice_samples.extend(list((self.segment02_dir / "Voice_Samples").glob("*.wav")))
+                    if voice_samples:
+                        audio_path = voice_samples[0]
+                        print(f"[INFO] Audio trouvé (Voice_Samples) : {audio_path}")
+            
+            self._audio_path = audio_path or False
+        return self._audio_path or None
+
+    # Espace libre minimal de /dev/shm pour y déposer les rendus intermédiaires
+    RENDER_STAGING_MIN_FREE = 4 * 1024 ** 3
+
+    def _render_staging_dir(self) -> Path:
+        """
+        Dossier des rendus intermédiaires (relus par la post-prod puis supprimés) :
+        tmpfs /dev/shm si disponible avec assez d'espace libre (pas d'aller-retour
+        disque entre Blender et FFmpeg), sinon OUTPUT_DIR
+        """
+        if self._staging_dir is None:
+            self._staging_dir = self.OUTPUT_DIR
+            shm = Path("/dev/shm")
+            try:
+                if shm.is_dir() and shutil.disk_usage(shm).free >= self.RENDER_STAGING_MIN_FREE:
+                    staging = shm / f"exo_render_{os.getpid()}"
+                    staging.mkdir(exist_ok=True)
+                    self._staging_dir = staging
+                    print(f"[INFO] Rendus intermédiaires en RAM : {staging}")
+            except OSError:
+                pass
+        return self._staging_dir
+
     def render_video(self, variant_id: int = 0):
         """
         Configure le rendu et lance l'export vidéo
@@ -901,40 +1247,19 @@ class EXOForge:
             print("[INFO] Sequence editor créé")
         
         # Récupérer le chemin du fichier audio
-        audio_path = None
-        
-        # Essayer depuis mouth.metadata.soundFile
-        mouth_metadata = self.mission_data.get('mouth', {}).get('metadata', {})
-        if 'soundFile' in mouth_metadata:
-            audio_path = Path(mouth_metadata['soundFile'])
-            if not audio_path.exists():
-                # Convertir chemin Windows en chemin relatif si nécessaire
-                audio_path = None
-        
-        # Essayer depuis Final_Audio/EXO_VOICE_FINAL.mp3 (chemin par défaut)
-        if audio_path is None or not audio_path.exists():
-            default_audio = self.segment02_dir / "Final_Audio" / "EXO_VOICE_FINAL.mp3"
-            if default_audio.exists():
-                audio_path = default_audio
-                print(f"[INFO] Audio trouvé (chemin par défaut) : {audio_path}")
-            else:
-                # Essayer Voice_Samples/
-                voice_samples = list((self.segment02_dir / "Voice_Samples").glob("*.mp3"))
-                voice_samples.extend(list((self.segment02_dir / "Voice_Samples").glob("*.wav")))
-                if voice_samples:
-                    audio_path = voice_samples[0]
-                    print(f"[INFO] Audio trouvé (Voice_Samples) : {audio_path}")
+        audio_path = self._resolve_audio()
+        
+        # Nettoyer les séquences audio existantes (éviter les doublons, et aucune
+        # piste héritée d'une mission précédente en mode silencieux)
+        sequences_to_remove = [seq for seq in scene.sequence_editor.sequences if seq.type == 'SOUND']
+        for seq in sequences_to_remove:
+            scene.sequence_editor.sequences.remove(seq)
         
         # Ajouter l'audio à la timeline si trouvé
         audio_found = False
-        if audio_path and audio_path.exists():
+        if audio_path is not None:
             print(f"[INFO] Ajout de l'audio à la timeline : {audio_path.name}")
             
-            # Nettoyer les séquences audio existantes (éviter les doublons)
-            sequences_to_remove = [seq for seq in scene.sequence_editor.sequences if seq.type == 'SOUND']
-            for seq in sequences_to_remove:
-                scene.sequence_editor.sequences.remove(seq)
-            
             # Ajouter le nouveau fichier audio
             sound_strip = scene.sequence_editor.sequences.new_sound(
                 name="EXO_Audio",
@@ -987,9 +1312,11 @@ class EXOForge:
         print(f"[INFO] Frame start : {scene.frame_start}, Frame end : {scene.frame_end}")
         
         # 3. CONFIGURATION DE SORTIE (nom unique par variante)
+        # Rendu intermédiaire distinct du fichier final : la post-prod le relit
+        # pendant que la variante suivante est rendue
         mission_id = self.mission_data.get('metadata', {}).get('mission_id', 'EXO_MISSION_UNKNOWN')
-        output_filename = f"EXO_MISSION_{variant_id:03d}.mp4"
-        output_path = self.OUTPUT_DIR / output_filename
+        output_filename = f"EXO_RENDER_{variant_id:03d}.mp4"
+        output_path = self._render_staging_dir() / output_filename
         
         # Assurer que le dossier de sortie existe
         self.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -1011,7 +1338,10 @@ class EXOForge:
         
         try:
             # Lancer le rendu de l'animation complète
-            bpy.ops.render.render(animation=True)
+            if self.render_workers > 1:
+                self._render_frame_chunks(scene, output_path)
+            else:
+                bpy.ops.render.render(animation=True)
             
             print("=" * 60)
             print(f"[SUCCESS] Rendu terminé avec succès !")
@@ -1040,6 +1370,107 @@ class EXOForge:
         # Retourner le chemin du fichier rendu pour post-prod
         return output_path
 
+    def _render_frame_chunks(self, scene, output_path: Path):
+        """
+        Rendu parallèle : la scène est sauvegardée en .blend, puis render_workers
+        processus Blender headless rendent chacun une plage de frames en PNG
+        (un GPU par processus s'il y en a plusieurs), et FFmpeg assemble la séquence.
+        
+        Args:
+            scene: Scène à rendre (frame_start / frame_end déjà fixés)
+            output_path: Vidéo assemblée (sans audio : la post-prod ajoute la piste)
+        """
+        n_frames = scene.frame_end - scene.frame_start + 1
+        workers = max(1, min(self.render_workers, n_frames))
+        # Séquence PNG sur le disque de sortie (trop volumineuse pour la RAM)
+        frames_dir = self.OUTPUT_DIR / f".{output_path.stem}_frames"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        blend_path = frames_dir / "scene.blend"
+        bpy.ops.wm.save_as_mainfile(filepath=str(blend_path), copy=True)
+        
+        # Les préférences Cycles ne sont pas dans le .blend : même backend que ce processus
+        setup_args = []
+        if self._gpu_backend not in (None, 'NONE'):
+            setup_args = ["--python-expr", (
+                "import bpy; p = bpy.context.preferences.addons['cycles'].preferences; "
+                f"p.compute_device_type = '{self._gpu_backend}'; p.refresh_devices(); "
+                f"[setattr(d, 'use', d.type == '{self._gpu_backend}') for d in p.devices]"
+            )]
+        pin_gpus = self._gpu_backend in ('OPTIX', 'CUDA') and len(self._gpu_devices) > 1
+        
+        bounds = np.linspace(scene.frame_start, scene.frame_end + 1, workers + 1).astype(int)
+        print(f"[INFO] Rendu parallèle : {n_frames} frames sur {workers} processus Blender")
+        processes = []
+        for worker_index, (start, end) in enumerate(zip(bounds[:-1], bounds[1:] - 1)):
+            cmd = [
+                bpy.app.binary_path,
+                "--background", str(blend_path),
+                *setup_args,
+                "--render-output", str(frames_dir / "frame_####"),
+                "--render-format", "PNG",
+                "--frame-start", str(start),
+                "--frame-end", str(end),
+                "--render-anim",
+            ]
+            env = os.environ
+            if pin_gpus:
+                env = {**os.environ, "CUDA_VISIBLE_DEVICES": str(worker_index % len(self._gpu_devices))}
+            print(f"[INFO] Processus {worker_index} → frames {start} → {end}")
+            processes.append(subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL))
+        
+        return_codes = [p.wait() for p in processes]
+        if any(return_codes):
+            raise RuntimeError(f"Rendu parallèle échoué (codes {return_codes})")
+        
+        fps = scene.render.fps / scene.render.fps_base
+        mux = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-framerate", f"{fps:g}",
+                "-start_number", str(scene.frame_start),
+                "-i", str(frames_dir / "frame_%04d.png"),
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", "12", "-pix_fmt", "yuv420p",
+                "-y", str(output_path),
+            ],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        if mux.returncode != 0:
+            raise RuntimeError(f"Assemblage FFmpeg échoué : {mux.stderr[-4096:].decode(errors='replace')}")
+        shutil.rmtree(frames_dir, ignore_errors=True)
+
+    # Arguments d'encodage vidéo de la post-prod
+    NVENC_ARGS = ["-c:v", "h264_nvenc", "-preset", "p5", "-tune", "hq", "-rc", "vbr", "-cq", "20", "-b:v", "0"]
+    X264_ARGS = ["-c:v", "libx264", "-preset", "slow", "-crf", "18"]  # CRF 18 = perceptually lossless
+
+    # Encodeurs H.264 matériels par ordre de priorité : (encodage, décodage matériel de l'entrée)
+    HW_ENCODERS = {
+        "h264_nvenc": (NVENC_ARGS, ["-hwaccel", "cuda"]),
+        "h264_videotoolbox": (["-c:v", "h264_videotoolbox", "-q:v", "60"], ["-hwaccel", "videotoolbox"]),
+        "h264_qsv": (["-c:v", "h264_qsv", "-preset", "slow", "-global_quality", "20"], ["-hwaccel", "qsv"]),
+    }
+
+    def _hw_encoder(self) -> Optional[str]:
+        """Détecte (une fois) le premier encodeur de HW_ENCODERS compilé dans le ffmpeg du PATH"""
+        with self._hwenc_lock:
+            if self._hwenc is None:
+                try:
+                    encoders = subprocess.run(
+                        ["ffmpeg", "-hide_banner", "-encoders"],
+                        capture_output=True, text=True, timeout=30
+                    ).stdout
+                except (OSError, subprocess.TimeoutExpired):
+                    encoders = ""
+                self._hwenc = next((name for name in self.HW_ENCODERS if name in encoders), "")
+                print(f"[INFO] Encodeur post-prod : {self._hwenc + ' (GPU)' if self._hwenc else 'libx264 (CPU)'}")
+            return self._hwenc or None
+
+    def _disable_hw_encoder(self, hw_encoder: str):
+        """Repli libx264 pour les variantes suivantes (une seule fois, quel que soit le thread)"""
+        with self._hwenc_lock:
+            if self._hwenc == hw_encoder:
+                print(f"[WARNING] Encodage {hw_encoder} échoué, repli libx264")
+                self._hwenc = ""
+
     def post_prod_ghost(self, rendered_video_path: Path, variant_id: int = 0):
         """
         POST-PROD GHOST (FFMPEG)
@@ -1060,24 +1491,9 @@ class EXOForge:
         print(f"[INFO] Post-Prod Ghost (variante {variant_id})...")
         
         # Trouver le fichier audio source
-        audio_path = None
-        mouth_metadata = self.mission_data.get('mouth', {}).get('metadata', {})
-        if 'soundFile' in mouth_metadata:
-            audio_path = Path(mouth_metadata['soundFile'])
-            if not audio_path.exists():
-                audio_path = None
-        
-        if audio_path is None or not audio_path.exists():
-            default_audio = self.segment02_dir / "Final_Audio" / "EXO_VOICE_FINAL.mp3"
-            if default_audio.exists():
-                audio_path = default_audio
-            else:
-                voice_samples = list((self.segment02_dir / "Voice_Samples").glob("*.mp3"))
-                voice_samples.extend(list((self.segment02_dir / "Voice_Samples").glob("*.wav")))
-                if voice_samples:
-                    audio_path = voice_samples[0]
+        audio_path = self._resolve_audio()
         
-        if not audio_path or not audio_path.exists():
+        if audio_path is None:
             print("[WARNING] Aucun fichier audio trouvé. Post-prod sans audio.")
             return rendered_video_path
         
@@ -1090,8 +1506,9 @@ class EXOForge:
         
         # Générer un seed unique pour cette variante (basé sur variant_id + timestamp)
         # Pour avoir un noise différent à chaque fois, mais déterministe par variante
-        random.seed(variant_id * 137)  # Seed déterministe par variante
-        noise_strength = random.uniform(0.4, 0.6)  # 0.4% à 0.6% (proche de 0.5%)
+        # Générateur local : la post-prod tourne en parallèle du rendu de la variante suivante
+        rng = random.Random(variant_id * 137)  # Seed déterministe par variante
+        noise_strength = rng.uniform(0.4, 0.6)  # 0.4% à 0.6% (proche de 0.5%)
         
         # Décalage audio : 0.01s (variant_id détermine le sens)
         audio_delay = 0.01 if variant_id % 2 == 0 else -0.01
@@ -1099,79 +1516,74 @@ class EXOForge:
         print(f"[INFO] Noise : {noise_strength:.3f}%")
         print(f"[INFO] Décalage audio : {audio_delay:.3f}s")
         
-        # Commande FFmpeg pour post-production
-        # Tâche A + B + C : Fusion image+audio, logo (si présent), noise, décalage audio
-        cmd = [
-            "ffmpeg",
-            "-i", str(rendered_video_path.resolve()),  # Vidéo Blender
-            "-i", str(audio_path.resolve()),  # Audio source
-            "-filter_complex",
-            f"[0:v]noise=alls={noise_strength:.3f}:allf=t+u[v_noised]",  # Tâche C : Noise
-            "-map", "[v_noised]",
-            "-map", "1:a",  # Audio
-            "-af", f"adelay={int(audio_delay * 1000)}|{int(audio_delay * 1000)}",  # Tâche C : Décalage audio (ms)
-            "-c:v", "libx264",  # Codec vidéo H.264
-            "-c:a", "aac",  # Codec audio AAC
-            "-preset", "slow",  # Compression lente = meilleure qualité
-            "-crf", "18",  # CRF 18 = High Quality (perceptually lossless)
-            "-movflags", "+faststart",  # Fast start pour streaming web
-            "-y",  # Overwrite si existe
-            str(output_path.resolve())
-        ]
+        # Encodeur vidéo : bloc matériel (NVENC / VideoToolbox / QSV) si présent, avec
+        # décodage matériel de la vidéo Blender, sinon x264
+        hw_encoder = self._hw_encoder()
+        video_codec_args, decode_args = self.HW_ENCODERS.get(hw_encoder, (self.X264_ARGS, []))
         
         # Tâche B : Logo (si fichier présent, ajouter overlay)
-        if logo_path.exists():
+        with_logo = logo_path.exists()
+        if with_logo:
             print(f"[INFO] Logo trouvé : {logo_path.name}")
-            # Commande FFmpeg avec logo overlay
-            cmd_logo = [
-                "ffmpeg",
-                "-i", str(rendered_video_path.resolve()),
-                "-i", str(audio_path.resolve()),
-                "-i", str(logo_path.resolve()),
-                "-filter_complex",
-                f"[0:v]noise=alls={noise_strength:.3f}:allf=t+u[v_noised];"
-                f"[v_noised][2:v]overlay=W-w-20:20[v_logo]",  # Logo en haut à droite
-                "-map", "[v_logo]",
-                "-map", "1:a",
-                "-af", f"adelay={int(audio_delay * 1000)}|{int(audio_delay * 1000)}",
-                "-c:v", "libx264",
-                "-c:a", "aac",
-                "-preset", "slow",
-                "-crf", "18",
-                "-movflags", "+faststart",
-                "-y",
+        
+        def build_cmd(video_codec_args, decode_args):
+            # Commande FFmpeg pour post-production
+            # Tâche A + B + C : Fusion image+audio, logo (si présent), noise, décalage audio
+            inputs = [
+                *decode_args, "-i", str(rendered_video_path.resolve()),  # Vidéo Blender
+                "-i", str(audio_path.resolve()),  # Audio source
+            ]
+            filter_graph = f"[0:v]noise=alls={noise_strength:.3f}:allf=t+u[v_noised]"  # Tâche C : Noise
+            video_map = "[v_noised]"
+            if with_logo:
+                inputs += ["-i", str(logo_path.resolve())]
+                filter_graph += ";[v_noised][2:v]overlay=W-w-20:20[v_logo]"  # Logo en haut à droite
+                video_map = "[v_logo]"
+            return [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                *inputs,
+                "-filter_complex", filter_graph,
+                "-map", video_map,
+                "-map", "1:a",  # Audio
+                "-af", f"adelay={int(audio_delay * 1000)}|{int(audio_delay * 1000)}",  # Tâche C : Décalage audio (ms)
+                *video_codec_args,  # Codec vidéo H.264 (matériel si disponible, sinon libx264 slow CRF 18)
+                "-c:a", "aac",  # Codec audio AAC
+                "-movflags", "+faststart",  # Fast start pour streaming web
+                "-y",  # Overwrite si existe
                 str(output_path.resolve())
             ]
-            cmd = cmd_logo
+        
+        cmd = build_cmd(video_codec_args, decode_args)
         
         print(f"[INFO] Exécution FFmpeg : {' '.join(cmd[:10])}...")  # Afficher les premiers arguments
         
+        # stdout ignoré, stderr (erreurs seulement) gardé en octets et décodé en cas d'échec
+        ffmpeg_io = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE, "timeout": 600}  # 10 minutes max
+        
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minutes max
-            )
+            result = subprocess.run(cmd, **ffmpeg_io)
+            
+            if result.returncode != 0 and hw_encoder is not None:
+                # Encodeur compilé mais matériel indisponible : nouvelle tentative en libx264
+                self._disable_hw_encoder(hw_encoder)
+                cmd = build_cmd(self.X264_ARGS, [])
+                result = subprocess.run(cmd, **ffmpeg_io)
             
             if result.returncode != 0:
-                print(f"[ERROR] FFmpeg a échoué : {result.stderr}")
+                print(f"[ERROR] FFmpeg a échoué : {result.stderr[-4096:].decode(errors='replace')}")
                 return rendered_video_path  # Retourner l'original si échec
             
             # Vérifier que le fichier final existe
             if output_path.exists():
                 file_size_mb = output_path.stat().st_size / (1024 * 1024)
                 
-                # Calculer le hash MD5 du fichier (pour vérifier unicité YouTube)
-                md5_hash = hashlib.md5()
-                with open(output_path, 'rb') as f:
-                    for chunk in iter(lambda: f.read(4096), b''):
-                        md5_hash.update(chunk)
-                file_hash = md5_hash.hexdigest()
+                # Signature d'unicité YouTube : le noise seedé par variante rend déjà chaque
+                # fichier unique, on journalise ses paramètres au lieu de relire la vidéo
+                signature = f"seed={variant_id * 137} noise={noise_strength:.3f} delay={audio_delay:+.3f}s"
                 
                 print(f"[SUCCESS] Post-prod terminée : {output_path.name}")
                 print(f"[INFO] Taille : {file_size_mb:.2f} MB")
-                print(f"[INFO] Hash MD5 : {file_hash[:16]}... (unique pour YouTube)")
+                print(f"[INFO] Signature : {signature} (unique pour YouTube)")
                 
                 return output_path
             else:
@@ -1187,7 +1599,71 @@ class EXOForge:
             traceback.print_exc()
             return rendered_video_path
 
-    def run(self, num_variantes: int = 1):
+    # FFmpeg de post-prod simultanés (en parallèle du rendu Blender)
+    POST_PROD_WORKERS = 2
+
+    def _finalize_variant(self, rendered_path: Path, variant_id: int) -> Path:
+        """
+        Post-prod d'une variante puis nettoyage du rendu intermédiaire.
+        Si la post-prod n'a pas produit de fichier final, le rendu brut prend le nom final.
+        """
+        final_path = self.post_prod_ghost(rendered_path, variant_id=variant_id)
+        expected_path = self.OUTPUT_DIR / f"EXO_MISSION_{variant_id:03d}.mp4"
+        if final_path == expected_path:
+            rendered_path.unlink(missing_ok=True)
+        elif rendered_path.exists():
+            # shutil.move : le rendu intermédiaire peut être sur un autre système de fichiers (tmpfs)
+            final_path = Path(shutil.move(str(rendered_path), str(expected_path)))
+        print(f"[SUCCESS] Variante {variant_id + 1} terminée : {final_path.name}")
+        return final_path
+
+    def dispatch_variants_across_gpus(self, num_variantes: int) -> Optional[bool]:
+        """
+        LEGION MULTI-GPU : un sous-processus Blender par GPU NVIDIA, épinglé via
+        CUDA_VISIBLE_DEVICES, chacun rendant sa part des variantes (round-robin)
+        dans une seule session (données persistantes). Évite le mirroring de la
+        scène sur tous les GPU d'un rendu unique.
+        
+        Args:
+            num_variantes: Nombre total de variantes
+        
+        Returns:
+            None si non applicable (< 2 GPU CUDA/OPTIX ou une seule variante),
+            sinon True si tous les sous-processus ont réussi
+        """
+        if num_variantes < 2:
+            return None
+        if self.detect_gpu_devices() not in ('OPTIX', 'CUDA') or len(self._gpu_devices) < 2:
+            return None
+        
+        n_gpus = min(len(self._gpu_devices), num_variantes)
+        print(f"[INFO] LEGION MULTI-GPU : {num_variantes} variantes réparties sur {n_gpus} GPU")
+        
+        processes = []
+        for gpu_index in range(n_gpus):
+            share = list(range(gpu_index, num_variantes, n_gpus))
+            cmd = [
+                bpy.app.binary_path,
+                "--background",
+                "--python", str(Path(__file__).resolve()),
+                "--",
+                "--drive-root", str(self.drive_root),
+                "--num-variantes", str(num_variantes),
+                "--variants", ",".join(map(str, share)),
+                # Rendu par plages de frames conservé dans chaque sous-processus GPU
+                "--render-workers", str(self.render_workers),
+            ]
+            env = {**os.environ, "CUDA_VISIBLE_DEVICES": str(gpu_index)}
+            print(f"[INFO] GPU {gpu_index} → variantes {share}")
+            processes.append(subprocess.Popen(cmd, env=env))
+        
+        return_codes = [p.wait() for p in processes]
+        for gpu_index, code in enumerate(return_codes):
+            if code != 0:
+                print(f"[ERROR] Sous-processus GPU {gpu_index} échoué (code {code})")
+        return all(code == 0 for code in return_codes)
+
+    def run(self, num_variantes: int = 1, variant_ids: Optional[List[int]] = None):
         """
         Exécute le pipeline complet de la Forge
         
@@ -1195,7 +1671,11 @@ class EXOForge:
         
         Args:
             num_variantes: Nombre de variantes à générer (Doctrine Asymétrie)
+            variant_ids: Sous-ensemble de variantes à rendre (sous-processus multi-GPU) ;
+                         None = toutes (0 à N-1)
         """
+        if variant_ids is None:
+            variant_ids = list(range(num_variantes))
         print("=" * 60)
         print("EXO_03_BLENDER_WORKER - Segment 03 : LEGION FORGE")
         print(f"VARIANTES DEMANDÉES : {num_variantes}")
@@ -1207,11 +1687,13 @@ class EXOForge:
             return False
         
         # SETUP UNIQUE (fait une seule fois)
+        # Mission chargée avant import_assets : liste des acteurs (un avatar par acteur,
+        # instancié depuis le même .glb) + fps_source et ratio pour l'animation
+        self.load_mission_data()
         self.setup_scene()
         self.import_assets()
         self.setup_camera()
         self.setup_lighting()
-        self.load_mission_data()  # Charger les données avant animation (calcule fps_source et ratio)
         
         # RAPPORT DE TIR (PROTOCOLE ORACLE 60)
         print("=" * 60)
@@ -1232,30 +1714,40 @@ class EXOForge:
             total_frames_source = metadata.get("total_frames", 250)
         estimated_duration = int(total_frames_source * self.ratio_fps)
         print(f"[EXO] DURÉE TOTALE : {estimated_duration} IMAGES ({estimated_duration / scene.render.fps:.2f}s)")
-        print(f"[EXO] ACCÉLÉRATION GPU : ACTIVÉE (CUDA)")
+        print(f"[EXO] ACCÉLÉRATION GPU : {self._gpu_backend if self._gpu_backend != 'NONE' else 'INACTIVE (CPU)'}")
         print("=" * 60)
         
-        # BOUCLE MAÎTRESSE : Pour chaque variante
-        for variant_id in range(num_variantes):
-            print("=" * 60)
-            print(f"VARIANTE {variant_id + 1}/{num_variantes}")
-            print("=" * 60)
-            
-            # Pipeline de forge pour cette variante
-            self.apply_animation()  # Animation pose (identique pour toutes variantes)
-            self.apply_lip_sync()  # Lip-sync (identique pour toutes variantes)
-            self.apply_camera_animation(variant_id=variant_id)  # Caméra (varie par variante)
-            
-            # Rendu vidéo
-            rendered_path = self.render_video(variant_id=variant_id)
-            
-            # Post-production (fusion, logo, noise, décalage audio)
-            final_path = self.post_prod_ghost(rendered_path, variant_id=variant_id)
+        # Animation pose + lip-sync : identiques pour toutes les variantes, appliqués une fois
+        self.apply_animation()
+        self.apply_lip_sync()
+        
+        # BOUCLE MAÎTRESSE : Pour chaque variante (seule la caméra change, les données
+        # persistantes Cycles évitent de réuploader la géométrie). La post-prod FFmpeg
+        # d'une variante tourne en arrière-plan pendant le rendu de la suivante.
+        with ThreadPoolExecutor(max_workers=self.POST_PROD_WORKERS) as post_prod_pool:
+            post_prod_jobs = []
+            for variant_id in variant_ids:
+                print("=" * 60)
+                print(f"VARIANTE {variant_id + 1}/{num_variantes}")
+                print("=" * 60)
+                
+                # Pipeline de forge pour cette variante
+                self.apply_camera_animation(variant_id=variant_id)  # Caméra (varie par variante)
+                
+                # Rendu vidéo
+                rendered_path = self.render_video(variant_id=variant_id)
+                
+                # Post-production (fusion, logo, noise, décalage audio)
+                post_prod_jobs.append(post_prod_pool.submit(self._finalize_variant, rendered_path, variant_id))
             
-            print(f"[SUCCESS] Variante {variant_id + 1}/{num_variantes} terminée : {final_path.name}")
+            for job in post_prod_jobs:
+                job.result()
+        
+        if self._staging_dir is not None and self._staging_dir != self.OUTPUT_DIR:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
         
         print("=" * 60)
-        print(f"[SUCCESS] Pipeline Forge terminé avec succès ! ({num_variantes} variantes générées)")
+        print(f"[SUCCESS] Pipeline Forge terminé avec succès ! ({len(variant_ids)} variantes générées)")
         print("=" * 60)
         
         return True
@@ -1292,6 +1784,67 @@ def input_empereur():
     return num_variantes
 
 
+def input_variantes() -> Optional[List[int]]:
+    """
+    Lit --variants i,j,k (sous-processus LEGION MULTI-GPU) depuis sys.argv
+    
+    Returns:
+        Liste des variantes à rendre, ou None si absent (toutes les variantes)
+    """
+    if '--' not in sys.argv:
+        return None
+    args_after_separator = sys.argv[sys.argv.index('--') + 1:]
+    if '--variants' not in args_after_separator:
+        return None
+    idx = args_after_separator.index('--variants')
+    try:
+        return [int(v) for v in args_after_separator[idx + 1].split(',') if v]
+    except (IndexError, ValueError):
+        print("[WARNING] Argument --variants invalide, rendu de toutes les variantes")
+        return None
+
+
+def serve():
+    """
+    MODE PERSISTANT (--serve) : une même session Blender forge plusieurs missions
+    
+    Lit une requête JSON par ligne sur stdin :
+    - {"cmd": "render", "drive_root": "...", "num_variantes": N}
+    - {"cmd": "quit"}
+    et répond à chaque rendu par une ligne SERVE_REPLY_PREFIX + {"ok": bool}.
+    
+    Chaque mission reçoit une Forge neuve (setup_scene vide la scène) et un
+    éditeur de séquences vierge (aucune piste audio héritée de la mission
+    précédente) : seuls le démarrage de Blender, l'environnement Python et
+    l'init GPU sont amortis.
+    """
+    print("[INFO] Forge en mode persistant : en attente de missions sur stdin")
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError:
+            print(SERVE_REPLY_PREFIX + json.dumps({"ok": False, "error": "requête JSON invalide"}), flush=True)
+            continue
+        if request.get("cmd") == "quit":
+            break
+        
+        try:
+            num_variantes = int(request.get("num_variantes", 1))
+            bpy.context.scene.sequence_editor_clear()
+            forge = EXOForge(drive_root=request["drive_root"])
+            dispatched = forge.dispatch_variants_across_gpus(num_variantes)
+            ok = dispatched if dispatched is not None else bool(forge.run(num_variantes=num_variantes))
+            reply = {"ok": ok}
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            reply = {"ok": False, "error": str(e)}
+        print(SERVE_REPLY_PREFIX + json.dumps(reply), flush=True)
+
+
 def main():
     """
     Point d'entrée principal
@@ -1299,15 +1852,29 @@ def main():
     Note : Blender exécute ce script avec ses propres arguments.
     Les arguments utilisateur doivent être passés après le séparateur --.
     Exemple : blender --background --python EXO_03_BLENDER_WORKER.py -- --drive-root /path/to/root --num-variantes 3
+    Mode persistant (Orchestrateur) : ... EXO_03_BLENDER_WORKER.py -- --serve
     """
+    # MODE PERSISTANT : missions reçues sur stdin (voir serve())
+    if '--' in sys.argv and '--serve' in sys.argv[sys.argv.index('--') + 1:]:
+        serve()
+        sys.exit(0)
+    
     # INPUT EMPEREUR : Demander le nombre de variantes
     num_variantes = input_empereur()
     
+    variant_ids = input_variantes()
+    
     # Initialisation de la Forge (parse automatiquement sys.argv après --)
     forge = EXOForge(drive_root=None)
     
+    # LEGION MULTI-GPU : processus parent → un sous-processus par GPU
+    if variant_ids is None:
+        dispatched = forge.dispatch_variants_across_gpus(num_variantes)
+        if dispatched is not None:
+            sys.exit(0 if dispatched else 1)
+    
     # Exécution du pipeline avec N variantes
-    success = forge.run(num_variantes=num_variantes)
+    success = forge.run(num_variantes=num_variantes, variant_ids=variant_ids)
     
     sys.exit(0 if success else 1)
 
@@ -5,13 +5,39 @@ Système cible : 8Go RAM
 Objectif : Vérifier que le système peut fonctionner sur Colab gratuit / Warp Cloud
 """
 
-import psutil
+import bisect
+import importlib.util
+import json
+import math
 import os
 import sys
 from pathlib import Path
 
+def _read_meminfo_linux():
+    """Lit MemTotal / MemAvailable (octets) dans /proc/meminfo"""
+    values = {}
+    with open('/proc/meminfo') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('MemTotal', 'MemAvailable'):
+                values[key] = int(rest.split()[0]) * 1024  # kB
+                if len(values) == 2:
+                    break
+    return values['MemTotal'], values['MemAvailable']
+
 def get_memory_info():
-    """Récupère les informations de mémoire système"""
+    """Récupère les informations de mémoire système (/proc/meminfo sous Linux, sinon psutil)"""
+    if sys.platform == 'linux':
+        total, available = _read_meminfo_linux()
+        used = total - available
+        return {
+            'total_gb': total / (1024**3),
+            'available_gb': available / (1024**3),
+            'used_gb': used / (1024**3),
+            'percent': used / total * 100
+        }
+    
+    import psutil
     memory = psutil.virtual_memory()
     return {
         'total_gb': memory.total / (1024**3),
@@ -21,118 +47,255 @@ def get_memory_info():
     }
 
 def check_requirements():
-    """Vérifie que les dépendances critiques sont installées"""
+    """
+    Vérifie que les dépendances critiques sont installées
+    (find_spec : localisation sans import, le test ne charge pas les modules dont il mesure la RAM)
+    """
     required_modules = [
         'cv2',  # OpenCV
         'mediapipe',
-        'whisper',
+        'faster_whisper',
         'numpy'
     ]
     
-    missing = []
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing.append(module)
-    
-    return missing
-
-def estimate_whisper_memory(model_size='large'):
-    """Estime la consommation mémoire de Whisper selon le modèle"""
-    model_sizes = {
-        'tiny': 0.1,   # GB
-        'base': 0.2,
-        'small': 0.5,
-        'medium': 1.0,
-        'large': 2.0,
-        'large-v2': 2.0,
-        'large-v3': 2.0
-    }
-    return model_sizes.get(model_size, 2.0)
+    return [module for module in required_modules if importlib.util.find_spec(module) is None]
+
+# Consommation Whisper en float32 (GB), triée par taille (recherche dichotomique)
+_WHISPER_TABLE = tuple(sorted((
+    ('tiny', 0.1),
+    ('base', 0.2),
+    ('small', 0.5),
+    ('medium', 1.0),
+    ('large', 2.0),
+    ('large-v2', 2.0),
+    ('large-v3', 2.0)
+), key=lambda entry: (entry[1], entry[0])))
+_WHISPER_TABLE_GB = [gb for _, gb in _WHISPER_TABLE]
+WHISPER_FP32_GB = dict(_WHISPER_TABLE)
+
+# Ratio mémoire selon le compute_type faster-whisper / CTranslate2
+# (Large : 2.0 GB float32 → 1.3 float16 → 1.1 int8_float16 → 0.9 int8)
+COMPUTE_TYPE_RATIOS = {
+    'float32': 1.0,
+    'float16': 0.65,
+    'int8_float16': 0.55,
+    'int8': 0.45
+}
+
+# Table (model_size, compute_type) → GB
+WHISPER_MEMORY_GB = {
+    (model_size, compute_type): fp32_gb * ratio
+    for model_size, fp32_gb in WHISPER_FP32_GB.items()
+    for compute_type, ratio in COMPUTE_TYPE_RATIOS.items()
+}
+
+def _check_compute_type(compute_type):
+    """ValueError si compute_type n'est ni un compute_type CTranslate2 ni une quantification WHISPER_QUANTIZED"""
+    if compute_type not in COMPUTE_TYPE_RATIOS and compute_type not in WHISPER_QUANTIZED:
+        raise ValueError(
+            f"compute_type inconnu : {compute_type!r} "
+            f"(attendu : {', '.join([*COMPUTE_TYPE_RATIOS, *WHISPER_QUANTIZED])})"
+        )
 
-def estimate_opencv_memory(video_resolution='1920x1080', fps=60):
-    """Estime la consommation mémoire d'OpenCV pour traitement vidéo"""
-    # Approximation : ~50MB par frame en mémoire pour traitement
-    width, height = map(int, video_resolution.split('x'))
-    pixels_per_frame = width * height
-    bytes_per_frame = pixels_per_frame * 3  # RGB
-    mb_per_frame = bytes_per_frame / (1024**2)
+def largest_fitting(available_gb, compute_type='int8'):
+    """
+    Plus grand modèle Whisper tenant dans available_gb pour un compute_type CTranslate2
+    (ou une quantification WHISPER_QUANTIZED, qui n'existe que pour large-v3)
     
-    # Buffer pour 2 secondes de vidéo
-    buffer_frames = fps * 2
-    buffer_mb = mb_per_frame * buffer_frames
+    Returns:
+        Nom du modèle, ou None si même tiny (large-v3 pour une quantification) ne tient pas
     
-    return buffer_mb / 1024  # GB
+    Raises:
+        ValueError: compute_type inconnu
+    """
+    _check_compute_type(compute_type)
+    if compute_type in WHISPER_QUANTIZED:
+        return 'large-v3' if WHISPER_QUANTIZED[compute_type][0] <= available_gb else None
+    index = bisect.bisect_right(_WHISPER_TABLE_GB, available_gb / COMPUTE_TYPE_RATIOS[compute_type])
+    return _WHISPER_TABLE[index - 1][0] if index else None
+
+# Quantifications 4/8 bits de Whisper large-v3 (transformers) : GB, configuration de chargement
+WHISPER_QUANTIZED = {
+    'int8_wo': (0.95, "TorchAoConfig('int8_weight_only')"),
+    'nf4_bnb': (0.7, "BitsAndBytesConfig(load_in_4bit=True, bnb_4bit_quant_type='nf4')"),
+    'int4_hqq': (0.65, "HqqConfig(nbits=4, group_size=64)"),
+}
+WHISPER_MEMORY_GB.update({
+    ('large-v3', quantization): gb for quantization, (gb, _) in WHISPER_QUANTIZED.items()
+})
+
+def estimate_whisper_memory(model_size='large', compute_type='int8'):
+    """
+    Estime la consommation mémoire de Whisper selon le modèle et le compute_type
+    (compute_type CTranslate2, ou quantification WHISPER_QUANTIZED pour large-v3)
+    
+    Raises:
+        ValueError: compute_type inconnu, ou modèle absent de WHISPER_MEMORY_GB
+                    pour ce compute_type
+    """
+    _check_compute_type(compute_type)
+    try:
+        return WHISPER_MEMORY_GB[(model_size, compute_type)]
+    except KeyError:
+        raise ValueError(f"Modèle Whisper inconnu pour {compute_type!r} : {model_size!r}") from None
+
+# MB par frame BGR uint8 des résolutions supportées (480p → 4K)
+_RES_MB_PER_FRAME = {
+    resolution: width * height * 3 / (1024**2)
+    for resolution, (width, height) in {
+        '854x480': (854, 480),
+        '1280x720': (1280, 720),
+        '1920x1080': (1920, 1080),
+        '2560x1440': (2560, 1440),
+        '3840x2160': (3840, 2160),
+    }.items()
+}
+
+def estimate_opencv_memory(video_resolution='1920x1080', fps=60, inference_latency_ms=80, dtype_bytes=4):
+    """
+    Estime la consommation mémoire d'OpenCV pour traitement vidéo
+    
+    Ring buffer de capture (uint8 BGR) dimensionné sur la latence d'inférence
+    MediaPipe (et non 2 secondes de vidéo), plus une seule frame convertie pour
+    le modèle (dtype_bytes par composante : 4 = float32). cv2.VideoCapture
+    grab()/retrieve() et cv2.UMat évitent une seconde copie de la capture.
+    """
+    mb_per_frame = _RES_MB_PER_FRAME.get(video_resolution)
+    if mb_per_frame is None:
+        width, height = map(int, video_resolution.split('x'))
+        mb_per_frame = width * height * 3 / (1024**2)  # BGR uint8
+    
+    # Frames résidentes pendant une inférence
+    buffer_frames = max(3, math.ceil(inference_latency_ms / 1000 * fps))
+    capture_mb = mb_per_frame * buffer_frames
+    model_input_mb = mb_per_frame * dtype_bytes
+    
+    return (capture_mb + model_input_mb) / 1024  # GB
 
 def estimate_mediapipe_memory():
     """Estime la consommation mémoire de MediaPipe"""
     # MediaPipe est optimisé, consommation faible
     return 0.2  # GB
 
+# Overhead système : OS et autres processus (GB)
+SYSTEM_OVERHEAD_GB = 1.0
+
+def estimate_total_memory(model_size='large', compute_type='int8'):
+    """Estime la consommation totale du Segment 01 (Whisper + OpenCV 1080p@60 + MediaPipe + overhead)"""
+    return (
+        estimate_whisper_memory(model_size, compute_type)
+        + estimate_opencv_memory('1920x1080', 60)
+        + estimate_mediapipe_memory()
+        + SYSTEM_OVERHEAD_GB
+    )
+
+# Table de décision, de la configuration la plus précise à la plus légère :
+# (RAM requise GB, modèle Whisper, paramètres)
+_RECOMMENDATIONS = [
+    (estimate_total_memory(model_size, params['compute_type']), model_size, params)
+    for model_size, params in (
+        ('large-v3', {'compute_type': 'int8', 'whisper_impl': 'faster-whisper', 'chunk_video': False}),
+        ('large-v3', {'compute_type': 'int4_hqq', 'whisper_impl': 'transformers', 'chunk_video': False}),
+        ('medium', {'compute_type': 'int8', 'whisper_impl': 'faster-whisper', 'chunk_video': True}),
+        ('small', {'compute_type': 'int8', 'whisper_impl': 'faster-whisper', 'chunk_video': True}),
+    )
+]
+
+def recommend_config(available_gb):
+    """
+    Configuration la plus précise tenant dans la RAM disponible
+    
+    Returns:
+        dict sérialisable JSON (model_size, required_gb, compute_type, whisper_impl,
+        chunk_video), ou None si aucune configuration ne tient
+    """
+    for required_gb, model_size, params in _RECOMMENDATIONS:
+        if required_gb <= available_gb:
+            return {'model_size': model_size, 'required_gb': round(required_gb, 2), **params}
+    return None
+
 def run_memory_test():
     """Exécute le test de mémoire complet"""
-    print("=" * 60)
-    print("EXO_EYE - TEST DE CONSOMMATION RAM")
-    print("Système cible : 8Go RAM")
-    print("=" * 60)
-    print()
+    # Rapport accumulé puis écrit en une fois (sortie atomique dans la cellule Colab)
+    lines = []
+    out = lines.append
+    
+    out("=" * 60)
+    out("EXO_EYE - TEST DE CONSOMMATION RAM")
+    out("Système cible : 8Go RAM")
+    out("=" * 60)
+    out("")
     
     # Informations système
     mem_info = get_memory_info()
-    print(f"📊 MÉMOIRE SYSTÈME :")
-    print(f"   Total : {mem_info['total_gb']:.2f} GB")
-    print(f"   Disponible : {mem_info['available_gb']:.2f} GB")
-    print(f"   Utilisée : {mem_info['used_gb']:.2f} GB ({mem_info['percent']:.1f}%)")
-    print()
+    out(f"📊 MÉMOIRE SYSTÈME :")
+    out(f"   Total : {mem_info['total_gb']:.2f} GB")
+    out(f"   Disponible : {mem_info['available_gb']:.2f} GB")
+    out(f"   Utilisée : {mem_info['used_gb']:.2f} GB ({mem_info['percent']:.1f}%)")
+    out("")
     
     # Vérification des dépendances
-    print("🔍 VÉRIFICATION DES DÉPENDANCES :")
+    out("🔍 VÉRIFICATION DES DÉPENDANCES :")
     missing = check_requirements()
     if missing:
-        print(f"   ❌ Modules manquants : {', '.join(missing)}")
-        print("   ⚠️  Installez-les avec : pip install -r requirements.txt")
+        out(f"   ❌ Modules manquants : {', '.join(missing)}")
+        out("   ⚠️  Installez-les avec : pip install -r requirements.txt")
     else:
-        print("   ✅ Tous les modules requis sont installés")
-    print()
+        out("   ✅ Tous les modules requis sont installés")
+    out("")
     
     # Estimation de consommation
-    print("💾 ESTIMATION DE CONSOMMATION RAM :")
+    out("💾 ESTIMATION DE CONSOMMATION RAM :")
     
-    whisper_mem = estimate_whisper_memory('large')
-    print(f"   Whisper Large : ~{whisper_mem:.2f} GB")
+    for compute_type in ('float32', 'float16', 'int8'):
+        out(f"   Whisper Large ({compute_type}) : ~{estimate_whisper_memory('large', compute_type):.2f} GB")
+    for quantization in sorted(WHISPER_QUANTIZED, key=lambda q: WHISPER_QUANTIZED[q][0]):
+        out(f"   Whisper Large-v3 ({quantization}) : ~{estimate_whisper_memory('large-v3', quantization):.2f} GB")
+    # Chemin de déploiement : faster-whisper quantifié int8
+    whisper_mem = estimate_whisper_memory('large', 'int8')
     
     opencv_mem = estimate_opencv_memory('1920x1080', 60)
-    print(f"   OpenCV (vidéo 1080p@60fps) : ~{opencv_mem:.2f} GB")
+    out(f"   OpenCV (vidéo 1080p@60fps) : ~{opencv_mem:.2f} GB")
     
     mediapipe_mem = estimate_mediapipe_memory()
-    print(f"   MediaPipe : ~{mediapipe_mem:.2f} GB")
+    out(f"   MediaPipe : ~{mediapipe_mem:.2f} GB")
     
     # Overhead système
-    system_overhead = 1.0  # GB pour OS et autres processus
-    print(f"   Overhead système : ~{system_overhead:.2f} GB")
+    system_overhead = SYSTEM_OVERHEAD_GB
+    out(f"   Overhead système : ~{system_overhead:.2f} GB")
     
     total_estimated = whisper_mem + opencv_mem + mediapipe_mem + system_overhead
-    print()
-    print(f"   📈 TOTAL ESTIMÉ : ~{total_estimated:.2f} GB")
-    print()
+    out("")
+    out(f"   📈 TOTAL ESTIMÉ : ~{total_estimated:.2f} GB")
+    out("")
     
     # Recommandations
-    print("💡 RECOMMANDATIONS :")
+    out("💡 RECOMMANDATIONS :")
     if total_estimated > mem_info['available_gb']:
-        print(f"   ⚠️  Consommation estimée ({total_estimated:.2f} GB) > RAM disponible ({mem_info['available_gb']:.2f} GB)")
-        print("   Solutions :")
-        print("   - Utiliser Whisper Medium au lieu de Large (-0.5 GB)")
-        print("   - Traiter la vidéo par chunks")
-        print("   - Utiliser Google Colab Pro (16GB RAM)")
+        out(f"   ⚠️  Consommation estimée ({total_estimated:.2f} GB) > RAM disponible ({mem_info['available_gb']:.2f} GB)")
     else:
-        print(f"   ✅ Consommation estimée ({total_estimated:.2f} GB) < RAM disponible ({mem_info['available_gb']:.2f} GB)")
-        print("   Le système devrait fonctionner correctement")
+        out(f"   ✅ Consommation estimée ({total_estimated:.2f} GB) < RAM disponible ({mem_info['available_gb']:.2f} GB)")
+    
+    config = recommend_config(mem_info['available_gb'])
+    if config is None:
+        out("   ⚠️  Aucune configuration ne tient en RAM : utiliser Google Colab Pro (16GB RAM)")
+    else:
+        out(f"   Configuration : Whisper {config['model_size']} ({config['compute_type']}, "
+            f"{config['whisper_impl']}) - ~{config['required_gb']:.2f} GB")
+        if config['whisper_impl'] == 'faster-whisper':
+            out(f"   - WhisperModel('{config['model_size']}', compute_type='{config['compute_type']}')")
+        else:
+            out(f"   - {WHISPER_QUANTIZED[config['compute_type']][1]}")
+        if config['chunk_video']:
+            out("   - Traiter la vidéo par chunks")
+        out(f"   JSON : {json.dumps(config)}")
+    
+    out("")
+    out("=" * 60)
+    out("Test terminé")
+    out("=" * 60)
     
-    print()
-    print("=" * 60)
-    print("Test terminé")
-    print("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     try:
@@ -10,10 +10,53 @@ DOCTRINE :
 - Retourne toujours le chemin racine approprié pour EXODUS_SYSTEM
 """
 
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
+# Détection Colab (Google Drive monté), évaluée une fois à l'import
+_COLAB_DRIVE = "/content/drive"
+_IS_COLAB = os.path.isdir(_COLAB_DRIVE)
+
+# Marqueurs de la racine EXODUS (fichier orchestrateur ou dossier du Segment 01)
+_ROOT_MARKERS = frozenset({"EXO_PRIME_ORCHESTRATOR.py", "01_EYE_INQUISITION"})
+
+
+def _has_root_marker(directory: Path) -> bool:
+    """
+    Vérifie si un dossier contient un marqueur de racine : un seul listage
+    (os.scandir) au lieu d'un exists() par marqueur
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name in _ROOT_MARKERS for entry in entries)
+    except OSError:
+        # Dossier illisible (permissions) : pas une racine
+        return False
+
+
+def _walk_up_for_root(start: Path, visited: set) -> Optional[Path]:
+    """
+    Remonte depuis start jusqu'à un dossier contenant un marqueur de racine
+    
+    Args:
+        start: Dossier de départ
+        visited: Dossiers déjà inspectés par une remontée précédente (mis à jour) ;
+                 leurs parents l'ont été aussi, la remontée s'arrête dessus
+    
+    Returns:
+        Racine trouvée, ou None
+    """
+    current = start
+    while current != current.parent and current not in visited:  # Jusqu'à la racine
+        visited.add(current)
+        if _has_root_marker(current):
+            return current
+        current = current.parent
+    return None
+
 
 def detect_exodus_root() -> Path:
     """
@@ -23,23 +66,47 @@ def detect_exodus_root() -> Path:
     1. Si /content/drive existe → Colab (utiliser Drive)
     2. Sinon → Local (utiliser chemin du script)
     
+    La racine ne change pas durant le processus : la détection est mémoïsée
+    par script appelant (_detect_exodus_root_cached).
+    
     Returns:
         Path vers la racine EXODUS_SYSTEM
     """
-    # Détection Colab : Vérifier si /content/drive existe
-    colab_drive_path = Path("/content/drive")
-    if colab_drive_path.exists():
+    # On cherche le fichier qui appelle cette fonction (remonter jusqu'à EXODUS_SYSTEM)
+    caller_file = None
+    try:
+        # Frame du script appelant (sans importer inspect)
+        caller_file = sys._getframe(1).f_globals.get('__file__')
+    except (AttributeError, ValueError):
+        # Si la pile est indisponible, utiliser le chemin courant
+        pass
+    return _detect_exodus_root_cached(caller_file)
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_exodus_root_cached(caller_file: Optional[str]) -> Path:
+    """
+    Détection effective de la racine (mémoïsée)
+    
+    Args:
+        caller_file: __file__ du script appelant, None si inconnu
+    
+    Returns:
+        Path vers la racine EXODUS_SYSTEM
+    """
+    # Détection Colab : /content/drive existe
+    if _IS_COLAB:
         # Environnement Colab : Utiliser Google Drive
-        drive_exodus_path = colab_drive_path / "MyDrive" / "EXODUS_SYSTEM"
+        drive_exodus_path = Path(_COLAB_DRIVE, "MyDrive", "EXODUS_SYSTEM")
         
         # Vérifier si EXODUS_SYSTEM existe sur Drive
-        if drive_exodus_path.exists():
+        if os.path.isdir(os.path.join(_COLAB_DRIVE, "MyDrive", "EXODUS_SYSTEM")):
             print(f"[AUTO-ROOT] Environnement Colab détecté - Drive: {drive_exodus_path}")
             return drive_exodus_path
         else:
             # Si Drive monté mais EXODUS_SYSTEM n'existe pas, utiliser /content/EXODUS_SYSTEM (clone GitHub)
             content_exodus_path = Path("/content/EXODUS_SYSTEM")
-            if content_exodus_path.exists():
+            if os.path.isdir("/content/EXODUS_SYSTEM"):
                 print(f"[AUTO-ROOT] Environnement Colab détecté - Clone GitHub: {content_exodus_path}")
                 return content_exodus_path
             else:
@@ -48,36 +115,20 @@ def detect_exodus_root() -> Path:
                 print(f"[AUTO-ROOT] Environnement Colab détecté - Création Drive: {drive_exodus_path}")
                 return drive_exodus_path
     
-    # Environnement local : Utiliser le chemin du script appelant
-    # On cherche le fichier qui appelle cette fonction (remonter jusqu'à EXODUS_SYSTEM)
-    import inspect
-    try:
-        frame = inspect.currentframe()
-        # Remonter la pile d'appels pour trouver le script appelant
-        caller_frame = frame.f_back
-        if caller_frame:
-            caller_file = Path(caller_frame.f_globals.get('__file__', ''))
-            if caller_file.exists():
-                # Remonter jusqu'à trouver EXODUS_SYSTEM
-                current = caller_file.resolve().parent
-                while current != current.parent:  # Jusqu'à la racine
-                    if (current / "EXO_PRIME_ORCHESTRATOR.py").exists() or \
-                       (current / "01_EYE_INQUISITION").exists():
-                        print(f"[AUTO-ROOT] Environnement local détecté - Racine: {current}")
-                        return current
-                    current = current.parent
-    except (AttributeError, ValueError):
-        # Si inspect échoue, utiliser le chemin courant
-        pass
+    # Environnement local : chemin du script appelant, puis fallback sur le chemin courant
+    starts = []
+    if caller_file:
+        caller_path = Path(caller_file)
+        if caller_path.exists():
+            starts.append((caller_path.resolve().parent, "Environnement local détecté"))
+    starts.append((Path.cwd(), "Environnement local détecté (fallback)"))
     
-    # Fallback : Chercher depuis le chemin courant
-    current = Path.cwd()
-    while current != current.parent:  # Jusqu'à la racine
-        if (current / "EXO_PRIME_ORCHESTRATOR.py").exists() or \
-           (current / "01_EYE_INQUISITION").exists():
-            print(f"[AUTO-ROOT] Environnement local détecté (fallback) - Racine: {current}")
-            return current
-        current = current.parent
+    visited = set()
+    for start, label in starts:
+        root = _walk_up_for_root(start, visited)
+        if root is not None:
+            print(f"[AUTO-ROOT] {label} - Racine: {root}")
+            return root
     
     # Fallback ultime : Chemin courant
     fallback_path = Path.cwd()
@@ -92,7 +143,7 @@ def is_colab_environment() -> bool:
     Returns:
         True si Colab, False sinon
     """
-    return Path("/content/drive").exists()
+    return _IS_COLAB
 
 
 def is_windows_environment() -> bool:
@@ -11,17 +11,385 @@ PROTOCOLE SINGULARITÉ :
 - Interface de commandement impériale
 """
 
+import hashlib
+import os
+import queue
+import signal
 import subprocess
 import sys
+import threading
 import time
 import argparse
-import ast
+import importlib.util
+import py_compile
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict
 import json
 import shutil
 from datetime import datetime
+from functools import cached_property
 import platform
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Parseur rapide (optionnel) : orjson, repli json stdlib
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Surveillance Raw_Videos/ (optionnel) : watchdog, repli scan unique
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    PollingObserver = None
+
+# Extensions vidéo acceptées dans Raw_Videos/ (comparaison insensible à la casse)
+SUPPORTED_EXTS = (".mp4", ".mov", ".mkv")
+# Triage ffprobe des vidéos déposées : durée max par fichier (s), sondages simultanés
+FFPROBE_TIMEOUT = 10
+FFPROBE_WORKERS = 8
+# Attente bloquante sur la file de surveillance (s)
+WATCH_QUEUE_TIMEOUT = 1.0
+# Intervalle du PollingObserver (NFS/CIFS, montages sans inotify)
+WATCH_POLL_INTERVAL = 60
+# Délai entre deux mesures de taille avant de traiter un fichier déposé (s)
+WATCH_SETTLE_DELAY = 2.0
+# Mesures consécutives à 0 octet avant d'ignorer un dépôt (touch, copie échouée)
+WATCH_EMPTY_MAX_CHECKS = 5
+# Extractions S01 simultanées : la moitié des cœurs (chaque scanner lance ffmpeg/whisper)
+S01_MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# Cache d'étapes (.exo_cache/) : incrémenter pour invalider toutes les entrées
+# (changement de format des sorties S01/S02/S03 ou des arguments des segments)
+CACHE_SCHEMA_VERSION = 1
+# Taille des blocs lus pour le hachage des vidéos/JSON (4 MiB)
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+# Tolérance sur le mtime des sorties (horloge grossière du noyau, FAT à 2 s)
+OUTPUT_MTIME_SLACK_NS = 2_000_000_000
+# Lignes de sortie conservées par segment pour le message d'erreur
+STREAM_TAIL_LINES = 200
+# Copie des artefacts entre segments : octets par appel sendfile / tampon du repli
+SENDFILE_CHUNK_SIZE = 16 * 1024 * 1024
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+# Blender persistant (--persistent-blender) : préfixe des réponses de la Forge
+# (SERVE_REPLY_PREFIX de EXO_03_BLENDER_WORKER.py) et délai d'arrêt propre (s)
+BLENDER_SERVE_REPLY_PREFIX = "EXO_SERVE_REPLY "
+BLENDER_QUIT_TIMEOUT = 30
+# Ligne de séparation des bannières console
+_BANNER = "=" * 80
+
+
+def _jdumps(obj, indent: bool = False) -> bytes:
+    """Encode obj en JSON UTF-8 (orjson si disponible, sinon json stdlib)"""
+    if _json is not json:
+        return _json.dumps(obj, option=_json.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _jload(path: Path):
+    """Lit un fichier JSON en bytes (orjson et json acceptent tous deux les bytes)"""
+    return _json.loads(path.read_bytes())
+
+
+def _jdump(path: Path, obj, indent: bool = True):
+    """
+    Écrit obj dans path en JSON UTF-8, de façon atomique
+    
+    Écriture dans path.tmp (fsync) puis os.replace : un kill ou une coupure
+    en cours d'écriture laisse l'ancien fichier intact, jamais un JSON tronqué.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_jdumps(obj, indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _fast_copy(src, dst):
+    """
+    Copie src vers dst (contenu seul, comme shutil.copyfile)
+    
+    Linux : os.sendfile, copie noyau → noyau sans tampon utilisateur.
+    Ailleurs, ou si le système de fichiers refuse sendfile (certains FUSE),
+    copyfileobj avec un tampon de 4 MiB.
+    """
+    if hasattr(os, "sendfile") and platform.system() == "Linux":
+        fd_in = os.open(src, os.O_RDONLY)
+        try:
+            fd_out = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                offset = 0
+                while True:
+                    try:
+                        sent = os.sendfile(fd_out, fd_in, offset, SENDFILE_CHUNK_SIZE)
+                    except OSError:
+                        if offset == 0:
+                            break
+                        raise
+                    if sent == 0:
+                        return
+                    offset += sent
+            finally:
+                os.close(fd_out)
+        finally:
+            os.close(fd_in)
+    
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+
+# Segments en cours (tués en bloc sur Ctrl+C : ils ne partagent plus le groupe du terminal)
+_live_segments = set()
+_live_segments_lock = threading.Lock()
+
+
+def _kill_process_tree(proc: subprocess.Popen):
+    """
+    Tue un segment et tous ses descendants (ffmpeg lancé par Blender, etc.)
+    
+    POSIX : le segment est chef de sa propre session → killpg sur le groupe.
+    Windows : taskkill /T parcourt l'arbre des processus.
+    """
+    if proc.poll() is not None:
+        return
+    if os.name == "posix":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+        proc.kill()
+    proc.wait()
+
+
+def _kill_live_segments():
+    """Tue l'arbre de chaque segment encore actif (interruption de l'Orchestrateur)"""
+    with _live_segments_lock:
+        procs = list(_live_segments)
+    for proc in procs:
+        _kill_process_tree(proc)
+
+
+def _run_streamed(cmd: List[str], timeout: float, prefix: str) -> Tuple[int, str]:
+    """
+    Exécute un segment en relayant sa sortie ligne à ligne
+    
+    stdout et stderr sont fusionnés et lus au fil de l'eau par un thread :
+    seule une queue bornée (STREAM_TAIL_LINES) reste en mémoire, au lieu de
+    la totalité du log comme avec capture_output=True.
+    
+    Args:
+        cmd: Commande à lancer
+        timeout: Durée maximale (s) ; le processus est tué au-delà
+        prefix: Préfixe des lignes relayées (ex. "[S01]")
+        
+    Returns:
+        (code de retour, fin de la sortie)
+        
+    Le segment est lancé dans sa propre session / son propre groupe : au
+    timeout (ou sur interruption), tout son arbre de processus est tué, pas
+    seulement l'enfant direct.
+    
+    Raises:
+        subprocess.TimeoutExpired: après avoir tué l'arbre du processus
+    """
+    tail = deque(maxlen=STREAM_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+        # Sans cela, le Python enfant bufférise stdout par blocs sur un pipe
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        start_new_session=(os.name == "posix"),
+        creationflags=0 if os.name == "posix" else subprocess.CREATE_NEW_PROCESS_GROUP
+    )
+    with _live_segments_lock:
+        _live_segments.add(proc)
+    
+    def pump():
+        for line in proc.stdout:
+            tail.append(line)
+            print(f"{prefix} {line.rstrip()}")
+    
+    reader = threading.Thread(target=pump, name=f"exo_stream{prefix}", daemon=True)
+    reader.start()
+    try:
+        proc.wait(timeout=timeout)
+    except BaseException:
+        # Timeout ou Ctrl+C : aucun descendant orphelin (GPU, verrous de fichiers)
+        _kill_process_tree(proc)
+        raise
+    finally:
+        with _live_segments_lock:
+            _live_segments.discard(proc)
+        reader.join()
+        proc.stdout.close()
+    return proc.returncode, "".join(tail)
+
+
+class _BlenderBridge:
+    """
+    Session Blender persistante (EXO_03_BLENDER_WORKER.py -- --serve) pour tout le batch
+    
+    Une mission = une ligne JSON sur stdin ; le thread lecteur relaie les logs
+    ([S03]) et route les lignes de réponse de la Forge vers une file. Blender
+    est relancé à la mission suivante s'il s'est arrêté.
+    """
+    
+    def __init__(self, blender_exe: Path, worker_script: Path):
+        self._cmd = [str(blender_exe), "--background", "--python", str(worker_script), "--", "--serve"]
+        self._proc: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._replies: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._tail = deque(maxlen=STREAM_TAIL_LINES)
+    
+    def _ensure_started(self):
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                return
+            self.close(kill=True)
+        
+        self._replies = queue.Queue()
+        self._proc = subprocess.Popen(
+            self._cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            start_new_session=(os.name == "posix"),
+            creationflags=0 if os.name == "posix" else subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+        with _live_segments_lock:
+            _live_segments.add(self._proc)
+        self._reader = threading.Thread(
+            target=self._pump, args=(self._proc, self._replies), name="exo_blender_bridge", daemon=True
+        )
+        self._reader.start()
+        print(f"[INFO] Blender persistant démarré (PID {self._proc.pid})")
+    
+    def _pump(self, proc: subprocess.Popen, replies: "queue.Queue[Optional[dict]]"):
+        for line in proc.stdout:
+            if line.startswith(BLENDER_SERVE_REPLY_PREFIX):
+                try:
+                    replies.put(json.loads(line[len(BLENDER_SERVE_REPLY_PREFIX):]))
+                except ValueError:
+                    replies.put({"ok": False, "error": "réponse de la Forge illisible"})
+                continue
+            self._tail.append(line)
+            print(f"[S03] {line.rstrip()}")
+        # EOF : Blender s'est arrêté (crash, quit)
+        replies.put(None)
+    
+    def render(self, drive_root: Path, num_variantes: int, timeout: float) -> Tuple[bool, str]:
+        """
+        Envoie une mission et attend sa réponse
+        
+        Returns:
+            (succès, fin des logs ou message d'erreur de la Forge)
+            
+        Raises:
+            subprocess.TimeoutExpired: après avoir tué la session
+        """
+        self._ensure_started()
+        self._tail.clear()
+        request = {"cmd": "render", "drive_root": str(drive_root), "num_variantes": num_variantes}
+        try:
+            self._proc.stdin.write(json.dumps(request) + "\n")
+            self._proc.stdin.flush()
+        except OSError:
+            tail = "".join(self._tail)
+            self.close(kill=True)
+            return False, tail or "Blender persistant arrêté"
+        
+        try:
+            reply = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            self.close(kill=True)
+            raise subprocess.TimeoutExpired(self._cmd, timeout)
+        except BaseException:
+            self.close(kill=True)
+            raise
+        
+        tail = "".join(self._tail)
+        if reply is None:
+            self.close(kill=True)
+            return False, tail or "Blender persistant arrêté"
+        return bool(reply.get("ok")), reply.get("error") or tail
+    
+    def close(self, kill: bool = False):
+        """Arrête la session : {"cmd": "quit"} puis attente, ou arbre tué (kill / délai dépassé)"""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if not kill and proc.poll() is None:
+            try:
+                proc.stdin.write(json.dumps({"cmd": "quit"}) + "\n")
+                proc.stdin.flush()
+                proc.wait(timeout=BLENDER_QUIT_TIMEOUT)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        _kill_process_tree(proc)
+        with _live_segments_lock:
+            _live_segments.discard(proc)
+        self._reader.join()
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+@dataclass(slots=True)
+class OrchStats:
+    """Statistiques de l'Empire (compteurs d'un run, sérialisés dans .exo_state/stats.json)"""
+    total_videos: int = 0
+    processed: int = 0
+    failed: int = 0
+    variants_generated: int = 0
+    skipped: int = 0
+    start_time: Optional[datetime] = None
+    errors: List[str] = field(default_factory=list)
+
+
+class _RawVideoHandler(FileSystemEventHandler):
+    """Pousse chaque vidéo créée/déplacée dans Raw_Videos/ sur la file de l'Orchestrateur"""
+    
+    def __init__(self, video_queue: "queue.Queue[Path]"):
+        super().__init__()
+        self._video_queue = video_queue
+    
+    def _push(self, path: str):
+        if path.lower().endswith(SUPPORTED_EXTS):
+            self._video_queue.put(Path(path))
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._push(event.src_path)
+    
+    def on_moved(self, event):
+        # Copie atomique (fichier temporaire puis renommage)
+        if not event.is_directory:
+            self._push(event.dest_path)
 
 
 class EXOPrimeOrchestrator:
@@ -32,7 +400,9 @@ class EXOPrimeOrchestrator:
     
     def __init__(self):
         """Initialise l'Orchestrateur"""
-        # Détection automatique de la racine du projet
+        # Détection automatique de la racine du projet, résolue une seule fois :
+        # tous les chemins ci-dessous en dérivent et sont donc déjà absolus
+        # (les vidéos scannées/surveillées aussi, via raw_videos_dir)
         self.project_root = Path(__file__).parent.resolve()
         
         # Chemins des segments
@@ -60,14 +430,28 @@ class EXOPrimeOrchestrator:
         self.exports_dir.mkdir(parents=True, exist_ok=True)
         
         # Statistiques de l'Empire
-        self.stats = {
-            "total_videos": 0,
-            "processed": 0,
-            "failed": 0,
-            "variants_generated": 0,
-            "start_time": None,
-            "errors": []
-        }
+        self.stats = OrchStats()
+        
+        # Points de reprise : vidéos terminées (empreinte, mode, variantes) + statistiques
+        self.state_dir = self.project_root / ".exo_state"
+        self.state_file = self.state_dir / "completed.jsonl"
+        self.stats_file = self.state_dir / "stats.json"
+        self._completed: set = set()
+        self._video_hashes: Dict[Tuple[str, int, int], str] = {}
+        
+        # Cache d'étapes : clé de contenu → sorties (S01 tourne dans un pool, d'où le verrou)
+        self.cache_dir = self.project_root / ".exo_cache"
+        self.cache_manifest_path = self.cache_dir / "manifest.json"
+        self._cache_manifest: Optional[Dict[str, dict]] = None
+        self._cache_lock = threading.Lock()
+        
+        # Segment 03 : une session Blender pour tout le batch (--persistent-blender)
+        self.persistent_blender = False
+        self._blender_bridge: Optional[_BlenderBridge] = None
+        
+        # File des vidéos à traiter (scan initial + événements watchdog)
+        self._video_queue: "queue.Queue[Path]" = queue.Queue()
+        self._observer = None
         
         print(f"[INFO] Orchestrateur initialisé - Racine: {self.project_root}")
     
@@ -81,22 +465,102 @@ class EXOPrimeOrchestrator:
         - Permissions d'écriture (fichiers .tmp)
         - Syntaxe des scripts Python
         
+        Les vérifications (I/O et sondages indépendants) tournent en parallèle ;
+        chacune rend ses lignes, affichées ensuite dans l'ordre habituel.
+        
         Returns:
             Dict avec résultats de chaque vérification
         """
-        print("=" * 80)
+        print(_BANNER)
         print("PROTOCOLE DRY-RUN - DIAGNOSTIC COMPLET")
-        print("=" * 80)
+        print(_BANNER)
         
-        results = {
-            "assets": {},
-            "environment": {},
-            "permissions": {},
-            "syntax": {}
+        test_dirs = {
+            "Extraction_Data": self.extraction_data_dir,
+            "Final_Audio": self.final_audio_dir,
+            "Exports_4K": self.exports_dir
         }
         
+        # Horodatage commun aux fichiers .tmp du test d'écriture
+        ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="exo_diag") as executor:
+            # Sondages FFmpeg/Blender lancés d'emblée, une seule fois chacun :
+            # _check_environment attend leurs futures au lieu de relire les
+            # cached_property (deux threads lanceraient deux fois le sous-processus)
+            ffmpeg_future = executor.submit(lambda: self._ffmpeg_version)
+            blender_future = executor.submit(self._find_blender)
+            assets_future = executor.submit(self._check_assets)
+            environment_future = executor.submit(self._check_environment, ffmpeg_future, blender_future)
+            permission_futures = [
+                executor.submit(self._check_write_permission, dir_name, dir_path, ts)
+                for dir_name, dir_path in test_dirs.items()
+            ]
+            syntax_future = executor.submit(self._check_syntax)
+            
+            results = {}
+            results["assets"], assets_lines = assets_future.result()
+            results["environment"], environment_lines = environment_future.result()
+            results["permissions"] = {}
+            permission_lines = []
+            for future in permission_futures:
+                dir_name, ok, line = future.result()
+                results["permissions"][dir_name] = ok
+                permission_lines.append(line)
+            results["permissions"]["all_ok"] = all(results["permissions"].values())
+            results["syntax"], syntax_lines = syntax_future.result()
+        
         # 1. VÉRIFICATION ASSETS
         print("\n[DIAGNOSTIC] Vérification des Assets...")
+        print("\n".join(assets_lines))
+        
+        # 2. VÉRIFICATION ENVIRONNEMENT
+        print("\n[DIAGNOSTIC] Vérification de l'Environnement...")
+        print("\n".join(environment_lines))
+        
+        # 3. VÉRIFICATION PERMISSIONS D'ÉCRITURE
+        print("\n[DIAGNOSTIC] Vérification des Permissions d'Écriture...")
+        print("\n".join(permission_lines))
+        
+        # 4. VÉRIFICATION SYNTAXE DES SCRIPTS PYTHON
+        print("\n[DIAGNOSTIC] Vérification de la Syntaxe des Scripts...")
+        print("\n".join(syntax_lines))
+        
+        # RAPPORT FINAL
+        print("\n" + _BANNER)
+        print("RAPPORT DE PRÊT À L'INFILTRATION")
+        print(_BANNER)
+        
+        all_checks_passed = (
+            results["assets"]["all_ok"] and
+            results["environment"]["all_ok"] and
+            results["permissions"]["all_ok"] and
+            results["syntax"]["all_ok"]
+        )
+        
+        if all_checks_passed:
+            print("[SATELLITE SYNC] : Système EXODUS validé logiquement.")
+            print("Prêt pour le push GitHub et le déploiement Cloud.")
+            print(_BANNER)
+        else:
+            print("[WARNING] Certaines vérifications ont échoué :")
+            if not results["assets"]["all_ok"]:
+                print("  - Assets manquants")
+            if not results["environment"]["all_ok"]:
+                print("  - Outils système manquants (FFmpeg/Blender)")
+            if not results["permissions"]["all_ok"]:
+                print("  - Problèmes de permissions d'écriture")
+            if not results["syntax"]["all_ok"]:
+                print("  - Erreurs de syntaxe dans les scripts")
+            print(_BANNER)
+        
+        return results
+    
+    def _check_assets(self) -> Tuple[Dict[str, bool], List[str]]:
+        """Diagnostic : présence des assets Imperial_Assets/ (résultats, lignes du rapport)"""
+        results = {}
+        lines = []
+        out = lines.append
         assets_dir = self.segment03_dir / "Imperial_Assets"
         
         required_assets = {
@@ -108,87 +572,76 @@ class EXOPrimeOrchestrator:
         all_assets_ok = True
         for asset_name, asset_path in required_assets.items():
             exists = asset_path.exists()
-            results["assets"][asset_name] = exists
+            results[asset_name] = exists
             status = "[OK]" if exists else "[MISSING]"
-            print(f"  {status} {asset_name}: {'Trouve' if exists else 'MANQUANT'}")
+            out(f"  {status} {asset_name}: {'Trouve' if exists else 'MANQUANT'}")
             if not exists:
                 all_assets_ok = False
-                print(f"      Chemin attendu : {asset_path}")
+                out(f"      Chemin attendu : {asset_path}")
         
-        results["assets"]["all_ok"] = all_assets_ok
+        results["all_ok"] = all_assets_ok
+        return results, lines
+    
+    def _check_environment(self, ffmpeg_future: Optional[Future] = None,
+                           blender_future: Optional[Future] = None) -> Tuple[Dict[str, bool], List[str]]:
+        """
+        Diagnostic : FFmpeg et Blender disponibles (résultats, lignes du rapport)
         
-        # 2. VÉRIFICATION ENVIRONNEMENT
-        print("\n[DIAGNOSTIC] Vérification de l'Environnement...")
+        Args:
+            ffmpeg_future: Sondage _ffmpeg_version déjà soumis (None = sondage direct)
+            blender_future: Sondage _find_blender déjà soumis (None = sondage direct)
+        """
+        results = {}
+        lines = []
+        out = lines.append
         
         # FFmpeg
-        ffmpeg_found = False
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            ffmpeg_found = result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            ffmpeg_found = False
+        version_line = ffmpeg_future.result() if ffmpeg_future is not None else self._ffmpeg_version
+        ffmpeg_found = version_line is not None
         
-        results["environment"]["ffmpeg"] = ffmpeg_found
+        results["ffmpeg"] = ffmpeg_found
         status = "[OK]" if ffmpeg_found else "[MISSING]"
-        print(f"  {status} FFmpeg: {'Trouve' if ffmpeg_found else 'MANQUANT'}")
+        out(f"  {status} FFmpeg: {'Trouve' if ffmpeg_found else 'MANQUANT'}")
         if ffmpeg_found:
-            version_line = result.stdout.split('\n')[0] if ffmpeg_found else ""
-            print(f"      {version_line[:60]}")
+            out(f"      {version_line[:60]}")
         
         # Blender
-        blender_exe = self._find_blender()
+        blender_exe = blender_future.result() if blender_future is not None else self._find_blender()
         blender_found = blender_exe is not None
-        results["environment"]["blender"] = blender_found
+        results["blender"] = blender_found
         status = "[OK]" if blender_found else "[MISSING]"
-        print(f"  {status} Blender: {'Trouve' if blender_found else 'MANQUANT'}")
+        out(f"  {status} Blender: {'Trouve' if blender_found else 'MANQUANT'}")
         if blender_found:
-            print(f"      Chemin : {blender_exe}")
-        
-        results["environment"]["all_ok"] = ffmpeg_found and blender_found
-        
-        # 3. VÉRIFICATION PERMISSIONS D'ÉCRITURE
-        print("\n[DIAGNOSTIC] Vérification des Permissions d'Écriture...")
-        
-        test_dirs = {
-            "Extraction_Data": self.extraction_data_dir,
-            "Final_Audio": self.final_audio_dir,
-            "Exports_4K": self.exports_dir
-        }
-        
-        all_permissions_ok = True
-        for dir_name, dir_path in test_dirs.items():
-            try:
-                # Créer le dossier si nécessaire
-                dir_path.mkdir(parents=True, exist_ok=True)
-                
-                # Tester l'écriture avec un fichier .tmp
-                test_file = dir_path / f"EXO_TEST_WRITE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.tmp"
-                test_file.write_text("EXODUS_TEST")
-                
-                # Vérifier la lecture
-                if test_file.read_text() == "EXODUS_TEST":
-                    # Nettoyer
-                    test_file.unlink()
-                    results["permissions"][dir_name] = True
-                    print(f"  [OK] {dir_name}: Permissions OK")
-                else:
-                    results["permissions"][dir_name] = False
-                    all_permissions_ok = False
-                    print(f"  [FAIL] {dir_name}: Echec de lecture")
-            except Exception as e:
-                results["permissions"][dir_name] = False
-                all_permissions_ok = False
-                print(f"  [FAIL] {dir_name}: Erreur - {str(e)[:50]}")
+            out(f"      Chemin : {blender_exe}")
         
-        results["permissions"]["all_ok"] = all_permissions_ok
-        
-        # 4. VÉRIFICATION SYNTAXE DES SCRIPTS PYTHON
-        print("\n[DIAGNOSTIC] Vérification de la Syntaxe des Scripts...")
+        results["all_ok"] = ffmpeg_found and blender_found
+        return results, lines
+    
+    @staticmethod
+    def _check_write_permission(dir_name: str, dir_path: Path, ts: str) -> Tuple[str, bool, str]:
+        """Diagnostic : écriture/lecture d'un fichier .tmp dans dir_path (nom, succès, ligne)"""
+        try:
+            # Créer le dossier si nécessaire
+            dir_path.mkdir(parents=True, exist_ok=True)
+            
+            # Tester l'écriture avec un fichier .tmp
+            test_file = dir_path / f"EXO_TEST_WRITE_{ts}_{dir_name}.tmp"
+            test_file.write_text("EXODUS_TEST")
+            
+            # Vérifier la lecture
+            if test_file.read_text() == "EXODUS_TEST":
+                # Nettoyer
+                test_file.unlink()
+                return dir_name, True, f"  [OK] {dir_name}: Permissions OK"
+            return dir_name, False, f"  [FAIL] {dir_name}: Echec de lecture"
+        except Exception as e:
+            return dir_name, False, f"  [FAIL] {dir_name}: Erreur - {str(e)[:50]}"
+    
+    def _check_syntax(self) -> Tuple[Dict[str, bool], List[str]]:
+        """Diagnostic : syntaxe des scripts des segments (résultats, lignes du rapport)"""
+        results = {}
+        lines = []
+        out = lines.append
         
         python_scripts = {
             "EXO_01_DNA_SCANNER.py": self.dna_scanner,
@@ -200,83 +653,366 @@ class EXOPrimeOrchestrator:
         all_syntax_ok = True
         for script_name, script_path in python_scripts.items():
             if not script_path.exists():
-                results["syntax"][script_name] = False
+                results[script_name] = False
                 all_syntax_ok = False
-                print(f"  [FAIL] {script_name}: Fichier introuvable")
+                out(f"  [FAIL] {script_name}: Fichier introuvable")
                 continue
             
             try:
-                # Lire et parser le fichier pour vérifier la syntaxe
-                with open(script_path, 'r', encoding='utf-8') as f:
-                    source_code = f.read()
+                # Bytecode __pycache__ plus récent que la source : syntaxe déjà validée
+                pyc_path = Path(importlib.util.cache_from_source(str(script_path)))
+                if pyc_path.exists() and pyc_path.stat().st_mtime >= script_path.stat().st_mtime:
+                    results[script_name] = True
+                    out(f"  [OK] {script_name}: Syntaxe valide (bytecode à jour)")
+                    continue
                 
-                # Parser avec ast pour vérifier la syntaxe
-                ast.parse(source_code, filename=str(script_path))
-                results["syntax"][script_name] = True
-                print(f"  [OK] {script_name}: Syntaxe valide")
-            except SyntaxError as e:
-                results["syntax"][script_name] = False
+                # Compiler vers __pycache__ : vérifie la syntaxe et sert de témoin au prochain diagnostic
+                py_compile.compile(str(script_path), cfile=str(pyc_path), doraise=True)
+                results[script_name] = True
+                out(f"  [OK] {script_name}: Syntaxe valide")
+            except py_compile.PyCompileError as e:
+                results[script_name] = False
                 all_syntax_ok = False
-                print(f"  [FAIL] {script_name}: Erreur de syntaxe ligne {e.lineno}")
-                print(f"      {e.msg}")
+                error = e.exc_value
+                if isinstance(error, SyntaxError):
+                    out(f"  [FAIL] {script_name}: Erreur de syntaxe ligne {error.lineno}")
+                    out(f"      {error.msg}")
+                else:
+                    out(f"  [FAIL] {script_name}: Erreur - {str(error)[:50]}")
             except Exception as e:
-                results["syntax"][script_name] = False
+                results[script_name] = False
                 all_syntax_ok = False
-                print(f"  [FAIL] {script_name}: Erreur - {str(e)[:50]}")
-        
-        results["syntax"]["all_ok"] = all_syntax_ok
-        
-        # RAPPORT FINAL
-        print("\n" + "=" * 80)
-        print("RAPPORT DE PRÊT À L'INFILTRATION")
-        print("=" * 80)
-        
-        all_checks_passed = (
-            results["assets"]["all_ok"] and
-            results["environment"]["all_ok"] and
-            results["permissions"]["all_ok"] and
-            results["syntax"]["all_ok"]
-        )
+                out(f"  [FAIL] {script_name}: Erreur - {str(e)[:50]}")
         
-        if all_checks_passed:
-            print("[SATELLITE SYNC] : Système EXODUS validé logiquement.")
-            print("Prêt pour le push GitHub et le déploiement Cloud.")
-            print("=" * 80)
-        else:
-            print("[WARNING] Certaines vérifications ont échoué :")
-            if not results["assets"]["all_ok"]:
-                print("  - Assets manquants")
-            if not results["environment"]["all_ok"]:
-                print("  - Outils système manquants (FFmpeg/Blender)")
-            if not results["permissions"]["all_ok"]:
-                print("  - Problèmes de permissions d'écriture")
-            if not results["syntax"]["all_ok"]:
-                print("  - Erreurs de syntaxe dans les scripts")
-            print("=" * 80)
-        
-        return results
+        results["all_ok"] = all_syntax_ok
+        return results, lines
     
     def scan_raw_videos(self) -> List[Path]:
         """
-        SCAN : Surveille le dossier Raw_Videos/ pour détecter les fichiers .mp4
+        SCAN : Surveille le dossier Raw_Videos/ pour détecter les vidéos (SUPPORTED_EXTS)
+        
+        Un seul parcours os.scandir (type d'entrée fourni par getdents, sans
+        stat) et un test d'extension insensible à la casse : pas de doublons
+        *.mp4/*.MP4 sur les systèmes de fichiers insensibles à la casse.
         
         Returns:
-            Liste des chemins vers les vidéos .mp4 trouvées
+            Liste des chemins vers les vidéos trouvées
         """
         print(f"[INFO] Scan du dossier Raw_Videos/...")
         
-        video_files = list(self.raw_videos_dir.glob("*.mp4"))
-        video_files.extend(list(self.raw_videos_dir.glob("*.MP4")))
+        with os.scandir(self.raw_videos_dir) as entries:
+            video_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(SUPPORTED_EXTS) and entry.is_file()
+            ]
         
         # Trier par nom pour ordre prévisible
         video_files = sorted(video_files, key=lambda p: p.name.lower())
         
+        # TRIAGE : conteneurs illisibles écartés en secondes plutôt qu'au timeout S01
+        if video_files and self._ffprobe_exe:
+            with ThreadPoolExecutor(max_workers=FFPROBE_WORKERS, thread_name_prefix="exo_probe") as executor:
+                verdicts = list(executor.map(self._probe_video, video_files))
+            video_files = [video for video, ok in zip(video_files, verdicts) if ok]
+            self.stats.skipped += verdicts.count(False)
+        
         print(f"[INFO] {len(video_files)} vidéo(s) détectée(s)")
         for i, video in enumerate(video_files, 1):
             print(f"  [{i}] {video.name}")
         
         return video_files
     
+    @cached_property
+    def _ffprobe_exe(self) -> Optional[str]:
+        """Chemin de ffprobe (recherché une fois) ; None désactive le triage"""
+        ffprobe = shutil.which("ffprobe")
+        if ffprobe is None:
+            print("[WARNING] ffprobe introuvable : vidéos non validées avant le Segment 01")
+        return ffprobe
+    
+    @staticmethod
+    def _is_valid_video(video_path: Path, ffprobe: str = "ffprobe") -> Tuple[bool, str]:
+        """
+        Vérifie via ffprobe qu'un conteneur est lisible et contient un flux vidéo
+        
+        Returns:
+            (valide, raison de l'échec)
+        """
+        try:
+            result = subprocess.run(
+                [ffprobe, "-v", "error", "-select_streams", "v", "-show_streams", "-of", "json", str(video_path)],
+                capture_output=True,
+                text=True,
+                timeout=FFPROBE_TIMEOUT
+            )
+        except subprocess.TimeoutExpired:
+            return False, f"ffprobe > {FFPROBE_TIMEOUT}s"
+        except OSError as e:
+            return False, str(e)
+        if result.returncode != 0:
+            return False, result.stderr.strip()[:100] or f"ffprobe code {result.returncode}"
+        try:
+            streams = json.loads(result.stdout or "{}").get("streams", [])
+        except ValueError:
+            return False, "sortie ffprobe illisible"
+        if not any(stream.get("codec_type") == "video" for stream in streams):
+            return False, "aucun flux vidéo"
+        return True, ""
+    
+    def _probe_video(self, video_path: Path) -> bool:
+        """_is_valid_video + journalisation [SKIP] (True si ffprobe absent)"""
+        if not self._ffprobe_exe:
+            return True
+        ok, reason = self._is_valid_video(video_path, self._ffprobe_exe)
+        if not ok:
+            print(f"[SKIP] Vidéo corrompue : {video_path.name} ({reason})")
+        return ok
+    
+    def _start_watcher(self, force_polling: bool = False) -> bool:
+        """
+        Démarre la surveillance de Raw_Videos/ (inotify / ReadDirectoryChangesW)
+        
+        Repli sur PollingObserver si l'observateur natif ne démarre pas
+        (limite inotify atteinte, montage réseau) ou si force_polling.
+        
+        Returns:
+            True si un observateur tourne, False si watchdog est absent
+        """
+        if Observer is None:
+            print("[WARNING] watchdog non installé : surveillance continue indisponible (pip install watchdog)")
+            return False
+        
+        handler = _RawVideoHandler(self._video_queue)
+        candidates = [] if force_polling else [Observer]
+        candidates.append(lambda: PollingObserver(timeout=WATCH_POLL_INTERVAL))
+        for make_observer in candidates:
+            observer = make_observer()
+            try:
+                observer.schedule(handler, str(self.raw_videos_dir), recursive=False)
+                observer.start()
+            except OSError as e:
+                print(f"[WARNING] Observateur natif indisponible ({e}), repli sur le polling")
+                continue
+            self._observer = observer
+            print(f"[INFO] Surveillance active : {self.raw_videos_dir} ({type(observer).__name__})")
+            return True
+        return False
+    
+    def _stop_watcher(self):
+        """Arrête l'observateur watchdog s'il tourne"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+    
+    @staticmethod
+    def _wait_until_stable(video_path: Path) -> bool:
+        """
+        Attend la fin de la copie d'un fichier déposé (taille stable)
+        
+        Returns:
+            False si le fichier a disparu entre-temps ou reste vide
+            (WATCH_EMPTY_MAX_CHECKS mesures à 0 octet)
+        """
+        last_size = -1
+        empty_checks = 0
+        while True:
+            try:
+                size = video_path.stat().st_size
+            except FileNotFoundError:
+                return False
+            if size == last_size:
+                if size > 0:
+                    return True
+                empty_checks += 1
+                if empty_checks >= WATCH_EMPTY_MAX_CHECKS:
+                    print(f"[SKIP] {video_path.name} : fichier vide depuis {empty_checks * WATCH_SETTLE_DELAY:.0f} s, ignoré")
+                    return False
+            last_size = size
+            time.sleep(WATCH_SETTLE_DELAY)
+    
+    @staticmethod
+    def _stage_hash(path: Path) -> str:
+        """Empreinte blake2b du contenu d'un fichier (lecture par blocs de 4 MiB)"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _stage_key(stage: str, *parts) -> str:
+        """Clé de cache d'une étape : version du schéma + étape + entrées"""
+        material = "|".join(str(part) for part in (CACHE_SCHEMA_VERSION, stage) + parts)
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _load_cache_manifest(self) -> Dict[str, dict]:
+        """Charge .exo_cache/manifest.json une seule fois (vide si absent/illisible)"""
+        if self._cache_manifest is None:
+            try:
+                self._cache_manifest = _jload(self.cache_manifest_path)
+            except (FileNotFoundError, ValueError):
+                self._cache_manifest = {}
+        return self._cache_manifest
+    
+    def _cache_restore(self, key: str) -> Optional[List[Path]]:
+        """
+        Restaure les sorties d'une étape déjà calculée
+        
+        Une entrée n'est valide que si chaque copie en cache a encore la taille
+        et le mtime enregistrés ; les copies sont alors remises à leur place.
+        
+        Returns:
+            Chemins restaurés, ou None si absent/obsolète
+        """
+        with self._cache_lock:
+            entry = self._load_cache_manifest().get(key)
+            if entry is None:
+                return None
+            for record in entry["outputs"]:
+                try:
+                    st = os.stat(record["cached"])
+                except OSError:
+                    return None
+                if st.st_size != record["size"] or st.st_mtime_ns != record["mtime_ns"]:
+                    return None
+            
+            restored = []
+            for record in entry["outputs"]:
+                target = Path(record["path"])
+                if record["cached"] != record["path"]:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    _fast_copy(record["cached"], target)
+                restored.append(target)
+            return restored
+    
+    def _cache_store(self, key: str, outputs: List[Path], stash: bool = True):
+        """
+        Enregistre les sorties d'une étape réussie dans le manifeste
+        
+        Args:
+            key: Clé de l'étape (_stage_key)
+            outputs: Fichiers produits
+            stash: Copier les sorties dans .exo_cache/<clé>/ (elles seront écrasées
+                par la vidéo suivante) ; False = référencer en place (exports 4K)
+        """
+        records = []
+        try:
+            for output in outputs:
+                cached = output
+                if stash:
+                    cached = self.cache_dir / key / output.name
+                    cached.parent.mkdir(parents=True, exist_ok=True)
+                    _fast_copy(output, cached)
+                st = cached.stat()
+                records.append({
+                    "path": str(output),
+                    "cached": str(cached),
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                })
+            
+            with self._cache_lock:
+                manifest = self._load_cache_manifest()
+                manifest[key] = {"outputs": records, "created": datetime.now().isoformat()}
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                _jdump(self.cache_manifest_path, manifest)
+        except OSError as e:
+            # Le cache est une optimisation : un échec d'écriture n'invalide pas l'étape
+            print(f"[WARNING] Cache non mis à jour ({e})")
+    
+    @staticmethod
+    def _written_since(path: Path, start_ns: int) -> bool:
+        """
+        Vrai si path existe et a été écrit après start_ns
+        
+        Un simple exists() accepterait la sortie d'une exécution précédente
+        (autre vidéo, cache restauré) quand le segment sort en 0 sans écrire.
+        """
+        try:
+            return path.stat().st_mtime_ns >= start_ns - OUTPUT_MTIME_SLACK_NS
+        except OSError:
+            return False
+    
+    @classmethod
+    def _files_written_since(cls, directory: Path, pattern: str, start_ns: int) -> List[Path]:
+        """Fichiers de directory correspondant à pattern modifiés depuis start_ns"""
+        return sorted(p for p in directory.glob(pattern) if p.is_file() and cls._written_since(p, start_ns))
+    
+    def _video_hash(self, video_path: Path) -> str:
+        """_stage_hash mémorisé par (chemin, taille, mtime) : une lecture par vidéo et par run"""
+        st = video_path.stat()
+        memo_key = (str(video_path), st.st_size, st.st_mtime_ns)
+        video_hash = self._video_hashes.get(memo_key)
+        if video_hash is None:
+            video_hash = self._video_hashes[memo_key] = self._stage_hash(video_path)
+        return video_hash
+    
+    def _load_checkpoints(self):
+        """Charge .exo_state/completed.jsonl (une ligne tronquée par un crash est ignorée)"""
+        self._completed = set()
+        try:
+            with open(self.state_file, "rb") as f:
+                for line in f:
+                    try:
+                        record = _json.loads(line)
+                        self._completed.add((record["hash"], record["mode"], record["num_variantes"]))
+                    except (ValueError, KeyError):
+                        continue
+        except FileNotFoundError:
+            return
+        if self._completed:
+            print(f"[CHECKPOINT] {len(self._completed)} vidéo(s) déjà terminée(s) lors de runs précédents")
+    
+    def _record_checkpoint(self, video_hash: str, video_path: Path, mode: str, num_variantes: int, variants: int):
+        """Ajoute une vidéo terminée à completed.jsonl (flush + fsync : survit à un crash)"""
+        record = {
+            "hash": video_hash,
+            "name": video_path.name,
+            "mode": mode,
+            "num_variantes": num_variantes,
+            "variants": variants,
+            "ts": datetime.now().isoformat()
+        }
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "ab") as f:
+            f.write(_jdumps(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._completed.add((video_hash, mode, num_variantes))
+    
+    def _dump_stats(self):
+        """Instantané de self.stats dans .exo_state/stats.json (après chaque vidéo)"""
+        snapshot = asdict(self.stats)
+        if snapshot["start_time"] is not None:
+            snapshot["start_time"] = snapshot["start_time"].isoformat()
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            _jdump(self.stats_file, snapshot)
+        except OSError as e:
+            print(f"[WARNING] Statistiques non sauvegardées ({e})")
+    
+    def _extract_unless_completed(self, video_path: Path, mode: str, num_variantes: int) -> Tuple[str, Optional[Path], bool]:
+        """
+        Tâche du pool S01 : saute une vidéo déjà terminée, sinon lance l'extraction
+        
+        Returns:
+            (empreinte vidéo, sortie S01 ou None, déjà terminée)
+        """
+        video_hash = self._video_hash(video_path)
+        if (video_hash, mode, num_variantes) in self._completed:
+            return video_hash, None, True
+        return video_hash, self.execute_segment01(video_path), False
+    
+    def _voice_samples_fingerprint(self) -> str:
+        """Empreinte légère de Voice_Samples/ (nom, taille, mtime) : entrée implicite de S02"""
+        entries = sorted(
+            (p.name, st.st_size, st.st_mtime_ns)
+            for p in self.voice_samples_dir.iterdir() if p.is_file()
+            for st in (p.stat(),)
+        )
+        return hashlib.blake2b(repr(entries).encode("utf-8"), digest_size=16).hexdigest()
+    
     def execute_segment01(self, video_path: Path) -> Optional[Path]:
         """
         SÉQUENCE DE DESTRUCTION - Segment 01 : INQUISITION
@@ -286,63 +1022,80 @@ class EXOPrimeOrchestrator:
         Args:
             video_path: Chemin vers la vidéo source
             
+        Chaque vidéo écrit son propre EXO_DATA_RAW_<nom>.json (--output du
+        scanner, qui en dérive aussi son sidecar landmarks et son spool), ce qui
+        permet plusieurs extractions simultanées (voir run()).
+        
         Returns:
-            Chemin vers EXO_DATA_RAW.json ou None si échec
+            Chemin vers le JSON brut de la vidéo ou None si échec
         """
         print(f"[SEGMENT 01] Extraction ADN de {video_path.name}...")
         
         if not self.dna_scanner.exists():
             error_msg = f"[ERROR] Script Segment 01 introuvable : {self.dna_scanner}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return None
         
-        # Chemin de sortie
-        output_json = self.extraction_data_dir / "EXO_DATA_RAW.json"
+        # Chemin de sortie (+ sidecar landmarks référencé par le JSON, nommé par le scanner)
+        output_json = self.extraction_data_dir / f"EXO_DATA_RAW_{video_path.name}.json"
+        sidecar = output_json.with_name(f"{output_json.stem}_landmarks.npz")
+        
+        # CACHE : même contenu vidéo → même ADN (JSON et sidecar restaurés ensemble)
+        cache_key = self._stage_key("S01", self._video_hash(video_path), output_json.name, sidecar.name)
+        if self._cache_restore(cache_key) is not None:
+            print(f"[CACHE HIT] Segment 01 : {video_path.name} déjà extrait ({output_json.name})")
+            return output_json
         
         try:
-            # Commande : python EXO_01_DNA_SCANNER.py <video> -o <output>
+            # Commande : python EXO_01_DNA_SCANNER.py --drive-root <root> --video <video> --output <output>
             cmd = [
                 sys.executable,
                 str(self.dna_scanner),
-                str(video_path.resolve()),
-                "-o", str(output_json.resolve())
+                "--drive-root", str(self.project_root),
+                "--video", str(video_path),
+                "--output", str(output_json)
             ]
             
-            print(f"[INFO] Exécution : {' '.join(cmd[:3])}...")
+            print(f"[INFO] Exécution : {' '.join(cmd[:2])} --video {video_path.name}...")
             
-            result = subprocess.run(
+            start_ns = time.time_ns()
+            returncode, output_tail = _run_streamed(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1 heure max par vidéo
+                timeout=3600,  # 1 heure max par vidéo
+                prefix=f"[S01 {video_path.name}]"
             )
             
-            if result.returncode != 0:
-                error_msg = f"[ERROR] Segment 01 échoué pour {video_path.name}: {result.stderr[:200]}"
+            if returncode != 0:
+                error_msg = f"[ERROR] Segment 01 échoué pour {video_path.name}: {output_tail[-200:]}"
                 print(error_msg)
-                self.stats["errors"].append(error_msg)
+                self.stats.errors.append(error_msg)
                 return None
             
-            # Vérifier que le fichier JSON a été créé
-            if output_json.exists():
+            # Vérifier que le fichier JSON a été créé par cette exécution
+            if self._written_since(output_json, start_ns):
                 print(f"[SUCCESS] Segment 01 terminé : {output_json.name}")
+                if self._written_since(sidecar, start_ns):
+                    self._cache_store(cache_key, [output_json, sidecar])
+                else:
+                    # Un JSON en cache sans son sidecar serait restauré avec un .npz périmé
+                    print(f"[WARNING] Sidecar {sidecar.name} absent : extraction non mise en cache")
                 return output_json
             else:
                 error_msg = f"[ERROR] Fichier JSON non généré : {output_json}"
                 print(error_msg)
-                self.stats["errors"].append(error_msg)
+                self.stats.errors.append(error_msg)
                 return None
                 
         except subprocess.TimeoutExpired:
             error_msg = f"[ERROR] Segment 01 timeout pour {video_path.name}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return None
         except Exception as e:
             error_msg = f"[ERROR] Erreur Segment 01 pour {video_path.name}: {e}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             import traceback
             traceback.print_exc()
             return None
@@ -364,9 +1117,19 @@ class EXOPrimeOrchestrator:
         if not self.cortex_adapter.exists():
             error_msg = f"[ERROR] Script Segment 02 introuvable : {self.cortex_adapter}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return False
         
+        # CACHE : même ADN + même mode + mêmes échantillons vocaux → même mission
+        raw_data = self.extraction_data_dir / "EXO_DATA_RAW.json"
+        mission_ready = self.segment02_dir / "EXO_MISSION_READY.json"
+        cache_key = None
+        if raw_data.exists():
+            cache_key = self._stage_key("S02", self._stage_hash(raw_data), mode, self._voice_samples_fingerprint())
+            if self._cache_restore(cache_key) is not None:
+                print(f"[CACHE HIT] Segment 02 : mission déjà transfigurée ({mission_ready.name})")
+                return True
+        
         try:
             # Commande : python EXO_02_CORTEX_ADAPTER.py [--no-audio si SILENT]
             cmd = [
@@ -379,39 +1142,41 @@ class EXOPrimeOrchestrator:
             
             print(f"[INFO] Exécution : {' '.join(cmd)}")
             
-            result = subprocess.run(
+            start_ns = time.time_ns()
+            returncode, output_tail = _run_streamed(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=1800  # 30 minutes max
+                timeout=1800,  # 30 minutes max
+                prefix="[S02]"
             )
             
-            if result.returncode != 0:
-                error_msg = f"[ERROR] Segment 02 échoué : {result.stderr[:200]}"
+            if returncode != 0:
+                error_msg = f"[ERROR] Segment 02 échoué : {output_tail[-200:]}"
                 print(error_msg)
-                self.stats["errors"].append(error_msg)
+                self.stats.errors.append(error_msg)
                 return False
             
-            # Vérifier que EXO_MISSION_READY.json a été créé
-            mission_ready = self.segment02_dir / "EXO_MISSION_READY.json"
-            if mission_ready.exists():
+            # Vérifier que EXO_MISSION_READY.json a été créé par cette exécution
+            if self._written_since(mission_ready, start_ns):
                 print(f"[SUCCESS] Segment 02 terminé : {mission_ready.name}")
+                if cache_key is not None:
+                    audio_outputs = self._files_written_since(self.final_audio_dir, "*", start_ns)
+                    self._cache_store(cache_key, [mission_ready] + audio_outputs)
                 return True
             else:
                 error_msg = f"[ERROR] Fichier mission non généré : {mission_ready}"
                 print(error_msg)
-                self.stats["errors"].append(error_msg)
+                self.stats.errors.append(error_msg)
                 return False
                 
         except subprocess.TimeoutExpired:
             error_msg = "[ERROR] Segment 02 timeout"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return False
         except Exception as e:
             error_msg = f"[ERROR] Erreur Segment 02 : {e}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             import traceback
             traceback.print_exc()
             return False
@@ -433,15 +1198,27 @@ class EXOPrimeOrchestrator:
         if not self.blender_worker.exists():
             error_msg = f"[ERROR] Script Segment 03 introuvable : {self.blender_worker}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return 0
         
+        # CACHE : même mission + même nombre de variantes → variantes déjà rendues.
+        # Les exports 4K sont référencés en place (pas de copie) : l'entrée
+        # devient obsolète dès qu'une autre mission réécrit EXO_MISSION_*.mp4.
+        mission_ready = self.segment02_dir / "EXO_MISSION_READY.json"
+        cache_key = None
+        if mission_ready.exists():
+            cache_key = self._stage_key("S03", self._stage_hash(mission_ready), num_variantes)
+            cached_variants = self._cache_restore(cache_key)
+            if cached_variants is not None:
+                print(f"[CACHE HIT] Segment 03 : {len(cached_variants)} variante(s) déjà rendue(s)")
+                return len(cached_variants)
+        
         # Détecter Blender (Windows vs Linux/Colab)
         blender_exe = self._find_blender()
         if not blender_exe:
             error_msg = "[ERROR] Blender non trouvé. Installez Blender ou configurez le chemin."
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return 0
         
         try:
@@ -449,54 +1226,93 @@ class EXOPrimeOrchestrator:
             cmd = [
                 str(blender_exe),
                 "--background",
-                "--python", str(self.blender_worker.resolve()),
+                "--python", str(self.blender_worker),
                 "--",
-                "--drive-root", str(self.project_root.resolve()),
+                "--drive-root", str(self.project_root),
                 "--num-variantes", str(num_variantes)
             ]
             
-            print(f"[INFO] Exécution Blender : {blender_exe.name}...")
+            print(f"[INFO] Exécution Blender : {blender_exe.name}{' (session persistante)' if self.persistent_blender else ''}...")
             print(f"[INFO] Variantes demandées : {num_variantes}")
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=7200 * num_variantes  # 2 heures par variante max
-            )
+            start_ns = time.time_ns()
+            if self.persistent_blender:
+                # Session réutilisée d'une vidéo à l'autre : démarrage Blender + init GPU payés une fois
+                if self._blender_bridge is None:
+                    self._blender_bridge = _BlenderBridge(blender_exe, self.blender_worker)
+                ok, output_tail = self._blender_bridge.render(
+                    self.project_root,
+                    num_variantes,
+                    timeout=7200 * num_variantes  # 2 heures par variante max
+                )
+                returncode = 0 if ok else 1
+            else:
+                returncode, output_tail = _run_streamed(
+                    cmd,
+                    timeout=7200 * num_variantes,  # 2 heures par variante max
+                    prefix="[S03]"
+                )
             
-            if result.returncode != 0:
-                error_msg = f"[ERROR] Segment 03 échoué : {result.stderr[:500]}"
+            if returncode != 0:
+                error_msg = f"[ERROR] Segment 03 échoué : {output_tail[-500:]}"
                 print(error_msg)
-                self.stats["errors"].append(error_msg)
+                self.stats.errors.append(error_msg)
                 # Compter les fichiers générés malgré l'erreur
                 return self._count_generated_variants()
             
             # Compter les fichiers générés
             variants_generated = self._count_generated_variants()
             print(f"[SUCCESS] Segment 03 terminé : {variants_generated} variante(s) générée(s)")
+            if cache_key is not None:
+                rendered = self._files_written_since(self.exports_dir, "EXO_MISSION_*.mp4", start_ns)
+                if rendered:
+                    self._cache_store(cache_key, rendered, stash=False)
             return variants_generated
                 
         except subprocess.TimeoutExpired:
             error_msg = f"[ERROR] Segment 03 timeout (dépasse {7200 * num_variantes}s)"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             return self._count_generated_variants()
         except Exception as e:
             error_msg = f"[ERROR] Erreur Segment 03 : {e}"
             print(error_msg)
-            self.stats["errors"].append(error_msg)
+            self.stats.errors.append(error_msg)
             import traceback
             traceback.print_exc()
             return self._count_generated_variants()
     
+    @cached_property
+    def _ffmpeg_version(self) -> Optional[str]:
+        """Première ligne de `ffmpeg -version` (sondée une seule fois), None si absent"""
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.split('\n')[0]
+    
     def _find_blender(self) -> Optional[Path]:
         """
         Trouve l'exécutable Blender sur le système
         
+        Le résultat est mémorisé : un seul sondage par Orchestrateur, quel que
+        soit le nombre de vidéos traitées.
+        
         Returns:
             Chemin vers blender.exe ou blender, ou None si non trouvé
         """
+        return self._blender_exe
+    
+    @cached_property
+    def _blender_exe(self) -> Optional[Path]:
+        """Sondage effectif de _find_blender (exécuté au premier accès)"""
         # Windows
         if platform.system() == "Windows":
             # Chemins communs Windows
@@ -508,28 +1324,11 @@ class EXOPrimeOrchestrator:
             for path in common_paths:
                 if path.exists():
                     return path
-            
-            # Essayer depuis PATH
-            try:
-                result = subprocess.run(["where", "blender"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    blender_path = Path(result.stdout.strip().split('\n')[0])
-                    if blender_path.exists():
-                        return blender_path
-            except:
-                pass
         
-        # Linux/Colab
-        else:
-            # Essayer depuis PATH
-            try:
-                result = subprocess.run(["which", "blender"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    blender_path = Path(result.stdout.strip())
-                    if blender_path.exists():
-                        return blender_path
-            except:
-                pass
+        # Essayer depuis PATH (recherche en processus, sans where/which)
+        blender_path = shutil.which("blender")
+        if blender_path:
+            return Path(blender_path)
         
         return None
     
@@ -543,7 +1342,8 @@ class EXOPrimeOrchestrator:
         variants = list(self.exports_dir.glob("EXO_MISSION_*.mp4"))
         return len(variants)
     
-    def process_video(self, video_path: Path, mode: str, num_variantes: int, video_index: int, total_videos: int) -> bool:
+    def process_video(self, video_path: Path, mode: str, num_variantes: int, video_index: int, total_videos: int,
+                      raw_data_path: Optional[Path] = None) -> bool:
         """
         Traite une vidéo complète : S01 → S02 → S03
         
@@ -553,25 +1353,30 @@ class EXOPrimeOrchestrator:
             num_variantes: Nombre de variantes à générer
             video_index: Index de la vidéo (pour affichage)
             total_videos: Total de vidéos à traiter
+            raw_data_path: Sortie S01 déjà produite par le pool d'extraction (S01 sauté)
             
         Returns:
             True si succès complet, False sinon
         """
-        print("=" * 80)
+        print(_BANNER)
         print(f"[VIDEO {video_index}/{total_videos}] {video_path.name}")
-        print("=" * 80)
+        print(_BANNER)
         
         # SEGMENT 01 : INQUISITION
-        raw_data_path = self.execute_segment01(video_path)
+        if raw_data_path is None:
+            raw_data_path = self.execute_segment01(video_path)
         if raw_data_path is None:
             print(f"[FAILURE] Segment 01 échoué pour {video_path.name}. Passage à la vidéo suivante.")
-            self.stats["failed"] += 1
+            self.stats.failed += 1
             return False
         
+        # S02 lit l'emplacement canonique : on y publie la sortie de cette vidéo
+        _fast_copy(raw_data_path, self.extraction_data_dir / "EXO_DATA_RAW.json")
+        
         # SEGMENT 02 : CORTEX
         if not self.execute_segment02(mode):
             print(f"[FAILURE] Segment 02 échoué pour {video_path.name}. Passage à la vidéo suivante.")
-            self.stats["failed"] += 1
+            self.stats.failed += 1
             return False
         
         # SEGMENT 03 : MANUFACTORUM
@@ -581,101 +1386,203 @@ class EXOPrimeOrchestrator:
         
         if variants_generated == 0:
             print(f"[FAILURE] Segment 03 n'a généré aucune variante pour {video_path.name}.")
-            self.stats["failed"] += 1
+            self.stats.failed += 1
             return False
         
         # Mise à jour des statistiques
-        self.stats["processed"] += 1
-        self.stats["variants_generated"] += variants_generated
+        self.stats.processed += 1
+        self.stats.variants_generated += variants_generated
         
         print(f"[SUCCESS] Vidéo {video_index}/{total_videos} traitée avec succès ({variants_generated} variante(s))")
-        print("=" * 80)
+        print(_BANNER)
         
         return True
     
-    def run(self, mode: str, num_variantes: int):
+    def run(self, mode: str, num_variantes: int, watch: bool = False, force_polling: bool = False,
+            s01_workers: Optional[int] = None):
         """
         Exécute le pipeline complet de l'Orchestrateur
         
+        Les vidéos déjà présentes sont mises en file (scan initial) ; avec
+        watch=True, les dépôts ultérieurs dans Raw_Videos/ sont traités au fil
+        de l'eau jusqu'à interruption (Ctrl+C).
+        
         Args:
             mode: Mode global (DRAMA ou SILENT)
             num_variantes: Nombre de variantes par vidéo source
+            watch: Surveillance continue de Raw_Videos/ (watchdog)
+            force_polling: Force le PollingObserver (NFS/CIFS)
+            s01_workers: Extractions S01 simultanées (défaut : S01_MAX_WORKERS)
         """
-        print("=" * 80)
+        print(_BANNER)
         print("EXO_PRIME_ORCHESTRATOR - SYSTÈME NERVEUX CENTRAL EXODUS")
-        print("=" * 80)
+        print(_BANNER)
         print(f"[INFO] Mode global : {mode}")
         print(f"[INFO] Variantes par source : {num_variantes}")
-        print("=" * 80)
+        print(_BANNER)
         
-        self.stats["start_time"] = datetime.now()
+        self.stats.start_time = datetime.now()
         
-        # SCAN : Détecter les vidéos
-        video_files = self.scan_raw_videos()
+        self._load_checkpoints()
         
-        if not video_files:
-            print("[WARNING] Aucune vidéo trouvée dans Raw_Videos/. L'Orchestrateur attend...")
-            print("[INFO] Placez des fichiers .mp4 dans Raw_Videos/ pour démarrer le traitement.")
-            return
+        # Observateur démarré avant le scan : aucun dépôt perdu entre les deux
+        watching = watch and self._start_watcher(force_polling)
         
-        self.stats["total_videos"] = len(video_files)
+        # SCAN INITIAL : vidéos déjà présentes (déjà triées par ffprobe)
+        backfill = self.scan_raw_videos()
+        for video_path in backfill:
+            self._video_queue.put(video_path)
+        backfill = set(backfill)
         
-        print("=" * 80)
-        print(f"[INFO] Démarrage du traitement de {len(video_files)} vidéo(s)...")
-        print("=" * 80)
+        if self._video_queue.empty() and not watching:
+            print("[WARNING] Aucune vidéo trouvée dans Raw_Videos/. L'Orchestrateur attend...")
+            print("[INFO] Placez des vidéos (.mp4/.mov/.mkv) dans Raw_Videos/ pour démarrer le traitement.")
+            return
         
-        # TRAITEMENT : Pour chaque vidéo
-        for idx, video_path in enumerate(video_files, 1):
-            try:
-                # Barre de progression de l'Empire
-                print(f"\n[PROGRESS] Vidéo {idx}/{len(video_files)} - {video_path.name}")
-                
-                # Traitement complet
-                success = self.process_video(video_path, mode, num_variantes, idx, len(video_files))
+        print(_BANNER)
+        if watching:
+            print("[INFO] Démarrage du traitement (surveillance continue, Ctrl+C pour arrêter)...")
+        else:
+            print(f"[INFO] Démarrage du traitement de {self._video_queue.qsize()} vidéo(s)...")
+        print(_BANNER)
+        
+        # TRAITEMENT : S01 en parallèle (pool d'extraction), S02 → S03 en série
+        # dans ce thread (chemins canoniques partagés, GPU unique pour Blender)
+        workers = S01_MAX_WORKERS if s01_workers is None else max(1, s01_workers)
+        print(f"[INFO] Extractions S01 simultanées : {workers}")
+        seen = set()
+        pending = {}
+        idx = 0
+        
+        def fill_pool(executor) -> bool:
+            """Soumet des vidéos de la file au pool S01 ; False si la file est épuisée"""
+            nonlocal idx
+            while len(pending) < workers:
+                try:
+                    video_path = self._video_queue.get(block=watching and not pending, timeout=WATCH_QUEUE_TIMEOUT)
+                except queue.Empty:
+                    return False
                 
-                if not success:
-                    # RÉSILIENCE : Continuer même en cas d'échec
-                    print(f"[RESILIENCE] Vidéo {idx} échouée, passage à la suivante...")
+                # Un même fichier peut être signalé par le scan et par watchdog
+                if video_path in seen:
+                    continue
+                # Dépôt watchdog : attendre la fin de la copie (les vidéos du scan
+                # initial sont déjà acceptées par ffprobe)
+                dropped = watching and video_path not in backfill
+                if dropped and not self._wait_until_stable(video_path):
+                    continue
+                seen.add(video_path)
+                # Dépôt watchdog : même triage que le scan initial
+                if dropped and not self._probe_video(video_path):
+                    self.stats.skipped += 1
                     continue
                 
-            except Exception as e:
-                # RÉSILIENCE : Logger l'erreur et continuer
-                error_msg = f"[ERROR] Erreur fatale pour {video_path.name}: {e}"
-                print(error_msg)
-                self.stats["errors"].append(error_msg)
-                self.stats["failed"] += 1
-                import traceback
-                traceback.print_exc()
-                continue
+                idx += 1
+                self.stats.total_videos += 1
+                future = executor.submit(self._extract_unless_completed, video_path, mode, num_variantes)
+                pending[future] = (video_path, idx)
+            return True
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="exo_s01") as executor:
+                try:
+                    while True:
+                        more = fill_pool(executor)
+                        if not pending:
+                            if watching or more:
+                                continue
+                            break
+                        
+                        done, _ = wait(pending, timeout=WATCH_QUEUE_TIMEOUT if watching else None,
+                                       return_when=FIRST_COMPLETED)
+                        # Libérer les emplacements avant S02/S03 : les extractions
+                        # suivantes avancent pendant la forge
+                        finished = sorted((pending.pop(future) + (future,) for future in done), key=lambda t: t[1])
+                        fill_pool(executor)
+                        
+                        for video_path, video_idx, future in finished:
+                            total = self.stats.total_videos + self._video_queue.qsize()
+                            try:
+                                # Barre de progression de l'Empire
+                                print(f"\n[PROGRESS] Vidéo {video_idx}/{total} - {video_path.name}")
+                                
+                                video_hash, raw_data_path, already_done = future.result()
+                                if already_done:
+                                    # REPRISE : terminée lors d'un run précédent
+                                    print(f"[CHECKPOINT] {video_path.name} déjà traitée ({mode}, {num_variantes} variante(s)) : ignorée")
+                                    self.stats.skipped += 1
+                                    continue
+                                
+                                variants_before = self.stats.variants_generated
+                                if raw_data_path is None:
+                                    print(f"[FAILURE] Segment 01 échoué pour {video_path.name}. Passage à la vidéo suivante.")
+                                    self.stats.failed += 1
+                                    success = False
+                                else:
+                                    # Traitement complet (S01 déjà fait)
+                                    success = self.process_video(video_path, mode, num_variantes, video_idx, total,
+                                                                 raw_data_path=raw_data_path)
+                                
+                                if not success:
+                                    # RÉSILIENCE : Continuer même en cas d'échec
+                                    print(f"[RESILIENCE] Vidéo {video_idx} échouée, passage à la suivante...")
+                                    continue
+                                
+                                self._record_checkpoint(video_hash, video_path, mode, num_variantes,
+                                                        self.stats.variants_generated - variants_before)
+                                
+                            except Exception as e:
+                                # RÉSILIENCE : Logger l'erreur et continuer
+                                error_msg = f"[ERROR] Erreur fatale pour {video_path.name}: {e}"
+                                print(error_msg)
+                                self.stats.errors.append(error_msg)
+                                self.stats.failed += 1
+                                import traceback
+                                traceback.print_exc()
+                                continue
+                            finally:
+                                self._dump_stats()
+                except BaseException:
+                    # Ctrl+C : les extractions S01 des autres threads tournent hors du
+                    # groupe du terminal, les tuer avant d'attendre le pool
+                    _kill_live_segments()
+                    raise
+        finally:
+            self._stop_watcher()
+            if self._blender_bridge is not None:
+                self._blender_bridge.close()
+                self._blender_bridge = None
         
         # RAPPORT FINAL DE L'EMPIRE
         self._print_final_report()
     
     def _print_final_report(self):
         """Affiche le rapport final de l'Empire"""
-        print("\n" + "=" * 80)
+        print("\n" + _BANNER)
         print("RAPPORT FINAL DE L'EMPIRE")
-        print("=" * 80)
+        print(_BANNER)
         
         end_time = datetime.now()
-        duration = (end_time - self.stats["start_time"]).total_seconds() if self.stats["start_time"] else 0
-        
-        print(f"Vidéos totales : {self.stats['total_videos']}")
-        print(f"Vidéos traitées : {self.stats['processed']}")
-        print(f"Vidéos échouées : {self.stats['failed']}")
-        print(f"Variantes générées : {self.stats['variants_generated']}")
+        duration = (end_time - self.stats.start_time).total_seconds() if self.stats.start_time else 0
+        
+        print(f"Vidéos totales : {self.stats.total_videos}")
+        print(f"Vidéos traitées : {self.stats.processed}")
+        print(f"Vidéos échouées : {self.stats.failed}")
+        if self.stats.skipped:
+            print(f"Vidéos ignorées : {self.stats.skipped}")
+        print(f"Variantes générées : {self.stats.variants_generated}")
         print(f"Durée totale : {duration / 60:.1f} minutes")
         
-        if self.stats["errors"]:
-            print(f"\nErreurs rencontrées : {len(self.stats['errors'])}")
-            for i, error in enumerate(self.stats["errors"][:10], 1):  # Afficher les 10 premières
+        if self.stats.errors:
+            print(f"\nErreurs rencontrées : {len(self.stats.errors)}")
+            for i, error in enumerate(self.stats.errors[:10], 1):  # Afficher les 10 premières
                 print(f"  [{i}] {error[:100]}...")
-            if len(self.stats["errors"]) > 10:
-                print(f"  ... et {len(self.stats['errors']) - 10} autres erreurs")
+            if len(self.stats.errors) > 10:
+                print(f"  ... et {len(self.stats.errors) - 10} autres erreurs")
         
-        print("=" * 80)
+        print(_BANNER)
         print("[SUCCESS] Orchestrateur terminé. L'Empire est satisfait.")
-        print("=" * 80)
+        print(_BANNER)
 
 
 def interface_commandement() -> Tuple[str, int]:
@@ -689,9 +1596,9 @@ def interface_commandement() -> Tuple[str, int]:
     Returns:
         (mode, num_variantes)
     """
-    print("=" * 80)
+    print(_BANNER)
     print("INTERFACE DE COMMANDEMENT - EXO_PRIME_ORCHESTRATOR")
-    print("=" * 80)
+    print(_BANNER)
     
     # Mode global
     print("\n[QUESTION 1] Mode global ?")
@@ -728,10 +1635,10 @@ def interface_commandement() -> Tuple[str, int]:
             num_variantes = 3
             break
     
-    print("=" * 80)
+    print(_BANNER)
     print(f"[CONFIRMATION] Mode : {mode}")
     print(f"[CONFIRMATION] Variantes par source : {num_variantes}")
-    print("=" * 80)
+    print(_BANNER)
     
     return mode, num_variantes
 
@@ -749,15 +1656,37 @@ def main():
         action="store_true",
         help="Mode diagnostic : vérifie la structure sans exécuter les calculs lourds"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Surveillance continue de Raw_Videos/ : traite chaque nouvelle vidéo déposée (watchdog)"
+    )
+    parser.add_argument(
+        "--watch-poll",
+        action="store_true",
+        help="Avec --watch : force le polling (montages NFS/CIFS sans inotify)"
+    )
+    parser.add_argument(
+        "--s01-workers",
+        type=int,
+        default=None,
+        help=f"Extractions Segment 01 simultanées (défaut : {S01_MAX_WORKERS}, moitié des cœurs)"
+    )
+    parser.add_argument(
+        "--persistent-blender",
+        action="store_true",
+        help="Segment 03 : une seule session Blender (mode --serve de la Forge) pour toutes les vidéos"
+    )
     args = parser.parse_args()
     
-    print("\n" + "=" * 80)
+    print("\n" + _BANNER)
     print("EXO_PRIME_ORCHESTRATOR - SYSTÈME NERVEUX CENTRAL")
     print("La Voie Royale est mon guide, les 300k sont mon objectif.")
-    print("=" * 80 + "\n")
+    print(_BANNER + "\n")
     
     # Initialisation de l'Orchestrateur
     orchestrator = EXOPrimeOrchestrator()
+    orchestrator.persistent_blender = bool(args.persistent_blender)
     
     # MODE DRY-RUN : Diagnostic uniquement
     if args.dry_run:
@@ -777,7 +1706,9 @@ def main():
     
     # Exécution du pipeline
     try:
-        orchestrator.run(mode=mode, num_variantes=num_variantes)
+        orchestrator.run(mode=mode, num_variantes=num_variantes,
+                         watch=args.watch, force_polling=args.watch_poll,
+                         s01_workers=args.s01_workers)
     except KeyboardInterrupt:
         print("\n[INFO] Interruption utilisateur détectée. Arrêt de l'Orchestrateur.")
         orchestrator._print_final_report()
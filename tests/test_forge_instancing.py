@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests LEGION DYNAMIQUE - Segment 03 : instanciation des avatars multi-acteurs
+
+Vérifie que la Forge charge la mission avant import_assets() et qu'un même
+.glb n'est importé qu'une fois : les acteurs suivants sont des copies liées
+(mesh et armature partagés).
+
+Requiert bpy (Blender en module : pip install bpy) ; ignoré sinon.
+Exécution : python -m unittest discover -s tests
+"""
+
+import importlib.util
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+FORGE_SCRIPT = Path(__file__).resolve().parent.parent / "03_LEGION_FORGE" / "EXO_03_BLENDER_WORKER.py"
+
+
+def _load_forge_module():
+    """Charge EXO_03_BLENDER_WORKER.py (nom de dossier non importable)"""
+    spec = importlib.util.spec_from_file_location("exo_03_blender_worker", FORGE_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _export_glb(path: Path, with_armature: bool):
+    """Exporte une scène minimale (cube, + armature parent si demandé) en .glb"""
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    mesh = bpy.data.meshes.new("Body")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    body = bpy.data.objects.new("Body", mesh)
+    bpy.context.scene.collection.objects.link(body)
+    if with_armature:
+        armature = bpy.data.objects.new("Rig", bpy.data.armatures.new("Rig"))
+        bpy.context.scene.collection.objects.link(armature)
+        bpy.context.view_layer.objects.active = armature
+        bpy.ops.object.mode_set(mode="EDIT")
+        bone = armature.data.edit_bones.new("Root")
+        bone.head, bone.tail = (0, 0, 0), (0, 0, 1)
+        bpy.ops.object.mode_set(mode="OBJECT")
+        body.parent = armature
+        # Mesh skinné sur l'os : sinon l'export glTF omet l'armature
+        body.vertex_groups.new(name="Root").add([0, 1, 2], 1.0, "REPLACE")
+        modifier = body.modifiers.new("Armature", "ARMATURE")
+        modifier.object = armature
+    bpy.ops.export_scene.gltf(filepath=str(path), export_format="GLB")
+
+
+@unittest.skipIf(bpy is None, "bpy absent (pip install bpy)")
+class TestAvatarInstancing(unittest.TestCase):
+    """Import unique du .glb partagé, copies liées pour les acteurs suivants"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.forge_module = _load_forge_module()
+
+    def setUp(self):
+        self.drive_root = Path(tempfile.mkdtemp(prefix="exo_forge_test_"))
+        self.addCleanup(shutil.rmtree, self.drive_root, ignore_errors=True)
+        assets_dir = self.drive_root / "02_ASSETS"
+        (assets_dir / "Avatars").mkdir(parents=True)
+        _export_glb(assets_dir / "map_brookhaven.glb", with_armature=False)
+        _export_glb(assets_dir / "Avatars" / "default.glb", with_armature=True)
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+
+        data_dir = self.drive_root / "01_BUFFER"
+        data_dir.mkdir(parents=True)
+        mission = {
+            "metadata": {"fps": 30},
+            "actors": {"0": {"pose_frames": []}, "1": {"pose_frames": []}, "2": {"pose_frames": []}},
+            "camera_motion": [],
+        }
+        (data_dir / "EXO_MISSION_READY.json").write_text(json.dumps(mission), encoding="utf-8")
+
+        self.forge = self.forge_module.EXOForge(drive_root=str(self.drive_root))
+
+    def _setup_like_run(self):
+        """Même ordre que EXOForge.run() (setup_scene omis : réglages de rendu seulement)"""
+        self.forge.load_mission_data()
+        self.forge.import_assets()
+
+    def test_one_avatar_per_actor(self):
+        self._setup_like_run()
+        self.assertEqual(sorted(self.forge.armatures_by_actor), ["0", "1", "2"])
+        armatures = list(self.forge.armatures_by_actor.values())
+        self.assertEqual(len({arm.name for arm in armatures}), 3)
+        self.assertEqual(armatures[0].name, "EXO_Avatar_0_Armature")
+
+    def test_duplicates_share_data_blocks(self):
+        self._setup_like_run()
+
+        # default.glb importé une seule fois malgré trois acteurs : un seul mesh
+        # et une seule armature pour tous les avatars
+        avatar_meshes = {o.data.name for o in bpy.data.objects if o.type == "MESH" and o.name.startswith("EXO_Avatar_")}
+        self.assertEqual(len(avatar_meshes), 1)
+        self.assertEqual(len(bpy.data.armatures), 1)
+
+        template = self.forge.armatures_by_actor["0"]
+        for actor_id in ("1", "2"):
+            duplicate = self.forge.armatures_by_actor[actor_id]
+            self.assertNotEqual(duplicate, template)
+            self.assertEqual(duplicate.data, template.data)
+
+            template_body = bpy.data.objects["EXO_Avatar_0_Body"]
+            duplicate_body = bpy.data.objects[f"EXO_Avatar_{actor_id}_Body"]
+            self.assertEqual(duplicate_body.data, template_body.data)
+            # Parent et modificateur Armature re-câblés vers la copie
+            self.assertEqual(duplicate_body.parent, duplicate)
+            armature_modifiers = [m for m in duplicate_body.modifiers if m.type == "ARMATURE"]
+            self.assertTrue(all(m.object == duplicate for m in armature_modifiers))
+
+    def test_run_loads_mission_before_assets(self):
+        calls = []
+        forge = self.forge
+
+        class _StopAfterSetup(Exception):
+            pass
+
+        def record(name, stop=False):
+            def step(*args, **kwargs):
+                calls.append(name)
+                if stop:
+                    raise _StopAfterSetup()
+            return step
+
+        forge.load_mission_data = record("load_mission_data")
+        forge.setup_scene = record("setup_scene")
+        forge.import_assets = record("import_assets", stop=True)
+        with self.assertRaises(_StopAfterSetup):
+            forge.run(num_variantes=1)
+        self.assertEqual(calls, ["load_mission_data", "setup_scene", "import_assets"])
+
+
+if __name__ == "__main__":
+    unittest.main()
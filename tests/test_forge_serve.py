@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests LEGION DYNAMIQUE - Segment 03 : mode persistant (--serve)
+
+Vérifie qu'une mission SILENCIEUSE servie après une mission doublée dans la
+même session Blender n'hérite pas de la piste EXO_Audio précédente.
+
+Requiert bpy (Blender en module : pip install bpy) ; ignoré sinon.
+Exécution : python -m unittest discover -s tests
+"""
+
+import io
+import json
+import shutil
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+from test_forge_instancing import _load_forge_module
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+
+def _scene_strips():
+    """Pistes de l'éditeur de séquences (API strips Blender 4.4+, sequences avant)"""
+    editor = bpy.context.scene.sequence_editor
+    if editor is None:
+        return None
+    return editor.strips if hasattr(editor, "strips") else editor.sequences
+
+
+def _write_silent_wav(path: Path):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(48000)
+        wav.writeframes(b"\x00\x00" * 4800)
+
+
+@unittest.skipIf(bpy is None, "bpy absent (pip install bpy)")
+class TestServeSession(unittest.TestCase):
+    """Deux missions d'affilée dans la même session : pas de piste audio résiduelle"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.forge_module = _load_forge_module()
+
+    def setUp(self):
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        self.tmp = Path(tempfile.mkdtemp(prefix="exo_serve_test_"))
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.voiced_root = self.tmp / "voiced"
+        self.silent_root = self.tmp / "silent"
+        for root in (self.voiced_root, self.silent_root):
+            root.mkdir()
+        self.audio_path = self.tmp / "voice.wav"
+        _write_silent_wav(self.audio_path)
+
+    def test_silent_mission_after_voiced_has_no_audio_strip(self):
+        strips_seen = {}
+        audio_path = self.audio_path
+        voiced_root = str(self.voiced_root)
+
+        def fake_run(forge, num_variantes=1, variant_ids=None):
+            # Rendu simulé : la mission doublée pose sa piste comme render_video()
+            drive_root = str(forge.drive_root)
+            strips = _scene_strips()
+            strips_seen[drive_root] = [] if strips is None else [s.name for s in strips if s.type == "SOUND"]
+            if drive_root == voiced_root:
+                scene = bpy.context.scene
+                if scene.sequence_editor is None:
+                    scene.sequence_editor_create()
+                _scene_strips().new_sound(name="EXO_Audio", filepath=str(audio_path), channel=1, frame_start=1)
+            return True
+
+        requests = "".join(
+            json.dumps(request) + "\n"
+            for request in (
+                {"cmd": "render", "drive_root": voiced_root},
+                {"cmd": "render", "drive_root": str(self.silent_root)},
+                {"cmd": "quit"},
+            )
+        )
+        forge_cls = self.forge_module.EXOForge
+        with mock.patch.object(forge_cls, "dispatch_variants_across_gpus", return_value=None), \
+                mock.patch.object(forge_cls, "run", fake_run), \
+                mock.patch.object(self.forge_module.sys, "stdin", io.StringIO(requests)), \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.forge_module.serve()
+
+        replies = [
+            json.loads(line[len(self.forge_module.SERVE_REPLY_PREFIX):])
+            for line in stdout.getvalue().splitlines()
+            if line.startswith(self.forge_module.SERVE_REPLY_PREFIX)
+        ]
+        self.assertEqual(replies, [{"ok": True}, {"ok": True}])
+        self.assertEqual(strips_seen[str(self.silent_root)], [])
+
+
+if __name__ == "__main__":
+    unittest.main()